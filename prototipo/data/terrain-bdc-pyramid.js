@@ -0,0 +1 @@
+window.__SOLO_TERRAIN_BDC_PYRAMID__ = {"farmId":"fazenda-paladino","datasetVersion":"2026-04-05-paladino-bdc-7km-v2","bounds":{"north":-13.035192217750629,"south":-13.160955782249372,"east":-45.781667560590094,"west":-45.91079043940991},"width":1420,"height":1372,"downsampling":"mode","baseLevel":"terrain-bdc-raster.json","levels":[{"level":1,"factor":2,"width":710,"height":686,"tileEncoding":{"tileSize":256,"tilesX":3,"tilesY":3,"bitsPerPixel":2},"tiles":[["rle","AgcCAQLXAY0G7wHpAQKdBO8BgQEGgQXvAYEBBgUCPQKxBBcGzwGRAQL1BO8BjQbvAZUBAvEE7wGVAQLxBO8BiQECAwL1BO8BiQECAwL1BO8BiQECAwL1BO8BjQbvAY0G7wECYQKhBe8BAlUCrQXzAUkCuQXzAUECwQXzATUCzQXzASUDAtkF5wEGAxkDBuEF7wECDQvtBe8BCQv1Bb8BFguZBqcBBgMxB40GiwEGRQIDmQZ3AlECB6EGTwIfTQaxBk8CGQchBg0PuQZPAhkCNQcCFQKpBk8CTQID0QZPAhECJQsVAsEGUxECFQcGNQKtBlchC/UGUwIZAoUHVw0HjQdfnQdbDQIhBuEGWw0GiQdboQdfnQdfnQdfnQdfnQdfAh0C9QZjFQL9BmOZB2MFAo0HYx0C9QZnAQIBAgkC9QZnqQMCA+EDZxEGFQIBAtUGay0CAQbRBmuRB2tVAvEBAr0Ea5EHa5EHaykC4QZvCQK9AgIDtQRbAgEHAh0CqQICuQRTAg0HHQK5BQKpAUcCEQ8xAtUGPwIJAwIXjQc3AgknAkkCuQYrCTtJBskEAuUBIwVHBjkCBQK1BmcCB00CtQZbAgMFAgdJArUGUwIRAgeFB08ZAgeFB0sCHQIDhQczBgMBAw4JAwUCA/UGAgEGNwYBEgUCF4EHJwIBEgcCAQ4HBgeBAQL5BSMCAQYXCgcOAQfNBgItFwYfBQMGAwYBAgkHwQYCOQ8GHwoBBwINAwoL7QICsQMCUQIzBgMCAw0LAgMBC/0GAjcKBRMGCQfJAwKtAysCEQoHChEL+QYnAhECBwIDDgMGBQv5Bh8KBwYDBgMCAwoHAgMKB/kGHwoTAQMBAg8CAwIJAguNAwLhAw8CDwoDAQcCEwoBBgMGC/UGGwIJAgECBwILDgECDwILnQUC0QELAgcCDQIHAgMGARITBgcCiQUG4QELBhECBwIBAwEKAwIfAgv9BAbtAQMCEQYPBQYPAjPtBAb5AQMCCQILAgEDBlPlBAaBAhcCAwIDBlf1BgcGAQIHAleBBwcFAwJXjQdfnQcPAi8GB6kHCwYjBt0CAu0CAwI1A6UBAwoHBQcGzQcDAoELAskJB/EHAv0HAwIJAuUHAvkNAvkBAvEFB50SAtkPAAMAA8EFApkCCAsAA9kHDAsAA60FApkCGAsEqQUClQIQCQgDhQcCOQQBHIkHBjUIBQwxAhEC5QQClQIAyQIDhQMC9QIC5QECBwL9BQYRAr0BAwYLBvUCAqkCBFECyQEDAhsCAwLpAgLVAQJRAJ0CNwLhAgLVAQL1AjMCAwEC2QIGxQEG+QI3AgMO0QIGxQEK4QECjQE3AQMKA9UCAsEBCvUCMwYHCqUHOwYDAt0CAsEELwYPCtkCAqkCAo0CSwbZAgMCpQICkQIvAg8K4QIDqQICiQJHBuUCA6kCBoECBgECHwYPAgflAgOtAgKBAgcZDwILAQIDAuUCArkEByEP/QIDsQQDAgsVDoEDA6kCAv0BAwIXAg0CDwL1AgKtAgL1AQcCJwUCF+0CAqkCAoECAisOAwITHQMJA60CArkEAisGBQMFGxEDBQelAgKRAgYHApkCAh8KDQMFGw0XnQIClQIDCqUCFwYZBwU/lQICmQIGsQICCwYhBwUHDQsNC40CAt0EAgdBAw0LDQuJAgJJApEEB2EDDQOFAgMCmQUHDQO5AgKhBQvBAgKtBRulAgK5BR+RAgMCwQUTDQ/5AQK9BQMFM70HAwkb/QEC3QUDCQvtBwfxBwPxcgP5BwMCiQcCA+kHAwIL4QcCF9UHAwIfyQczwQc7tQdHrQdPoQdbmQdjjQcCa4EHe/kGAn/tBo8B5QYCkwHZBgMCmwHNBgMCpwHFBgKzAbkGwwGtBs8BpQbXAZ0G3wGRBusBhQb3Af0F/wHxBYsC8QWLAvUFhwL1BYcC+QWDAvkFgwL5BYMC/QX/Af0F/wH9BQL7AYEG+wGBBvsBgQb7AYUG9wGFBgLzAYkG8wGJBgLvAYkGAu8BjQbvAY0G7wGNBu8BjQbvAZEG6wGRBusBlQbnAZUG5wGVBucBmQbjAbUBA90E4wG1AQfdBN8BuQED3QTfAZ0G3wGhBtsBoQbbAaEG2wGlBtcBpQbXAakG0wGpBtMBqQYCzwGtBs8BrQYCywGtBs8BsQbLAbEGAscBsQbLAbUGxwG1BscBtQbHAbkGwwG5BsMBvQa/Ab0GvwG9BgK7AcEGuwHBBrsBwQa7AcUGtwHFBgKzAckGswHJBrMByQazAc0GrwHpAQID2QSvAc0GrwE="],["rle","NQID9QcHnQcXQQOdAwKBBA/dAwvxBwf1BwPBAwP5BwP1BwftDwPxBwvtBwcBA+UHCwUH4QcHCROlAQO9BhPtBxPxBw/BBwMlF7kHAyUbtQcHKQMFC7kFAu0BCzECB7UzAokEA9kJA6UGA5EYA/UPA90HC/UHB7UEAsEDA6kOAvkHAo0DAuUHAt0PArkoArUJAu0PAvUHAvUHAukHAgED5QcG7QcC8QcC7QcG2QMDnQEP3QIG6QIHBQMhBxkDFQeZARPVAgLxAgcFAg0HEQMZA7EBF5UCBhkCDQL5AgcJAwUDBgMNAyUDpQEXvQULAQcNAwEDBQMdAw0DAQOlARu1BQcBDwUDAQMBAwUDOQMtBmEHAQ8BA7UFCwEHBQMFDwYHLQM1BmEbAQPRAQbZAxMNAwEf2QEXyQUHFRMBC9UBF6UFAx0LFRMFA9kBAwkHnQULERcFAwkPAgED6QEHjQEa8QMLEQcFAwIFBwUPBQOlAwLlAw8JCwUDCQcNBwYHjQcPBRMNCw0TjQcXAQ8JAg8JBwYDiQcLBgcBDwkPEQuVBwMBAgEHAQsVAxULlQcDCQtBA5kHAwIBDwkLxQcDAQMBCwkHAQPFBwMBAwUHFQPJBwMJBxUD2QcHFQP5BwPlBwcFD40CAskFI9kHDxED1QcT9QcH0QkD+QcHApkDAwLNBAeZAwfVBALRXQP5BwID8QcDCQONCAf5BwP9BwP9Bwf9FwP5BwOJAgPVBAeZAwbRBAv9BwP5BwetGAdhC4kHB2UDiQcLZQeBBw9lA4kHB/UHC/0HA30H8QcL7QcXAQfdBgNtAwEDBQIHBQPdBgdtAwEHAgcFA9UHAwIZA9UHAwL1BwvhAQLdBAehAQfFBguhAQsBAgO1BgehAR/VAQKhAwPhAg+FBQLpAgONBQMFB8UCAwkD5QECnQMCCwLFAgcFA+kBB5UDD80CA40FF30HARO9BgIbAm0nuQYCJ20jDQOhBgIvbSMRA5EGAjsCbR+hBgJHcRuVBgMCT3kTjQYCWwKNBwMCZ4UHAnP5BgZ/6QYDAosB3QYHApMB1QanAQLJBrMBvQbDAa0GAssBpQbbAZUGAuMBjQbzAf0FAvsB8QWLAukFAo8C3QUDApsC2QWjAtkFpwLVBacC1QWjAgLVBacC1QWnAgLRBasC0QWvAs0FrwLNBa8CzQWzAskFswLJBbMCyQW3AsUFtwICwQW7AsEFuwLBBbsCwQW/Ar0FvwK9Bb8CvQXDArkFwwK5BccCtQXHArUFywKxBcsCsQXLArEFywKxBcsCsQXLAgKtBc8CrQXPAq0F0wKpBdMCqQXXAqUF1wKlBdcCpQXXAgKhBdsC1QQCRdsCoQXfAp0F3wKdBd8CApkF4wKZBeMCmQXnApUF5wKVBesCkQXrApEF6wKRBe8CjQXvAo0F7wKNBfMCiQXvAgKJBfMCiQX3AoUF9wKFBfcChQX7AsEBB7UD+wLBAQe1A/sCxQEDtQP/AokBAzULqQP/AoUBBwECBwEHCQcFCwUPkQODA4EBBwEDCUeRA4MDZQIVAwEDEUMRA/kCgwOJAQcFR5UDhwNlFwVXBQ8BA/UChwNdUwYnBRP1AocDWYsBCQsVA9kChwNVQwUPHRMJC/UChwNRQwkPIRMFC/UCiwNJZx0j9QKPA0VvCQMFEwIH6QIDAZ8DQUsGJxUHAgcRB80CCwmPA0FTBQMFBy0LDQfJAgIDAg2PAx0LEVdJAwIDAg0DAQ+pAgINAg2TAxEfAWNFCwYFF9ECkwMNcwUTAQM9AwABG50CAjWTAw2jATELAQcBAgOVAgMCPZMDCbMBNQcCB4kCAwIDRcsDBX81AwEHhQIDAlHHAw17OQf9AQddxwMREwFbPQP1AQcCZcsDFQcJV7ECB3HPAyVboQICB3nPAylXmQIHhQHTAy1PjQICB40B0wMxTwED+QELlQE="],["rle","lQwDEQf9BQeRBge1FALNBgeRBgPNEgMFB4kGC40GB8EFApEGAsEdA4UlAtEUA5EGB4UEA/0BB4kEA/0BAzED1QMH+QEDjQQH+QEDiQQDpQwDzQEC9QIDvQEHzQQDrQEP0QID/QEDqQEL1QIH+QEDqQELiQYHjQYD/S0H4QQDqSQLvQIHvQMHAQOBBgMBC7UBB9EEA7UBD4kGA5EGAwkD1QIHEQeFAwMJC8ECAwELFQP9AQd9Aw0DwQIDBQsVA/0BA4EBF90BA2kLDQsJB7kBB7EBE8kCEwkPBQO1AQMBB7EBE8UCFwkDAQMJD7EBA7UBCwEDyQIHFQMBAwkPpQEDxQEPyQIHFQcNB/0CB80CBy0DkQkDlQYDkQYDkQYDjQYDkQYDAQMNAw0H3QUHEQ+FBhP9BQcdA40MD4UGD4UGD/0kAwEHjQYCBzETxQULKQ/NBQ8RAxkDCQOxBQcBAwELBQ/hBQcRBwECKQO5BQcRA/UFCwkDAQP1BQIDAQeFBgMCB4kGDwULJQfBBQIfJQfRBQYDLQO9BQMdAwUDHQO9BQMdDyEDuQUDIQcRB9UFAy0HEQP1BQMVA9UFAzEDuQULDQcpC70FBwkHMQe9BQP5EQORBg9BA8EFB0EHkQYDiQQDjQYHQQcJCz0LCQM9B4EEEz0DBQ85DwkDPQeBBBdBCwEDPQcJA80EF0UHBQM5A0kDBQOJBBNFCwUDKQNRB5kEAwEH4QEL/QQL+QUDCQdRB40GA60FD1EDsQULjQYHjQYDiZ8BA5EGC4klA80SC4EGH/0FF/0FG/0FC9EpAs0kApEMA40GAoEGCvEFAgELBvkFCwL9BROhAgPRAwMCBQID9QUHEQKJEgID+QUDAQKFBgIDxSQHkQwDAoUGBpUMAoEGBoUGApUMAoUGBoEGBoUGBv0FBoUGAwaFBgIDqRgCgQYKhQYClQwClQwCgQYGhQYGhQYG+QUDAQb9BQuBBgaVDAKFBgKFBgMCjWk="],["rle","0QarAdEGAqcB1QanAdUGpwHVBgKjAdkGowHZBgKfAdkGowHZBqMB3QafAd0GnwHhBpsB4QabAeEGmwHlBpcB5QaXAekGkwHpBpMB6QYCjwHtBo8B7QaPAe0GAosB8QaLAY0CAt0EAocB8QaLAfUGhwH1BgKDAfkGgwH5BoMB+QaDAf0Gf/0GAnv9Bn+BB3uBB3uhAgLZBHuhAgIH1QR3pQIC2QR3hQd3iQcfAk+JB3ONB2+NBwJrjQcCa5EHa5EHa5EHAmeVB2eVBwJjmQdjmQdjmQdjnQdfnQcCBwZLaQKxBluhB1uhB1ulB1elBwBTpQcCU6UHV6kHU6kHAk+tB0+tB0+tB0+xB0uxB0uxB0u1B0e1B0e5B0O5B0O5B0O9Bz+9Bz/BBzvBBzvBBzvFBwsCAQIfxQcCAwINAhfFBwsRAhPJBwcRAhPJBwIDAgUfyQcrAtEHHwbVBxcRAs0HCxECAwbFBw8VDr0HBwkCFQ6xBwIDMQ6pBwItAgkOnQcGOQIFDpEHAwJRDvkCB4UEBlkO+QIH+QMDAl0CAQr9AgfxAwIDZRb5AgPlAwcCcQIFCt0GBwKFAQrRBgcCiQEOzQYHAukHB+kHB7kBA60GB7kBC6EGC7kBE5kGB8UBE40GBtEBAg+FBgLdAQIP+QUG6QECC+0FAwKFAQJpD+UFBo0BAm0L2QUDAo0CAgfRBQIDlQILwQUHAqUCB7kFAwatAgID6QMCwQELuQIDpQULBr0CA50FAgMCCwECuQIDkQULAhcCyQcCDwoPBs0BAuUFBgMCGxIDyQEC4QUGAwYfDgMCpQcLDg8eAQqZBwILCg8KAwIBAgMGBQaNBwYBBgMWAQIPAgEKCQYDgQcCCQIFAxEaAwoNBgMJBuEGAgsGOQIBAgUeA+UGAwIBD00CBRIDAgPZBgsFCgNZBgMWzQECCQLpBAcChQECARLJAQbxBAcCkQECBQIBBhkCqQEG5QQCBxEChQECAQ4NBgUClQEGBQbZBAcGEQMCjQESDQ6RAQIBBgUG0QQCAwIdApUBAgUGCQ6hAQIFAsUEBwbFAQIFAgkSnQEGxQQCCwLNAQIVBqkBAgUCSQfZAwYDCiUCrQECAQIJArEBAgEGOQYL0QMGAQ4BAhUCAQLJAQYNApkBDjUKC8UDBhEKBQYFAsUBAgECBQqtAQo1Bg+5AwYdBg0GDQK9AQYJAgECnQECBQ41Ag+xAwYlBgkCEQLBAQIDCQKxAQIBBjEKC6UDBjESFQPBAQMGyQEGLQIDAguZAwMGNQoFDtUBB8EBAuEDAwJNEg0CPQINAnEHJQLxBA9NCgECBQJBAgMCCQptCyEGwQECnQMHAgEGA0EGAQYBBjkKBQYBEnEHFQIJArEBCp0DMwIpCgMdAyUOBQIJAgEGcQcCEQIJArEBBgEKhQNLAgMRAgEGJQMlEhkKcQMCJQKxAQIFAoEDAlsCAwYFAhUDOQ4JAhUCRQIlAykCsQECBQL1AncCGQNNAhkCUQItAwYZArUBDukChwEdBgUCFQIRBgUCGQZ5AwYdArEBDt0CBwIDBoMBDQIRAiUGAQJZAk0DAhkCuQEK0QILCpMBAQoDDQKJAQJVAh0CuQEKGQKpAgMGAwUGlwEJBwIFAuUBAgEC2QECxQILDQKnAQIDCgECdQZpAwECQQPNAwMCAxm/AQECYQcCAwppAgECuQEKAwK9AgYhuwECBQJdAg8GdQYNAp0BDwEDrQIKAyW/AQZhAgECC4EBAkECSQIVBwEGAQOlAgcGKccBBlEGCQYVAjkCJQIBAjkCAQJRAsUCEwItywECSQIHDQJVB+EBAikD+QELCQMCKc8BAgNBAgsCAQIHAkkHAQMpAikChQEHGQIL6QEHAhUDKd8BLQITAgcBAgMCTQMFByUCGQIJAoUBAx0CD90BCyECIQLfASUKCwIFDhUWJQMJA0UGkQEDAAMZD9EBDykCIecBIQcCAQYJAiEKBQoNCgETAiUCSQKFAQIPyQELWQLnAR0CCQIBAgECAyEGAwUCBQYBBgsOAwKJAg8GuQECB0ECGQLnAQodBgECBzEGCQoVBwotAtUBCwaxAQMCA00CGe8BBh0CAwIPCQINAgEKDQoNAgUGAQItAgECDQa1AQcCrQEDBnnvARECDQsGBw4NEgECEQIFAg0SKQIRBrkBAwKlAQuBAe8BAgkCCQYDBgsOBQMCAQsCCQoBCgMGCQIHBi0CCQIBBrUBAgOZAQMGcQIV3wECExkGAw4DEg8SARoDEg8xAgkCAQa1AQIDAgkCfQaZAd8BAhMNHgUTAgcKARoBBgEGCw41AwIDARKxAQaFAQMCA4kBAgkC4wECEwUGAwINBh8KCQYDCgUCAwYPAgUCOQcGAwa9AgapAeMBAg8CKQIfCgUGBxIXBgUCOQYDBgMJAqUCD7EB9wECAyUKIwoLChMSSQIDAhECnQIHAq0BAgkC4wECFw0CBxIHBksGAwIxAhkDAt0BAkUHBsUB5wECCwILCQIBIgECRwYDBiUCIQYFApUCBwLFAQIFAvcBBQIBBw0OCQYfBgcOBwpJAgUCAwKRAg/NAQIFAvcBAgkCCwUKDQobFgsORRIDAokCD+EBAt8BAhcOAQIDAgUCAQoDDhcWEwoHAgkCGR4DAgkCBQLhAQ/lAQbjAQITAhEKBwoPCgsGAwYfEgcJAhkiAxkCFQK5AQv1AQbfAQIHAg8NBgMGJwIjBQIDBh8GAxUaBQIDBhECBQIBAgUCqQEDBgMCgQLfAQ4TBg8GAR8CAQIXBgUfAhcBAgEDCRINAwoJBgMKsQEDAo0CAgEC1wEBEgcCAQoDAgkGGwY/AhcSAwYFAgEKEQoJBgMCFQKZAQMNCoEC1wEGAw4PAgEOFwYPAhcGNxoBCgMhJhUCuQMCAdcBAQcOCwkCGwoPAg8CBwYPAgMCFwIDBgsBEg0CEQYBBgEGDQJlAtUCAgECzwEFAh8CAwoLAgEKOwJDAgsCBQYlAgECHQLJA9cBAkMGGwIDBgcCCwo/AhMKBxEGAQLxAwIBAr8BBhsKDwYzBgECCw4XCjsOAwoFAiUC0QMCAdsBDhcGNwYDEiMGOw4BBgECCQoFBgkC2QP/AQYLBg8CDxorAgcCLxIFBhECCQIJAgkCwQMDAbsBAgMFAgMGMwIFAw4PAgEGAwI7AjMCEQoNBhkOwQMCBbMBBgMSNwYHDgMCBwYDCnMGBQIZCg0CBQMGAQLNA7MBJi8KJwYbAQJTGh0CDR7BAwIFxwEKCwYDAg8CCQYPAgMSbx4pAgkWAxIFArUDzwESFwkOCxpzEgECKQYJCgMKAwLNA7sBDgMOAwITEQIPDoMBBikCCQIJDgMKwQMCDbMBAQoDEhcCFQ8OdwYZAhECDQIJFgfZAwKrARYBAgEGEwYJBgsOexYJAhECFRIBEtkDAqsBGgEGFwIJBgsOiwEKHQMVEgUKAwEG0QMDAqsBBgECAwofDgsCAwY7AgECAwY7AgkCAwINAxESCQsO1QOvAQEGCwEfBgECBwYDBjcOAwJHAgcGDQMVBgEGBQIBAgMKeQPZAgMCuwECAwIbCgcKOxJbAhEDBg0GAQYNAgMGfQPhArsBAgsCEwYLBj8CBwZTAQsRAwIJAwIDAQIBAg0K7QPDAQIPCg8GSwJnDSMFAp0EIwKHAQIPAhMK8wEdApUEBgECmwECDwr3AQIdAo0EDrMBDvsBGQKNBAa7AQ77AQ0GwQMCUb8BDvsBDQIBAsEDAkm/AQ6DAh0CgQTHAQbnAQYXHQK5AwI9vwEBAwGPAh0CuQMCOQK/AQIB+wEFEx0C9QPHAwkPHQIdAtED4wMdBhUHAgPFA+sDHQIVDwK9AwLrAzkfsQPvAzk7lQPvAzUCO40DAgHvAwUDKQI3lQP3AwIDAikCM5UD/wMCCwILDQIzlQPnAQX/AQIDAgsCAwIPDTOVA+sBAf8BARMCEwIDDQIrlQPvAQL7AQITAhMCAwUGBQIjkQMC7wEC+wECMwY7jQMC5wMBAwIjAgsCP40DAucDAisKAwYDBiuRAwKPBAIDBgMFN5UDAosEBgMGQ5kD/wMFAwECAwJHmQP3AwEDBQMBAicGH5UDAvcDDQIJBgUTAgEfmQPjAQGXAgIhAjeZA+MBAQKLAgIHCQcNAhcGE50D2wEStwEGRwECCQsRBwYLAgulA9sBAgEKgwIFFwINAw4LBgOtA9sBCgEXAosCGR+dAw7fAQoBEwWzAQYBRxkCD60DCtsBBgECARMFtwEGRxkTrQMK3wEBAwYTBesBEQMdAg+xAwrjAQkPBasBBj8tF60DCt8BDQ8FPwK3ASkPAq0DBt8BAgUCEwFDArcBLQ+xAwMK1wEFAlcGtwExBgOxAwYBAtcBBZ8C7QMCAwEGuwIGpwECCwEP2QMCAwIF1wECWwqnAQob2QMGAQIB0wEBWwarAQIj2QMGDc8BAlsGpwEGJ9kDBg0C+wEBJwbTAd0DAhEC+wEB6wEFC+EDBgECBwIDAvcBAb8BAiP5AwYBAgcO5wECAwILAq8BAiP5AwIDAoMCBgECywECEwLxAwIDBvsDbQ=="],["rle","1wM1T+0BAgehAdcDOT8BA+UBAwIDrQHXAz036QECA7kB1wNBL90BBwIFArkB2wM9J+EBCgkCuQHbA0Ub3QECCQLJAdsDUQfZAQLlAdcDAgOpAgLtAd8DnQIC+QHfA5ECAoUC3wOJAgKNAtsDgQIDApUC1wP9AQKhAtMD9QECrQLPA/EBArUCxwPtAQe9Ar8D6QECA8kCvwPhAQLVArsDAtUBAuECvwPNAQLpAr8DAr0BAgECxQEDoQHDA40DD5kBwwOlAQPhAQ+ZAcMDAp0BAuUBE5UBxwORAQL1AQ+VAcsDjQMCA5kBywN1A5UCA5kBywOFAwMBB5kBzwOBAwOlAc8DrQTPA60E0wOpBNMDqQTXA/0CAgMCmQHXAxkC0QIHBgMCmQHbAwkC2QIbmQHbAwIDzQIzlQHjA7kCMwYDnQHPAwIBC5UCBisGxQHDAwINC90BAw0KEwoT5QG7AwIZC70BMwoDkQKzAyULiQELAQIzCrUCpwM1B3ELAi/hAqMDOQMCQRcGHwYTAvEClwNJAw1DBicFF/UBB3GPA1EDBgknHQIjDQ/tAQcFAgNp+wICA10DAhETKQInDQ/9AQdp7wICA20DDRMCKS8JDykDwQLnAgJ5Aw0CDwIlAwErCQv1AuMCgQECAwkTAiUDASsNBzEDvQLTAgIHiQEHARctAw0DCQsNB/UCxwICDQOJARdlB4kDvwICEQIDiQELcQf1AQeJAbcCtQEHcQfpAQMClQGrAgIJAq0BAgPdAgZpCiWjAskBAwJZB+0BBm0GAQYlmwICA8kBB2ED3QEHCmUeAQIJAgmPAgkGzQEDuQIDAgcWKQIlAgE2CYcC6QEHGQONAgMeBQIhEiECAQYDAg8e+wH5AQMZA4ECAwoNAgcCLRoJAgkCAQIzBvMBgQIHkQIHAgcKDQIHLRodChcGDwbfAQIDkQIDjQIHBg8CDQIHHQIJGg0CCQIBFh8C0wEGnQIDgQIHAgcCCwIHEQcCCQIJAgkWMRrjAQKpAgfxAQcCIwIHAg0CAwItGi0CBQLnAbUCA+kBIwIbAg0CBwIRAhUWLQYBAtcBAsECA90BCwYbAhsGCQsCAQIJAhUaOdMByQICA9EBCwZHAgkPLRYxAgXDAQLZAgPFAWcCCQIHBi0SGQYNCrsBAtkBAh0DAgMCUQIDuQECawIJAgcCNQ4VDgkCuwGNAgIHMQMdAq0BfwIFEzEKAwIVDgECswGBAgMRBgchAg8ZA6EBAosBAgUCBwIxDgMZAgECAQKrAc0BAjECCQYBAwYDAgECDRMCAxULlQECNwJbBQIPMQoDAh0GpwHVAQIJAwIdBwoJAwIHBQcCIwkDDokBAwKfAQIFDzESIQqTAc0BAgkXCQcCEwUDCgMCBwUHAisCDQOBAQIXApcBAQIPLQMOLQKHAd0BFwonBQsBAwYDAQYDAieJAQcGHwKTAQIBAgsCLQcKMQJ37QEGDwUCIwULBQMCBwIBAwECEwIlAmXLAQIFAgstDwIxAgcCVwYD5QECEQIBCwEGBRsBDwEPBQIXLQJd1wEKCzEHBjUKTwID7QEHGQIHERsBAwkDAQsFAg+VAdsBCg8tBwY5BkcCtQEXSQsVGwIDCSdBAkXrAQIFDwIRAhUCAwY1CjcCA7UBBicxByEbAgMFAhuNAfsBBhMGCQMCEQpBAi8CuQEHBgsJAgcGKQsdJwYXAlUCLYcCAhMCEQIVAkUCIwK9AQsGAQoJAgcKKQchR1UCBwIVAo8CAgEPAhECFQJJAhupAScGGQsKCwEGEQMlMwYFAlkLDZ8CAQ8CgQECD60BMwkGBQcKDwEHEQIlKwIRBlULAqsCBgsChQEHsQEvBh0KGwIVAwIdJwIVBlW/AgELAoEBBgcOnQEvBh0WDwYRCxkjAQcFAgsCVb8CAgsCGQJZDgMCAwqZATsdCgUCAwILAhELDQcCCwIBAwYJBgUHBQJNwwICAQs1CjUWCwKZAT8ZChECDwIHBQsBBiMGCQIZAk3HAgILNQ41CgMBBwqRATsGTQIHAQILAjMCBQIDFQJNAwa7AgYHAjUKMQYLAgEOjQFDAjUCFQIXAgEzBQIDAhUCQQIDCbsCEjUKKQIFAgsWiQE7AgsCURMGOwUHFQM1BhW7AhJ9AgcCAQIBCoEBAwYvBQ5VAwZHCQMVBykCAyGzAgIBEn0CAxqBAQo3Bl0GAQJDKQMdAwItswICCQIDAoEBIn0DAj8GWQIHAT8FAiEHDQMCOQKvAgYFAgMGeRoDBnkDAicGG1ETAUshBwEHAkW3AgoDBnUDAgMefQInEg8ZAwECIQcGBwUCOwUDIQcCUQK3AgYHAm0DBgMOAQ59Ix4LBQIBCgclAgMGBwECQyEHYbcCCgtlAhEKAQaFARsaAQ4DDhMlAhMFQwkGD2m3AgoHAlkGGQYZB3ULCgkCAwIFDicpAgECUwECD3W3AgIFAgdBAgMKQQ99AwIHAR8KJylPAgcFC4EBswICBQILNQsCQRuBAQIvAictAj8GDQeNAQKrAgoBAgcCMQcCQSMCgQFbMQMJBwEbBg0HApUBpwIGAQIFAgMxAkUvhQEPAD81AhUGBwIRAwIDBQKVAasCAhECJQJRM4EBTzkHDQYLCQMGAwYLlQECrwIxAlkzhQFHQQIDAgsCCwEGBQIXmQGvAiUCMQItM4UBQ0UfAgcNAhuVAQKvAgIJBgdtN4EBQ0ECAQIDBQcCGQIblQECtwIBAgMCdTeBAT8lAl0fUQIFCikCrwICA4EBN4EBOykCBwJRH00CAwYLKbMCVQ4hO4EBIzkLXRsZBikCFwIlswJREiE7hQEXOQMCaR8JEy0bJZ8CAg9VDiE/yQECA3UCHwEXAikbKYsCBgMCAQILWQ4dP7EBAgsChQEbAgECFykCFynfAQofBQMCAQILXQodP7EBAgeNAR8BAhspDzXfAQIjAgUDAQIHZQIhO9ECHwYbKQJBrwEGLwYFAgECCwEDBgeNAS8CrQEGoQEfAgEbceMBAhEDAQsCBwIHBoUBJ+kCAhsBAhcCcd8BAgMBAgUDASuFAR/xAh8CH3HnAQEKBwInhQETgQMfAht14wEFAwIHAhcCD4EBC6kBAtkBAhsBAgsCfecBAT9ZArkDBgcCCwoDhQHnAQIHAi8CmQICB/EBAhsClQHjAQIHBhMGDwKZAgIDAvUBE6EB7wEGHwYDApkEAg+pAesBAiMCAQIHhQILgQITqQGTAgIBBwJhBq0DC60BApMCBgcCXQatAwO5AacCXQrpBC8G7wECWQrpBOsBBjcCVQYBAmEG/QOrAgJVAgEC6QQCpwICVQrpBOcBEjNVDukErwJRCu0EAusBBgMGJwJVCukE6wEGNwZVBhUTAr0E5wEGOwJVCgEn3QID2QGrAgJVAgMGFwUH3QIDBtUBpwICWQobAQfdAgIH1QGrAgJVCifBBKsCAlkGI8kEpwIGVQYLAQsCA8kEswJVAg0LBs0ErwJlAgvVBK8CZQMFA9UEiwICI1kDAQcBBwLRBIsCAh9ZG9UEiwICGwJZF9kEqwIGUQILBQPdBOcBAj8CVQvpBOcBAjsGA1EH7QTnAQYzDk0CBwLtBAbfAQI/Ak0LBukEAuMBCjMGNQMCDRPpBOcBCjMKKQYVAg8ZAs0E4wEGFwIXDiECJRIVAs0EAt8BDgsSDxkGAz0G7QTjAQEiAQIPBQIPTQLpBALfAQIBEg0KBwYLxQXjAQIBBh0KC10G7QTjAQUCIQIHZQIBAukEAt8BAhUCBQZxBu0EAqMBBjcJAgEGA/kFxwEGFwkChQanAQYLBgMGG5EGpwEKBwoDCgcCxQECA80EowECARILAQbRAQMCyQSjAQIFCgsC4QEDzQSTAQ4FDgPpAQcCxQQDAoMBEgMCAQK9AQI5C8EEAwJ7BgsGAwKJAgMBAsEEAwILAnsGkQIDAQPBBAMCCwJrAQMCmQIDAQPFBAIPAlsCCQKpAgPJBAMCBwZbArECC8UEBw4jChcGB8ECB8EEAw4BHw4f/QECRQPJBAMCAQIBBhcKG8UCD8kEBgUCAQYnAgfNAgvRBAcBAgECAQIXAgPdAgcC0QQHDQYPAukCB9UEAgcKE/UCAwEC0QQb/QILAtEEE4EDDwLFBAMBD4kDAwUHAr0EF50DB7UEBwIJB/0CAhkLpQQLGQOJAwcFCwKhBAchA4EDAwETBQbJBAOBAwMFAxUCzQQC+QcChQMD8QQD3QIClQUD2SoD+QcDAt0HBw0H3QcTBQfZBw8NA90HCxECmQUHtQILsQUCA/UHB6kKBh0DxQcDAikLoQUCyQIP8QcP7QcP8QcL8QcL+QYCcQvtBgZ5CxEC2QcLCQIHAr0GBo0BCwkHPQL1BQaZAQvFBgKlAQe9BgatAQe1BgK5AQPZHwL5BwP5BwP1DwP5BwPpBQMCiRACA4UIF/kHAgv9BwMGA4EIDv0HAw79Bxv1Bxf5BwILgQgKA8EFArkCAwaFCAoDhQUC8QIPjQYC7QED3QQCpQkC+QcC7Tk="],["rle","xcwBA5VvAwaBBhMC+QUGEwb5BQIPBvkFBgsG/QUPCt0FAhUTCtkFAhkPCtkFBhUCCwIBAtkFAgMVAg8K1QUGEQYHBgMOA8kFBgMJDgMGAw4DyQUDAgMJCgEHDgvJBQ8FDgsCAwIPxQUPFifFBRMGAwYrwQUXAjMCwQVTwQVTAr0FUwK9BVe9BVcCuQVXArkFW7kFX7UFWwKdBQIRX5EFAh1jgQUGJWPxBAMBAgMtY+EEFzUXBj8C4QQLQVsG2QQCAQIDRTcCIwYDAQIDnQU3Ai+pBV8GrQVfAgECqQVTAgsFAqUFQwYHAguZBAKRAT8GAQIXrQVDBhMCA60FQwIXBgkGmQVjAgUKmQVnDp0FAmMSmQUCDwJPFpUFaxKVBW8OmQVrEpUFbw6VBVMBFxIBAokFAgMCCwIzAgUXDgECjQUKBwYrBgUbCuUCAqkCAgUHBisKAR8CmQUCBQcKKwYFFwaZBQYBAgcGKwYFAhMKxQICyQIGAQI7BgUCFwa9AgLRAgIBBgsGKwkCFwECnQUKBwYvCQITAqEFCgcKJwIJAhcCmQUSBwYTBgsCDRedBQIBGhMGCwINCwYDApkFAgEOBQIXAgsGDQcOpQUCAQYBBhMGBwIRAwYDCqEFAgUGBQIPBgcKCRMG4QEGqQMCEQoBFwECAwoJAhMG1QECAwKtAwIJAgELAgECDwECCwYJBwYDBs0BAwLJAwoHAgEGDwITCQcGAwbBAQbJAwIJBgsGAQILBg8CCRMGkQUCEQ8SAwYPAgkLAgMCA60BAuEDAgkGCwIDAQYDAgEHCgkCBwIDBqEBAu0DBgUGBw4BBgMGBwIDCQILDpEFBgUKAwIDBgUiCQIDFoUBApEECgsKBQYFDgkHEn0G9QMCHQYBAgcKCQIFBgECDQ4FAqkFAgcCAQIJAgkCFQoJAq0FAgMCIQIBBg0GCQIBAqUFDh0KEQYNAq0FCh0GFQoJAgECpQUGRQYJCuUEAwkCLQJJAg0GEQORBQpVAg0DAgOVBQpZCgMCB9UEAjkGTQoDBgUHkQUKRQYHAgOtBQYxAgkCAwIDuQUGMQIDAgMCA8UFAikGBwKJBQJpCwKVBQJhD50FAlkHAoEGB4kGAv0FBwL9BQYDAoUGAv0FCokGAvUyApEGBt2UAQIDmYABAoUGAoUGApUMAtlcAvUkApEGAsU3AqEMAo0GAo0GAqUMApESAgEGVQ+VBQMCeQIHgQUDAhUCcQrxBAKlAQrZBAK9AQrBBALNAReRBheVBgIHhQQCjQIDBgOZBgMGA9kDArkCBgPNBA=="],["rle","hQOHAQKTAQaHAQlL5QMGAQIBCwYbFgsOEwIBmwEGhwEJRw0DBQIDHROdAwoLCg8SARYJArMCAlcZAgcZG/UCAgMCHQseCQolAq8CAgE3AQ8CAx0DAhkb7QIOJQIDBgECTbMCAgkGJwEPAgNBJ9ECBgECBQYBAg0CAQIBBgMGTbcCAgkGOwECQSfJAgYBAhECAQYJAg0CUQK7AgINAicRBwI9J8ECCh0GEQZdAucBBkcCARYnGQM9L6kCAwYDBiEGGQZV6wEGCwI3AgU3HQJBAwUDCQ+hAgIDAgEOAQIdEgkKTe8BCkcCAS8lAgdBBwkHkQIHBQceAQYVGgUKAQJBxwIGLyULPQcNB5ECAgMuIQoBCgEOA0ECywICLyULPQelAg4DCgMaAQIVCgEaB0HPAgYjLQs9B7ECAgMKBxYBAhUKAQ4BDj0C0wICIy0PPQIZA/EBAhkWAxIlCgECAQYBBwI9/wIlFz0DHQPhAQIDBQIVNgECEQ4BAgEGAQIDBjUC/wIlF2ED6QECHQYDKgEGDTY18wECiwEpF10D6QECDQIJBgMSARoVBgMWAQo18wECawUXBQMZG80CAg0CAQIFOhkyLQLbAhEbFSMCzQICAQIVOhUiAQ4t3wIVGw0rOQMBAgUC7QECAQYBAhU+FSIBCi3nAgUfESsCAzEHCv0BAiE+EQ4DDgEOKacCBmcJLwI1AwIBA/0BBgECAQINPgECDRIBBgEOKZsDATMCNQMFAp0BBkkGAQ4NAgE+CQIFAgEKAQYBEiECjwIKuwExBwKdAQJZDgECGQ4BKgUCBRIFGiEC7wECDwoJArcBAi0DAg0GfQcBAk0CAQYFChkOASoREgkKAQIBAh33AQ0KCXcGOwItAxEHAnUCB1ECCQIFChkCAQYBDgMCBwoVEgUGDQIdAvMBAhEGwwECLQIND2kCCQNZAhEOFSIDGhEWAQYFAiUC+wEJBgFLAXMCMQYX3QECBRYJAgUiAwYDEg0CBQoFAjEC/wEFBgU/DU8CFwYxH9kBCgEWBQYFBgEGAQoDFgUCDQIBDjkC3wECASMCBTsRPwILARoDMQcABwAHSQKJAQoBAgEOGQIFAgUmAQYJAgEWMQLfAQUjBjcZOw4FDgEGAzULAAvdAQYNAwohBgUaAQIFAg0CAQYFBjGPAgYvJTMOBQIHFhECGRvdAQYNCikCBQMWAQYhAgkCMcMCKTcGAwoHFg0GFR/dAQoBAgEOMSYhBgUCMdcBAgkCUy1bFgkCGQMCF90BCgUCAQYpAgkWBQIlAj0C0wEFAwECUylrAgslChMRAskBBgUCAQYhAhEWMQYBAjHXAQUDCk8dAncKCQIVBgET4QEGBQIBBi0CBRYxBj27Ag6XATEXAtkBCgECBQIBAiUCBRYxAkGXAgLHAQIpEwIH3QEGDQoxBgUGNQI9kwIKHwKjASkLBgECA/0BBjUONQY5kwIKCwIPAZcBDhUCBQsG8QEGFQI1CjkGPfcBBgMKAwYDCrsBDQIJDwL1AQYVAiUCDQY5AkHPAQECIwYJDgUCvwEVEwKVAgI5CoEBwwENJwIJCgMGvwEGAwEGFwL5AQINAjUGAQoBAn3DAQkXAAMKCQIBCrcBBgMGBwIDAQ8C/QECDQIBBhkCDQIFBgECMQJFAsMBBSMBAgUWuwECGwEHiQICFQYhBg0CBQKBAQKvARIBIw4PAuMBBokCAkUCDQIFBoEBqwEGAwoFPwLXAQEDBpECAgECUQIBBoEBpwEGDwkKCwILAgHrAYkDBmkCFacBAgcGCQ8JCwIFAuMBvQICRQKNAZcBFgECDwIFAgMCCw7nAbkCAikCBQJFAlmHAQIDBgMKDwIJBgcCBwYDAucB9QICBQIxAgECXX8KIwECDQ4LAe8BgQMCoQF3BgMCFwYVAgEOBwIHAucB9QICDQIVCgcCbWcCAwYbBQYdCgcCBwHnAYEDAgECBQYHCn1TCgMCKwEGHQqDAo0DCwahAQIrAgMFAwIDBgMRAg8GCQYFEv8BjQMDAgNhAoEBAwIhDwEDBQIDIv8BvQICNQINA+kBAgMpBwETCR77AQL1BAYtAgMJFwUa+wECxQUXCRYBBwbjAQLJBQcFCwEDAQIDCQIDAgEC3wEC8QMC4QEDCQcBBwYLBQKXAQI/AvEDB/EBAwIBBg8CnwECPwL9AgK5AQYDpQEDBQL3AQKVAg5VBrUBD6EBAwkCDwbbAQKVAhpJA7kBAwUDoQEDDQIPAtsBApkCFokCAwEHnQEHEQIB5wHxAQYNAgEWoQIDnQEHFQIB4wH1AQINAgES6QEC3QEKDQMB4wH5AQIFCq0BAgMBAq0CAhXfAfkBAr0BAg8CpQICBQ4B2wHpAQLRARuxAgMFAtsB4QECaQJlAhelAgIVAgGXAQI7zQIGYQIDAQsBA6UCBhnTAdECBlkCEwKxAgoZywECzQICAwJZAhe1AgYZywHFAg5hAhsGqQIGHccBKQKZAgYdBj0CFwJNA4ECAr8BAq0CBgkCBQIlBkETUQKFAgIDArMBpQIPDjkCSQe5Ag4ZtwECoQInIQalAwIDAhWzAQalAgIbAiECqQMCAwIJAxKjAQKtAgIbyQMOBw0CAQIDBZ8BtQIT0QMGCwINAgECAwIBApsB0QUCSQsCGQIDBgWLAQID0QYCAwINAn8C/QYCcwLdBgIHAgUGBWsCA9UGAwUCCwUCEwIXAjsC3QYGCQIHAgECBU8O2QYCDwIJBwECAQIFGwETCvkGAg8CDQMJAgEfBQKRBwITAgkDCQMBFwIDnQcCDyEDBQILoQcLAgsdB7kHAgcFAh0LuQcGCQIBAxUH6QUC+QcC8QcO5QcWA90BA+0FJgNFBzEDAQc5AgkD5QUWAxIHPQspB0UCDQPZBRoLEgc9AgcRCwUDSQMC5QUmAxoHOQIHAg0CC00D5QVWNQMGAwJpAgMRAsEFJgkuOQppAhkCtQUSBQIDDgUyrQEDHQO9BR4BCgEeAQ7RAQPRBRYDEgEaAQLJAQK5BRIBBwIDAgcSASaVAQItA9EFBg8NNj0CQQI5A9kFCg0SBR51AkkDwQUGEQYVCgUWyQECxQUCGQIdGtEBAq0FAtkBAmUCrQUCqQEMDQoDAmED2QYQBw0HCl0C0QYYCwkHaQLNBgMYDwABA20DyQYHCAcACwADCLkHCwgHAAcEBwADaQLFBgcBDAMCAQcIAwADaQKVBBeVAgcFBwEGAQMEAwQBA4EFI40CAwIFCwECBwILAgED4QIG8QEHGSeJAgsCGwILCmUC8QEC+QEHGSeJAj8CaQLtAQKhAhcAD4kCCwEPBQMFB20DlQQfCIkCBwUPFQOJBQsAEwSNAgMJAo0BApkECwQXnQICjQEDnQQHBBeRAiN1B6EEDwQHlQILARcFA2UDqQQXmQILAScCXQOtBBOZAjsCWQOxBA+lAiMCAQILTQe1BAsCpQI7SQO9BAulAjsCRQOhBgNNO0UDnQYCPU8CQQOdBgM9UwI5AgOtAgOtBFcCNQOxAgKxBFcBAy0D6QYXBj8FCAMJAgECB5EBAwKVAQLtAwI5AwILCicCBQsBEAcCFwUDAnkCnQEH4QEC4QECTQMJCw4DBRcCCQ8cDwATdQKhAQbhAQLdAQYRAjEPAgEHBQ4JFw0DIAMAAgMQA5kCAgPlAQPdAQYVAikXBQIJAgUKExUgDxAHlQIK5QEC1QEOPRsKBQoBAg8FAxUMAwwBCwgHAhEGBQbhAwLRAQ5BKxIBAgMVAwkQCwgLCAcCBQpVApEBAokCA80BBh0CIQsJAhsCBwIDGQMJAB8IBgMACwUCWQOVAQKNAgONAQoBAiUHIQIhAxU/CQMBNwYFBwECDQLlAQKRAgNVCh0SMQIdAikDBScCAwEfCQMAOwkTCuEBApkCA1UGHQIhAhEWEQYpWwkAGwBDDvkDA4kBCg0GCRoJFyFDAgEHAQMCAQQTHBMYAQsCKQMCEQelAwcxCj0SFQYBBw4nAh0nAQcBBwkDDQgHXA8CIQIHEQIDpQMCAy0CAwJBEhEGDRIrGScRAwUHDXQLAiECAwINBgOpAwMpBjUKCQIZChk3FQcEHxELDXQLJQsNC6kDBxECRRIJDgMFYxULCBsJAwUDEXQHAiEHBQMOAwIBA6EDA10GARIHAgsGYwkTDAETAQYHAQMRdAMCAzEOAQILoQMDaQofBmMFGwwPAi1IAQIMAwwDBiECDQIHAQIHpQMHaQILCg8GXwULBAcMEwYpMAUCDQAPCAUGIQIRBwIHAp0DBgdpAg0GAXMBEwQDBAcECwYtKB0TAAcxAhETAqEDAgtxFgcOHwIjAgsBEwgPBA8CMRwpBwIFBy0CAwIJAhcCsQEG5QELcRIFBwZLCQMBEwQbBAs9BAJFAjECBwECFwIHAq0BB+kBB1UGBRYNVw0DAQsEIwALRQMCPRclEhcGAwKxAQPtAQclAh0KCRYVNwITFRALEA8CDQ8dBwIJAy0bDQIVBhcCBQIDBq0BA/EBAh0GDRYNEg0GFScCEw0DBgwLGAcZCxkLAQcZAiELDQYRBgMGAwYDAQIHBrEBAvEBAhUGAw0KFQYNEiEjAg8FAgcCAQgLHAsdAxUPJQIlBwkCBxEDDQ4BFq0BAvEBAgECBQIPBj0SKQsKBwILAgECCwUDBAckEQItByEGBQcdAwkCAwIdBh0GEQKNAQL9AQYJAhMCBQItCgUCDQIZDwIECwUCDwUKLA0HVQYFAjkOBRsGuQEHBvkBBwkCDwY1Dg0CLQcGDAYHEQMCAQIYBgQBAgtZAwEHAkEDAgECHwK5AQIDBmUCKQJhAw0CDwI9BgUDPRYLFQMJFAoBAgMNAjUDCgMFFwkGAzEGHxYBAwKdAQqtAQJJAg0CEwIFBiUGRQIVCy0AARIDBgMNAjEHBgsGEwkPLQYHCgutAQ=="],["rle","lQYC/RcC3WEK9QcCAwL1Bw+5AQqtBgf5BwMCwQECmQYK0QECmQYG9QcG9QcC+QcC+QcD+QcDAvkHAuEBAo0GBu0HBgO9BgKdAQYNA9UHBhkDwQYCeQMCLQPtAQLBBQY5Au0BAukEAkEDAkkC8QECnQUGWQLFBgI9ArkHAikC9QIC6QQGhQMC3QQCcQL1BgOlAwLNBAOlAwPNBAOpCwLlDAKRAwPtBQKFAgLpBQf1BweJAgOVCwLhBAOFAwbpBAPtAgKJDQOdAhKlAgOZAwK5AgKNCAKpBQL5BwP9DwL5BwOFAwLxBAP5BwL9DwLtAwKFBAP5BwP9BwP5BwPBBQK1AgNpCgEG9QYDYQaVBALxAgNhA8kLAsUDAoUEAnUCMQK9AgOBBALxAwP5BwNFArEHA/kHAvUCAsUCA7ECAqkCAiECAQrVAgKBBQoNArUCB9UCA5EFE9ECAo0DAoECD8kFA50CD9UCAtkCAgOxAguxBAK5AwshAskHC7UEAiECjQMH1QIC4QEG5QMCnQIC2QUC/QcD/QcD+QcC/QcDvQcCOQK9BwM5A+0BAskFAjUGvQcGtQgD/QcD/QcDjQIG5QUD+QcCA/kHAv0HAukBAiEGAQbVBQONAhbRBQMCjQICCwIBAs0FA5UBBm0PAgUCzQUCjQECdQsCBQYDAo0FAwIxAlkCoQECAQIHAQYHAo0FBzUCQQMCnQEGAQYJEwUKxQUGNQbJAQsNB/0FAtUBDwkHzQUChQIPCQeRBQI5AtUBAi0KAQvBBQYJAtEBAjkCBwLBBQKpAgIDAvkMBvEHApEKB7kPB1UCnQcDZQL5BA4D5QcGC4kCAtkFEIUCAt0FAAUE8QED7QUADQL1AgbpBBD5AgP5AQbdAhj5AgL9AQLZAhyBBQLRAhzZByDZBxzdBxzdBxCRAQP1BwLlEQbhBQr9AQcCvQUCrQICAwLZAQLVAwatAgqxAgIZDtECArUCBiECiQICDQYBBgcGyQICuQIDAiECA4ECAhEKAQ8CxQIDvQICAwYBAgkKBwKdAgIPApEFCgMCAQILBqUCAgeZBRcGBwLNBwIHBRcCyQcCBwkTAs0HBgcBAwYHBtUHDwUDCtUHDwUO1QcTBQIDAtUHFwECAwKlAQMCpQMACRDRAgITBQ8CpQEHlQMQCRTNAgIDBQcFCwKhARKtAxjlAQNhAgUHBQ+hAQYBBqUDJMkBAhEDZQcBAwUDAgPhBCTRAgMBB3ECRQKpAyjVAgIDdQIABsEBAwIBApUCKNkDBAe5AQIDBgECA40CKN0DBAutAQIHCQaNAijdAwQTAp0BBwKlAijNAQKJAggPAg0QCRRRB6kCLMkBAwIFA/0BEAYJGAkURQ4DAhUKgQIsyQELiQIEBw0YDRg9AgsKFQIDAv0BMOUDCwkcKQA9AA8CFQIHAvkBMLkCAwUKBQIDAH0DAgEkLQA9ABcNAgMCBwaBAiC5AgcBCgkDDGECCxUQNQQ1Ah8GAwINAo0CGMECCwoBAhRZD2UAAjELCB8BApkCFLUCAg8BAgcGHFEPmQEKDwAHBgMGAwadAgwB"],["rle","yQETlQYPnQMC9QIGA50GCp0GCrUCAgEDmQYC4QMXCQID7QUCI80CApUDLwLZAQLxAwcCAQInCQMKrQUGFQInHQ6JBQYlAgsOBwYtBgfpBAI1DwYLAhkGIRdRAuUDBk0bAjUCAwIdAgspAu0DAl0GAwYDAkkPAgcFDgMVAuUDAwJ5Bn0GB9EBApUCA6ECAgEC0QMHcQK5AQPFAwINAp0CAgEGBQK1AQL1AQIdA+UDAvEBAoEGAoEGAnUClQIC4QIHAqUDA1UC+QEGsQMDxQIDAlECA+UCB10CzQEGWQLdAgsFC2EKdQMCFxkCZQLlAgIDCQfFAQMOAzEC5QMHBQIDkQEbBgPFBAMJB3Eb7QQHCQNREg+JAgKJAgJpAgMFAgMVCwESzQMC6QECCwUTCukDBs0BAhUPCQP1BQsNAoEDCn0C3QECC5kDApUBAskBAgcCDQPxBQIHCQcC+QUDAgECiQYDAs0EAr0BAtUDArUCA8UEAskBA40CAtEBAk0GrQEHGQKFAgZ5BlUCEQIlBt0BA/0BDg0DAukDAv0BCw4H8QMC+QELAokEAvUBC40EB/EBA5kEA5UGApEGB5EGA/kBBsUBAwLBAgOFAgaxAQIDxQIH4QEGCQIFBq0BA9ECB90BBwUSLQLZAwLdAQcSAy0G3QMC3QECAwYtAgkCfQTVAgID2QEGCyUCkQEE2QID3QEGAwIhApEBCN0CAt0BBjEGN0kI4QIC1QECNQMGDRsAC0UIuQQCORMFCwUDBAtFBAMC4QICzQECPQsNBwkAEz0IC+ECAq0CCwQTPQgTOQKdAgPFAQJNAgEXAA9BDA85AwKdAgORAjdBEAdBA50CA5ECM0UMBwLpAgLFAQJBJwJBEAsCSQadAgLFAQIZAgMGESs5EBdFA6kCAuEBDwYJKzUUE0kDqQID4QECAQ8CCQMBFykABRgTAv0CA2EPaQIFCwYNAwEPCQIRAAkcG/0CA10HcQIJCwIVDwkCJRQj+QIH0QEHDQ8NAg85ECP9AgPRAQcCDQsKF00XAgeBAwLNAQsNM0kHBQIPhQMDnQECJQ8NDwETTRcJB4EDB8UBDw0LCQdVFwULhQMDyQELAQIFC2kCDwkDkQMCrQEHDQ8BE2kDBQOpAwKhAS8BD20HIQaJAwKZATMFA3UHCQMBAw0CiQMGmQEzhQEDDQOhAwKdAS+dAQIDnQMCnQEnoQEHoQMDnQEfZQYdAgMNB0UC2QIDhQEHDReNAQ8BC7kEAxULkQEPAQcBAqkDA4kBAxELlQEPvQMChQEDEQuZAQfRBAMNB/EEApUBA5EGA40BAgEDApkBEtEEE5kBAgvlBAcClQEO6QQHlQEC9QQDkQYDzQYC7RwCkQYGkQYC0QEHAIkGBI0GBOkeA5EGA4kFAwJ9A40FBnkDAokGB40GAwKFEAMCrQEDkQYC0QUENQPVBQDNAQIDCQalBAQtBpEBAgcGB90EAgNtAjEH2QQHAQKlAQMC1QQKpQEHEQftBQsJE+UFDwkb2QUXBROhAwK5AgcVB8kJApEGAmUDqQUCXQIDAokGD4UGBwEDAvkFBgcFA/0FAhelBQJVEwKBBgIDBQK5EgbpBQIdAwKFBhMhAtkFFwIVA90FAgMFCw0CC7kBA5kEAhEHAgUDBQe1AQOVBAMNEwEDDQfdBQcBAwEHFQeRBgPdBQItB8kFCwkDAgEHFQeRAQMFAw0TgQQDDQIHAQsRA8UBC5kECwEDDQO9AR/xBSO5AwBtA70BF8UDAGULwQEPyQMEYQehBQRhA6UFBI0GBI0GBI0GBI0GBI0GAJEGADED2QUAwRI="]]},{"level":2,"factor":4,"width":355,"height":343,"tileEncoding":{"tileSize":256,"tilesX":2,"tilesY":2,"bitsPerPixel":2},"tiles":[["rle","d6EDA90Dd/EEA40Cd/EEA40Cd9UGAyl3RQO5BnfJBgcxd8UGAwEHLXvNBgsle9EGCyF7DQOlBgMRDx13BQOxBgc9X50HQyEDkQcnAgUHHQeZBycpA6UHKxkHrQcrEQO5By+RBwM1L80HL80HL80HL80HL80HM8kHM8kHMwUCDQKpBzPJBzfFBzfFBysFA8UHIwUL5QUDDQMVA1kHRRcFFyUCtQULAQMlA1ELQTvZBRsBAxUDTQtJKwkD2QUHBRNpC0knCQIDyQUDCQsJBwEDcQNFGwIBBgEDAQPJBQcFAwEDAQMBBwIDvQETBgsCE8UFBwEHBQcFB8EBHwEHCQfBBQMCCwUHBQfFASMBCwIBA8EFAwEHAQfdARcFCwYFA8EFCwkD3QEPAgsGCwIBB8UFAwkD3QETAhMGD9UFA90BAwIDBQsCH8kFCwED2QECBQsCK8kFB+EBP8EGA3UzoQQDoQMj2QcGAwEDlRoCwRMDiQgDnQQAC+UHAAUHvQcCJQDlAwOhBQeFAgPxBAJlDwLdBxsCkQYCuQEnrQIDLQehAwK5ARsCA7kCB4kFGwIHAsECA/0EIwaVAwO1BA8CBwIDmQMLoQQHCQYDtQMDAQONBBcBAgetAwOhBBcCAwELCQu5AgNNB4EDBpEBDwINDwEPjQMPlQQHHQMBBwUHjQMDAQOZBAMRA4kCB6EBA70EBwED9QELOROdBQvtARc1DwUDjQUDARvRASM1D6EFAwEH0QEvPQf9Bju1B0etB0+hB1+RB2uJB3f5BoMB8QaLAeUGmwHZBqMBzQavAcEGvwG1BscBqQbXAZkG4wGRBusBhQb7AfkFgwLtBY8C4QWfAtUFpwLVBacC1QWrAtEFqwLVBacC1QWrAtEFqwLVBasC0QWrAtUFpwLVBasC0QWrAtUFpwLVBasC1QWnAqEDA60CpwLVBasC1QWnAtUFpwJhA+0EqwJhA+0EpwJBAwUn3QSrAkEDASPhBKsCLT8BC9UEpwIpRwEH1QSnAiUjAQsNE9UEqwIdPwULtQEHoQOnAh0rIQcFA6UBA6UDpwIJQyEDAQ/NBKcCAVcdB9EEvwIFPxkD1QS/AgkHASuZAQPdA78CESuNAQPpA8MCFSeBAQP1A78CGSdxA4EEvwIdG20DAQOFBL8CIQ+NBb8CvQW/Ar0FvwLBBbcCxQWzAnED0QSrAtUFpwLVBasCxQEDhQSrAsUBB4UEpwLFAQeFBKsCxQEDiQSnAtUFpwLVBasCvQEDkQSnArUBC+EBA6kCrwKhARuNBKMCAQd5I7EEkwIRA0UDCSPVBIsCGQMtI/0E/wElAwUfAQITAQt1A4UE8wE9CxEXBQOFBecBPQMFBxUXBQOFBeMBQQ8tA5UFzwFVA9EFwwFhA6kBAzUG5QO3AQJlA50BBwYtHtUDqwF5AwkDgQEDAQoVChECFwLRA6MBgQEDhQEDAgcJAxUOCQYXAtUDkwGRAhsFAxUKGQYP1QOLAZkBA20DAh8FBxUKFQIBD9UDf6UBA2EzAgEHFQoZAg/ZA2+BAQIDhQE7AgEHGQYJBgECE9kDZ4kBAgcJDwkDSUsFBxUKDQIX3QNXbQsNAwEDAQcBFwkDQVcBBxUKFRPdA09xAgcCEwEPAgMCD0VjAgsVAwIZD90DQ4UBBwUjAQdJbwIHFQMCGQIL4QM3WRMZAw0TAQ9FewIHGQIdAgfhAwcFG1kHCgEHAhEHDSMpAxGDAQIHAhUCIQfhAwcFE1EXDQMGCx0bAQIpnwECAwJBA+UDEwUCTRsNBg8JAw0XBQMpqwE9AgPlAwsFAgcCSR8JBgULBQcBEwIJAwECJasBGQYZBt0DCwkSRR8CKScFAzGjAQIDGQYZB/UDEkEfAgMCJSsBAwkDKZsBCj0DyQMDJRY9Ah8CLScRAymbAQUDPQK5AQOBAgMtFj0TCgclMw0LJZsBAgMCNQID8QMaPQ8SAwYLES8NAzGbAQIH7QMDPQoNBzkDAgEPAhcRLwIHOZsBAQIDHQe5AwNZEz0vFSMFA0mTAQYBAxkDtQMDXRtBJykCAwUHAgNJlwG9BCc9IyEXAQILSZsBCQOtBCM9Iy0DDQ9JmwECtQQjQRsRBykPJQ8RlwEpBokEJ0EHWQ8BCxEPEZcBLQaJBCNZA0UPAgsVBxlvAg8BAwIDMQLpAgOZAR+pAQ8CDzVzCQsCAwKVAwcCnQETtQEfOW8BAhuJAwcCBwKdAQfBAR85kwH9AhcK6QICCwJFhwECB/UCBwYDEgEC5QEDeQtRkwHpAhoHBgUCBQLZAgdViwECAy0GpQILIQIBCgPBA5cBKQadAgM5DmUC2QKXASkCkQIDUQJdAgEC2QKXASkGgQIDAlUKBQZRAtkClwEpBvkBAwJxAlECNQehAnMCGwIpAu0BAwp1AlUGGQIbrQEDaZcBKQbxAQIBAmkCAQZRBhkCG60BA22TAQIpAvEBBm0DZQIVAhuhApcBKQLxAQppB5EBB6UCmwHpAQshCh0CAQYBAjkDjQELqQKXAeEBIw0CJQoJBjUDEQJVAgECDQ+pApcB1QE3AjECOQIVAmkGDQexAnMCHwLFAUstAhECPQJpBg0HtQKXAb0BBwJLAQIDeQJtAg0HtQJzAhsCFQKZAQMJWwI9AjUCfQcCtQJvAgsGBwKpAQcNXwIxAgc9AlUHIQK1AnMKBQIHAgOVAQcCEWcCJQIBAikD2QNzAQINB70BaxkPAgMlB3EDCQIHEQK1Am8JApkBByVzEQIDAgECDQ4FBguBAQfNAmMCC50BAy0CcxkCAxUCBQYBBwKFAQcCyQJTDgMCA5UBAz13EQMCAwYFCgECEQYhAlkDKQOlAk8BBgeVAQNBew0aCxIDAgEHHQpZAykDoQJHBgOZAQNNfwEGAQYPIgcCHQMKjQEDnQIDAgMCO5UBB1V/EQITBgMGCwYhAwKVAQOhAjuZAQNhgwEBAgMSIwIDJQKZAQOhAgMGDwYPlQEHaX8BBwEGBQIPAgMCBwYhCpEBB6ECAwIBAh+RAQNxAn8CBQIDBgMGCwYLBgMVEpEBAwKlAgMFAguVAQd5AoMBAQcCEwILAgEDAhcFDgUCBQp5A6kCE6EBAoEBawoHAgMCAwI/BgMCFQ4DeQulAguxAnMCBwECKwIrBhEGgQEDAQOdAg+1Aq8BCgcCHwYBAgECiQEDAQeRAgMNA7kCfwIbDjMSAQINAm0L7QRjBhsCAwYHCjsVAg0G5QVjAhsBAg8GNw4ZFuEFZwYLBQIHCj8CGQIBBgMG6QVXEgsCBQcGPwIBAgECFRLtBVcSCwECBwZHAhkKAQIDBkkDmQV3AgcGGwYrAgkCBQYFCjkLAQOhBW8CLwIzBQ8BAgUGPQcFA60FCwJXBntRA9kCA90CBlsGf5UGXwZ/WQetBesBDQJFC6UF4wEBCwkCSQelBfMBHQM1B6EF9wEZGyEHAQeVBfcBGR8dA6UFiwIJFyEDoQWTAgUbxQWXAgIbxQWTAgIfDQOxBYsCAiMNA7UF/wEBAwEnhQMDvQKDAg0fyQVzAosBAQcFG6UDB50CawaXAQkPwQML/QEGbwYHAYcBCQvZAwvtAQJzAYcBFQvpAwfhAQJvBYsBFQeFBAfFAQZvAYsBsQQDvQECAwKbAQJXAgvtBQIFlwECUwIT6QUCCf8B8QUG+wH5BYMCtQQ="],["rle","/QIDiQMHqQcDnQYD7RsDgQIDfQOFAwOJBQOBAwOpAQN5A1UD1Q0DoQsHhQMDWQeBAwOxAQPNAQMFA50BC9EBB6UBBwUHAQNZA1kHpQEDCQcBB1EDYQOlAQMVA90KAwUDAQf5AgeJAwf9AguZCQOFAwIDFQvdAgsFA/ECA4UDA4kDBx0D5QILEQPtAgcNA+0CBwUD8QID+QIDAQcVA9EIBx0DhQMDgQIDIQMBAx0HAQMdA4ECByELGQOxAgchA0kDtQIDAQf9AguBAwetKge9DweBAwvNHQMC+QIHhRUD+QIChRIChRgDqXIHAv0CCwL9AgcC7QICCQcG6QICBQILBuUCAgMBBgMGB+ECBwEGE+ECJ+ECK90CK90CK90CL9kCL9kCL8ECAxEvAq0CCxkvAtUCM9UCL9kCHwYL1QIfAg/VAjMGzQIzCskCNwbJAjcGzQInAQsKxQICHwIBDwLJAgIHAhcCDwLJAgYfBQsCzQICBwITBQsCyQISEwIBBwID0QICAwILAgMCBQMG1QIGAQcCAwYBCwJtAt0BAgMCFwEDCskCAgECBwIHAgcFBwLJAgIFBw4DBgECAwbNAgYDBgEOBQMK0QIDBgkCCQYBAtUCAg0GBQIFAtUCAiECBQLRAgItAgUDyQIGJQIPxQICIQvZAgIVB/kCB/0LAs2aAQeZAwOVAweRAweZAwelAg=="],["rle","uQECAY8BAkMBJx0HvQUDAgkCAwoDAQoNxwENAwkPtQUGEQMCKZsBBR8CHRehBQIZAjGbAQoTCQMdF5UFAgMCEQYFAil3AiMBGw0CIQMBB4UFAxYRCgEGIaMBAhcRBxkHkQUCAxINFgMdvwEVB7kFCgMOCRYdvwERCy0D8QQCDQIDFgkaFcMBEQ8tAgP9BB4JGhWvAQkLCRMxB+UEBg0eBRIBAhWzAQETARsZAwL9BAYJHgkaEYcBAl8ZAwkCvQQCKQoJIgUGBQoNfwEGAV8lBrUEAykCBQYNHgUKAQIFAg17BQZfIQvpBA4NIgUKHYMBAgEfBTMCGQ8C6QQCBQYNAgESCQ4ZhwECFxEbAgUDChUT6QQCBQYZDhECHW8BKxUvBgUCCQ/tBBIRAgEKFQIdawEvET8RAgsC7QQCBQIZChUCHfMBFQv9AwNtAgUGGQYZAh2HAQJnEQMChQUCGQYZAh17BgEGAV8NB60DA/kBAkFfBRMCAQZjAhP9BAIFAhECBQY9YwETAn+FBQYlBkFTAgMCBYsBkQQD9QFPAgMCAQcGBwJzkQQD+QFbAgEChwHRBQIDOTcCDwINBn/JBQcCRUMCBQIBBn/BBgMRDwEOf+EGCwEKf50BA8kFEwIDAW/lAgKNAwMhAll7iQUKhQEDVQMBAneNBQqJAQNJBwUCc/kEAgEK7QECCW/dBQuZAQIBb9kFD5EBAglrpQUCLQ+VAQYJZ6EFAg0CHQ+pAWORBQMGQQedAQINW5EFEw0C1QECCVvhAgMKoQIL5QEGAwkDAU+NBAf5AgMNAwIFQ5EEB6EDO5kEA4UDAgEHATulBwsFAwETAQPFBwsND80HCw0D+QcD8QYC7QcOA+EHBgcGAyEDBQcBAyEDsQICtQQmAxkCAwkD2QECtQUWARaRAgOFAQqlBCqdAwIDBpUECg8emQMLAgOVBAIFAgkGAQ6hAwcBAwKxBAplA70CBwEH2QQAAwUHAi0DxQICA9UECAvhBwMAF8EGA5EBAwEDBg/BBg+FAQMBFwIxA/0BA/EDAw0TgQEfsQUCA4kBDwCNAQPFBQKJAQMAC4kBAwEHOQO9AgK1AgSNAQuJAR8tA8EDAqkBCJUBB40BH50FDJkBA5EBH5kFBJECAxkDASMdA60HKwIZA7EHLxUDtQIDAvUEAwYTAQsEG4kBApkBApUBAgkCAwKlAQNxA2kGBQIVBwECAQoLCQwLBAOlAgcNA40BAgcCnQICaQYdEwEKAxEEBwEHAAOxAhOVAQPxAgIVAw0CEQMBGwkjAgcFAqECAwEPwQMDKQINBhUKCQIRKwUjAQsCoQIPBsEDAxkCIQYFFgEPDR8BAwkLDAsIBwIRAwUCA/EBCwEC4QMCGQIBCgUGBQIbCRMNAwU4BxEDBQID8QETAlED2QEEiQEDLQ4DAjcFCwAPAQcJNAcZBgftAQIBAwEHTQrVAQiFAQM1Ag8CLwEPBAsVFA0LAAECDQIFC/UBC7UCEIEBBzkGBwIrARcABwIVDBEPIQ/1AQM5AwJdAwaJARCFAQMpAgUGBQMCIwkjIQMdCxEGE7kCAAtNB5EBEA0DiQECDQIFChEfCQIABwQLBQcNAyELBQIFAg8CAwK1AgALBQQFCCkDkQEUiQECBQshBhEHAg8BBwEABwgHDQMJAxECAQMJAwECAyECrQEDhQEDCQg1CwkHfRQFAwJ9AgELAhkGHQMCBwIHAQMGCAIAAQcpAiEGAQ/xAQMBBgEDNQsFBD0PAQIBAwKFAQgFBoUBAgsZAiUCAQIHFQ4DIQYDAgsBBxUCDwkD4QEPBgQtB00fkQEAAQ=="],["rle","aQfNCRfxAhvtAgsCAwIRC9ECDwIhAwED0QICOQIH9QEDjQED6QEDxQ0HAQNpAwEHgQIDAQNBAwELqQIDAQOBAgJ1BwED9QIHgQMHhQMDnQcG/QEDfQMK+QEDeQOlCAOBAQL1AgMGAxUC3QIKEQJFAJ0CAgMVAkEArQEDiQEHARchA8ECAwUDAQsdAAfBAhsdBAcZA50CFyEAByEDhQIHAgUTHQQLIQOJAgcCBQsZCA/xAQM9BwkHHQQTqQIDBQcCCyUDAQupAgcFAwEHJQ8BA50CAwUHAQcxCwEDnQIXAQM1Bw0ClQIbSQOhAhNNAyEC8QEDBQtFD50CAwUHSQOxAgPNAwtJAgOxAgNNArUCA8kLAvEDAOULAsUDA9EFA40GAlEHqQIGUQMFA/UCBwEL7QILAQeVBQKFAwf9AguBAwcCjQYChQMHDQP1AgcBB1kDkQIPBQOJAwPhAgMFCwkDVQ+NAgNpE5ECA10L4QEAhQMAhQMAqQw="]]},{"level":3,"factor":8,"width":178,"height":172,"tileEncoding":{"tileSize":256,"tilesX":1,"tilesY":1,"bitsPerPixel":2},"tiles":[["rle","O4kFO4kFO4kFO6UDB9kBO6kDB9UBO4kFH6UFE7EFF60FF60FF/EDA7UBF60FG6kFG6kFG6kFG/ECA0ED6QEb7QIDAQc1B3UDUQMBAw0TBQPhAgMBBwEHsQEDUQMFAwkTBgPhAgcBAwEDqQIf4QIDAQO1AgcCCwID6QIDyQEDZQMBG+ECB7UCG6kFD80EA4kLB8UFA+0BB8EDB/UHC7EFD5kBA6UBAxEDxQITsQUH0QEHlQEDsQILAQfVAQPRAwcJD8kBA+UEAyEDlQQLbQsZC4UFG50FJ5UFL4kFP/0ER/EEV7kBA6UDX9kEa80Ee8EEgwG1BJMBpQIDgQKXAbEEkwGxBJcBsQSTAbEEkwGxBJcBsQSTAbEEkwGxBJcBsQSTAS0L9QOTARkj8QOXAREXBQf1A5MBDR8FA/UDkwEBJw0H8QOfAQEbhQSfAQkThQSfAQ0PiQSfAREDjQSfAaUEmwGtBJMBsQSTAWEDyQOXAbEEkwGxBJMBXQPRA5MBRQMBC9UDhwEpC4UEfxkHBQsBA4kEbyEHCQuRBGcpA4EBB6UDV4kBAgkCCQIDBgUDAqEDS4kBBwEDCQYJAgcCAQMCoQNDhQEfCQIJAhuhAzNBAz0jAQMJAgUCH6EDKzUDAR8lMwkDDR+dAx9BAwEXIUMJAgkCG6UDCykLAgMCERMVAwFLHRuhAwcCAyUPBQIHAQMBCx1THQIXqQMKHRMRGxlPAh0TAgOpAwodExEXIUsCAx0bAqEDBiEHBgsJFyFTHRsCpQMLHRcJAwEPIU8lDwIHAp0DDyEPEQcBByVLJQ8CB6EDEx0HKQcBAwkHBUsVAgkCDwEDpQMPUQ8JAwlLKQILAQMCyQIHTQdZDx1LJQMCDwK9AgIHBrUBAyVLJQIDCgEGxQICAQLhAUcVAg0CBQIBAtECAuEBSxECgQMC2QFLFQINAhEDkQICaQINC5EBSxECvQIGgQEDkQFLvQILCQINBgECGQM1AgUHkQFLsQIfFQJhAgUDmQFLqQIvOQI9A5kBS6UCM6ECNwIFA6UCNwkHFQNBA6UBO60COwkCAwUCAQIBAkEDpQErAgO1Aj8BBgsKBw0G2QEjwQI/BQIbEQLdARvJAj8BAwoPAg0GRQORAQMBC9ECNwIzAQYBCjkDlQED3QJzAgUCRQP5A08GGwECCQK9BDMCBwIHAhsGDQa9BCsGBwEDAiMNCsEENwIzAQcCAQIdA6UEAm/RBHcpA5kEeykDmQR7DQsNA5kEhwEBC60ElwGtBJcBrQR/BQ+tBDcCRwUHrQQCNwFDCQO1BAJ/wQQCAX/BBH/FBAsCbw0DpQQCBQIRTwEPEQeRBAYFChFfGQPVAgutAQ4BCgMNXwUH6QIDsQEOAQ4JYwUHmQQCARIBCglzDQKFBAIFDgEOBT8CMw0D/QIDeQYFDgUCDVMFFwIJB/0DBg0GGU8JFwIJB/0CA4EBAgkGGXsFB5kEAh07Ci8BB50EAh0vAkuFAgO9Ai8BAj+tBAMCHSMCBUP1BAcGP4UCBvECQ50CC90BBnU7nQILDQfxAQNNN50CCxED8QEHUTOZAgMBBw0L7QEDVS+ZAgMBBxELxQEHcQMBL5ECDxkD2QIjiQIDBQvxAgMBG6UCAyUDxQIHxQoKA60FFq0FFs0BAwLhAwrRAQP5AwMBA7EFD+kEB0EP6QQHRQOxAwO9AQNFD9ECAOECD7EFF+ECA8ECBwIjkQEDUQOhAxMJE5UBB60BBwEDjQICBQYBAwUXARcCkQEDAsUDCgEXAQ8BAwEYAw0CeQcpAmkAFQMxB9UBAi8NAAkHEQN5A50BBKUCBgETARMBAwUDDQMJAguZAQclA0kEkQIHDQIJEwIDAgMxB6EBAyUHAQNFAMkBAkEHIQIDCQYDEQ8JAgcBA3EHAhUHJQsCkQI="]]}]};
@@ -56,7 +56,7 @@ window.__SOLO_TERRAIN_SOURCES__ = {
     ],
     "ndvi_scale_factor": 10000,
     "pixel_processing": "classificacao pixel a pixel no recorte operacional completo",
-    "raster_runtime_product": "terrain-bdc-raster.json (classCodesBase64 + bounds + width + height)",
+    "raster_runtime_product": "terrain-bdc-raster.json (tiles RLE/bitpack + tileEncoding + bounds)",
     "grid_compatibility": "terrain-grid.json derivado por agregacao do raster apenas para missao/exportacao",
     "classification": "SCL + NDVI threshold: SCL=4 NDVI>=0.5 -> vegetation_dense; SCL=4 NDVI<0.5 -> vegetation_sparse; SCL=5 -> bare_soil; SCL=6 -> water; demais -> null (invalido)",
     "soil_lookup_reference": "Imhoff et al. 2004; Latossolo Vermelho-Amarelo, oeste Bahia",
@@ -5,26 +5,58 @@ Sprint 4 — Inferencia de Parametros de Solo via BDC
 
 Processa o recorte operacional do BDC pixel a pixel, gera um raster local
 compactado para o runtime e deriva a grade operacional de 2 km como camada
-de compatibilidade para missao/exportacao.
+de compatibilidade para missao/exportacao. Grades regulares aninhadas
+(--grid-sizes-m, ex. 2 km / 500 m / 100 m) saem de uma unica contagem de
+classes na resolucao mais fina.
+
+Os blocos dos COGs que cobrem a fazenda ficam num cache local; com o cache
+preenchido (ou com --source-dir) o reprocessamento roda sem rede (--offline).
 """
 
+import argparse
 import base64
+import hashlib
 import json
+import math
+import os
 import sys
+from contextlib import ExitStack
 from pathlib import Path
+from urllib.parse import urlparse
 
 import numpy as np
 import rasterio
 from pyproj import Transformer
-from rasterio.windows import from_bounds, transform as window_transform
+from rasterio.crs import CRS
+from rasterio.io import MemoryFile
+from rasterio.transform import Affine
+from rasterio.warp import Resampling, reproject
+from rasterio.windows import Window, from_bounds, transform as window_transform
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 SOURCES_PATH = BASE_DIR / "data" / "terrain-sources.json"
 GRID_PATH = BASE_DIR / "data" / "terrain-grid.json"
 RASTER_PATH = BASE_DIR / "data" / "terrain-bdc-raster.json"
+RASTER_JS_PATH = BASE_DIR / "data" / "terrain-bdc-raster.js"
+RASTER_JS_GLOBAL = "__SOLO_TERRAIN_BDC_RASTER__"
+PYRAMID_PATH = BASE_DIR / "data" / "terrain-bdc-pyramid.json"
+PYRAMID_JS_PATH = BASE_DIR / "data" / "terrain-bdc-pyramid.js"
+PYRAMID_JS_GLOBAL = "__SOLO_TERRAIN_BDC_PYRAMID__"
+SOIL_PATH = BASE_DIR / "data" / "terrain-bdc-soil.tif"
+COG_CACHE_DIR = BASE_DIR / "data" / "cache-cog"
 
 DATASET_VERSION_V2 = "2026-04-05-paladino-bdc-7km-v2"
 
+# NDVI do BDC vem em inteiros escalados por 10000; o limiar 0.5 e comparado ja escalado.
+NDVI_SCALE = 10000
+NDVI_DENSE_THRESHOLD_DN = 5000
+# Faixa de linhas lida e classificada por vez (multiplo do bloco de 512 dos COGs).
+CLASSIFY_BLOCK_ROWS = 1024
+# Lado dos tiles do raster do runtime (pixels); cada tile e decodificado de forma independente.
+RASTER_TILE_SIZE = 256
+# Resolucoes das grades operacionais aninhadas (m); cada uma e multipla inteira da mais fina.
+GRID_LEVEL_SIZES_M = (2000, 500, 100)
+
 CLASS_NAME_TO_CODE = {
     None: 0,
     "vegetation_dense": 1,
@@ -64,6 +96,13 @@ SOIL_LOOKUP = {
     },
 }
 
+# Bandas do produto de parametros de solo por pixel, nesta ordem.
+SOIL_BANDS = ("clay_content", "water_content", "matric_suction", "bulk_density", "conc_factor", "sigma_p")
+# Faixas de argila (%) e coeficientes de sigma_p_severiano(): sigma_p = a * suction ** b.
+SEVERIANO_CLAY_EDGES_PCT = np.array([20.0, 31.0, 41.0, 52.0])
+SEVERIANO_COEFFICIENTS = np.array([129.0, 123.3, 119.2, 88.3, 62.7])
+SEVERIANO_EXPONENTS = np.array([0.15, 0.13, 0.11, 0.13, 0.15])
+
 
 def classify_thematic(scl: float, ndvi: float) -> str | None:
     if scl == 4:
@@ -113,6 +152,35 @@ def sigma_p_severiano(clay_fraction: float, suction_kpa: float) -> float:
     return round(62.7 * suction_kpa ** 0.15, 1)
 
 
+def matric_suction_kpa_array(
+    theta: np.ndarray,
+    theta_r: float = 0.10,
+    theta_s: float = 0.50,
+    alpha: float = 0.05,
+    n: float = 1.8,
+) -> np.ndarray:
+    """Versao vetorizada de matric_suction_kpa(); NaN onde ``theta`` e NaN."""
+    se = np.clip((np.asarray(theta, dtype=np.float64) - theta_r) / (theta_s - theta_r), 1e-6, 1.0 - 1e-6)
+    m = 1 - 1 / n
+    return np.round((1 / alpha) * (se ** (-1 / m) - 1) ** (1 / n), 1)
+
+
+def conc_factor_array(suction_kpa: np.ndarray) -> np.ndarray:
+    """Versao vetorizada de conc_factor(); NaN onde a succao e NaN."""
+    suction_kpa = np.asarray(suction_kpa, dtype=np.float64)
+    factor = np.select([suction_kpa < 20, suction_kpa < 50, suction_kpa < 150], [3.0, 4.0, 5.0], 6.0)
+    return np.where(np.isnan(suction_kpa), np.nan, factor)
+
+
+def sigma_p_severiano_array(clay_fraction: np.ndarray, suction_kpa: np.ndarray) -> np.ndarray:
+    """Versao vetorizada de sigma_p_severiano(); NaN onde argila ou succao sao NaN."""
+    clay_pct = np.asarray(clay_fraction, dtype=np.float64) * 100
+    suction_kpa = np.asarray(suction_kpa, dtype=np.float64)
+    band = np.searchsorted(SEVERIANO_CLAY_EDGES_PCT, np.nan_to_num(clay_pct), side="right")
+    sigma_p = np.round(SEVERIANO_COEFFICIENTS[band] * suction_kpa ** SEVERIANO_EXPONENTS[band], 1)
+    return np.where(np.isnan(clay_pct) | np.isnan(suction_kpa), np.nan, sigma_p)
+
+
 def projected_bounds(bounds_lonlat: dict, transformer: Transformer) -> tuple[float, float, float, float]:
     west, south = transformer.transform(bounds_lonlat["west"], bounds_lonlat["south"])
     east, north = transformer.transform(bounds_lonlat["east"], bounds_lonlat["north"])
@@ -173,51 +241,601 @@ def class_code_snapshot(class_code: int, cell_id: str) -> tuple[dict, dict]:
     return snap, prov
 
 
+def build_class_lut() -> np.ndarray:
+    """Tabela plana de codigos indexada por ``scl * 3 + faixa_ndvi``.
+
+    Faixas de NDVI: 0 = abaixo do limiar, 1 = acima ou igual, 2 = NDVI invalido.
+    Reproduz classify_thematic() para qualquer SCL de 0 a 255.
+    """
+    lut = np.zeros((256, 3), dtype=np.uint8)
+    lut[4, 0] = CLASS_NAME_TO_CODE["vegetation_sparse"]
+    lut[4, 1] = CLASS_NAME_TO_CODE["vegetation_dense"]
+    lut[5, :] = CLASS_NAME_TO_CODE["bare_soil"]
+    lut[6, :] = CLASS_NAME_TO_CODE["water"]
+    return lut.reshape(-1)
+
+
+CLASS_LUT = build_class_lut()
+
+
+def classify_block(ndvi_data: np.ma.MaskedArray, scl_data: np.ma.MaskedArray) -> np.ndarray:
+    """Classifica um bloco nas bandas inteiras nativas, sem conversao para float."""
+    ndvi = np.ma.getdata(ndvi_data)
+    scl = np.ma.getdata(scl_data)
+    ndvi_invalid = np.ma.getmaskarray(ndvi_data)
+    if np.issubdtype(ndvi.dtype, np.floating):
+        ndvi_invalid = ndvi_invalid | np.isnan(ndvi)
+    scl_invalid = np.ma.getmaskarray(scl_data)
+    if scl.dtype != np.uint8:
+        scl_invalid = scl_invalid | (scl < 0) | (scl > 255)
+
+    key = (ndvi >= NDVI_DENSE_THRESHOLD_DN).astype(np.uint16)
+    key[ndvi_invalid] = 2
+    key += scl.astype(np.uint16, copy=False) * 3
+    key[scl_invalid] = 0
+    return CLASS_LUT.take(key)
+
+
 def classify_full_raster(ndvi_data: np.ma.MaskedArray, scl_data: np.ma.MaskedArray) -> np.ndarray:
-    ndvi = ndvi_data.astype(np.float64).filled(np.nan) / 10000.0
-    scl = scl_data.astype(np.float64).filled(np.nan)
-    codes = np.zeros(scl.shape, dtype=np.uint8)
-
-    vegetation_mask = scl == 4
-    codes[vegetation_mask & (ndvi >= 0.5)] = CLASS_NAME_TO_CODE["vegetation_dense"]
-    codes[vegetation_mask & (ndvi < 0.5)] = CLASS_NAME_TO_CODE["vegetation_sparse"]
-    codes[scl == 5] = CLASS_NAME_TO_CODE["bare_soil"]
-    codes[scl == 6] = CLASS_NAME_TO_CODE["water"]
+    codes = np.empty(scl_data.shape, dtype=np.uint8)
+    for row0 in range(0, codes.shape[0], CLASSIFY_BLOCK_ROWS):
+        rows = slice(row0, row0 + CLASSIFY_BLOCK_ROWS)
+        codes[rows] = classify_block(ndvi_data[rows], scl_data[rows])
     return codes
 
 
-def aggregate_cell_class(
+def iter_classified_blocks(
+    src_ndvi,
+    src_scl,
+    ndvi_window: Window,
+    scl_window: Window,
+    block_rows: int = CLASSIFY_BLOCK_ROWS,
+):
+    """Le e classifica o recorte em faixas de linhas; gera (linha inicial, codigos uint8).
+
+    So uma faixa das bandas de entrada fica em memoria por vez, entao o custo de uma
+    AOI grande e o da propria saida (1 byte por pixel) ou nenhum, se consumida em fluxo.
+    """
+    height = int(scl_window.height)
+    for row0 in range(0, height, block_rows):
+        rows = min(block_rows, height - row0)
+        ndvi_block = src_ndvi.read(
+            1,
+            window=Window(ndvi_window.col_off, ndvi_window.row_off + row0, ndvi_window.width, rows),
+            masked=True,
+        )
+        scl_block = src_scl.read(
+            1,
+            window=Window(scl_window.col_off, scl_window.row_off + row0, scl_window.width, rows),
+            masked=True,
+        )
+        if ndvi_block.shape != scl_block.shape:
+            raise ValueError(
+                f"NDVI e SCL com shapes diferentes no bloco ({ndvi_block.shape} vs {scl_block.shape})"
+            )
+        yield row0, classify_block(ndvi_block, scl_block)
+
+
+def cell_pixel_windows(
+    cell_bounds: list[dict],
+    transformer: Transformer,
+    crop_transform,
+    shape: tuple[int, int],
+) -> np.ndarray:
+    """Janela (linha0, linha1, coluna0, coluna1) de cada celula no recorte, cortada ao recorte.
+
+    As bordas sao reprojetadas numa unica chamada, cada uma no meio do lado da celula
+    (oeste/leste na latitude central, norte/sul na longitude central): celulas vizinhas
+    da grade lon/lat dao a mesma coordenada para a borda comum. Inicio e fim da janela
+    sao arredondados para baixo, entao as janelas se encontram sem sobrepor pixels nem
+    deixar buracos.
+    """
+    west = np.array([bounds["west"] for bounds in cell_bounds], dtype=np.float64)
+    south = np.array([bounds["south"] for bounds in cell_bounds], dtype=np.float64)
+    east = np.array([bounds["east"] for bounds in cell_bounds], dtype=np.float64)
+    north = np.array([bounds["north"] for bounds in cell_bounds], dtype=np.float64)
+    mid_lon = (west + east) / 2.0
+    mid_lat = (south + north) / 2.0
+    x, y = transformer.transform(
+        np.concatenate([west, east, mid_lon, mid_lon]), np.concatenate([mid_lat, mid_lat, north, south])
+    )
+    n = len(cell_bounds)
+    x_west, x_east = np.asarray(x[:n]), np.asarray(x[n : 2 * n])
+    y_north, y_south = np.asarray(y[2 * n : 3 * n]), np.asarray(y[3 * n :])
+
+    inverse = ~crop_transform
+    col0, row0 = inverse * (np.minimum(x_west, x_east), np.maximum(y_north, y_south))  # canto noroeste
+    col1, row1 = inverse * (np.maximum(x_west, x_east), np.minimum(y_north, y_south))  # canto sudeste
+    windows = np.floor(np.column_stack([row0, row1, col0, col1]))
+    windows[:, 0:2] = np.clip(windows[:, 0:2], 0, shape[0])
+    windows[:, 2:4] = np.clip(windows[:, 2:4], 0, shape[1])
+    return windows.astype(np.int64)
+
+
+def zonal_class_histograms(
+    class_codes: np.ndarray,
+    windows: np.ndarray,
+    block_rows: int = CLASSIFY_BLOCK_ROWS,
+) -> np.ndarray:
+    """Contagem de pixels por (celula, codigo de classe) com um bincount por faixa de linhas.
+
+    Os rotulos (0 fora das celulas, ``i + 1`` na celula ``i``) sao montados so para a
+    faixa corrente; se janelas se sobrepuserem, o pixel fica com a ultima celula.
+    """
+    n_cells = windows.shape[0]
+    n_classes = len(CLASS_CODE_TO_NAME)
+    counts = np.zeros((n_cells + 1) * n_classes, dtype=np.int64)
+    for row0 in range(0, class_codes.shape[0], block_rows):
+        rows = slice(row0, row0 + block_rows)
+        strip = class_codes[rows]
+        row1 = row0 + strip.shape[0]
+        labels = np.zeros(strip.shape, dtype=np.int64)
+        for index in np.flatnonzero((windows[:, 0] < row1) & (windows[:, 1] > row0)):
+            cell_row0, cell_row1, col0, col1 = windows[index]
+            labels[max(cell_row0, row0) - row0 : min(cell_row1, row1) - row0, col0:col1] = index + 1
+        counts += np.bincount((labels * n_classes + strip).ravel(), minlength=counts.size)
+    return counts.reshape(n_cells + 1, n_classes)[1:]
+
+
+def summarize_cell_histograms(histograms: np.ndarray) -> list[tuple[int, dict]]:
+    """Classe dominante, fracoes por classe e contagens de cada celula a partir dos histogramas.
+
+    Empates na classe dominante ficam com o menor codigo, como em np.unique + argmax.
+    """
+    valid = histograms[:, 1:]
+    valid_counts = valid.sum(axis=1)
+    dominant = np.where(valid_counts > 0, 1 + np.argmax(valid, axis=1), 0)
+    dominant_counts = valid.max(axis=1, initial=0)
+    fractions = valid / np.maximum(valid_counts, 1)[:, None]
+    pixel_counts = histograms.sum(axis=1)
+
+    observations = []
+    for index in range(histograms.shape[0]):
+        stats = {
+            "pixel_count": int(pixel_counts[index]),
+            "valid_pixel_count": int(valid_counts[index]),
+        }
+        if valid_counts[index] > 0:
+            stats["dominant_code"] = int(dominant[index])
+            stats["dominant_count"] = int(dominant_counts[index])
+            stats["class_fractions"] = {
+                CLASS_CODE_TO_NAME[code]: round(float(fractions[index, code - 1]), 6)
+                for code in range(1, histograms.shape[1])
+            }
+        observations.append((int(dominant[index]), stats))
+    return observations
+
+
+def aggregate_grid_cells(
     class_codes: np.ndarray,
-    bounds_lonlat: dict,
+    cell_bounds: list[dict],
     transformer: Transformer,
     crop_transform,
-) -> tuple[int, dict]:
-    left, bottom, right, top = projected_bounds(bounds_lonlat, transformer)
-    window = from_bounds(left, bottom, right, top, transform=crop_transform).round_offsets().round_lengths()
-
-    row0 = max(0, int(window.row_off))
-    col0 = max(0, int(window.col_off))
-    row1 = min(class_codes.shape[0], row0 + max(1, int(window.height)))
-    col1 = min(class_codes.shape[1], col0 + max(1, int(window.width)))
-    cell_codes = class_codes[row0:row1, col0:col1].reshape(-1)
-    valid_codes = cell_codes[cell_codes > 0]
-
-    stats = {
-        "pixel_count": int(cell_codes.size),
-        "valid_pixel_count": int(valid_codes.size),
+) -> list[tuple[int, dict]]:
+    """Estatisticas de todas as celulas numa passada unica sobre o raster de classes."""
+    windows = cell_pixel_windows(cell_bounds, transformer, crop_transform, class_codes.shape)
+    return summarize_cell_histograms(zonal_class_histograms(class_codes, windows))
+
+
+def regular_grid_histograms(
+    class_codes: np.ndarray,
+    cell_pixels: int,
+    block_rows: int = CLASSIFY_BLOCK_ROWS,
+) -> np.ndarray:
+    """Histograma de classes (linha, coluna, codigo) de uma grade regular alinhada ao recorte.
+
+    A celula (i, j) cobre os pixels ``[i * cell_pixels, (i + 1) * cell_pixels)`` em cada eixo;
+    as celulas da borda direita/inferior ficam com os pixels que restam.
+    """
+    n_classes = len(CLASS_CODE_TO_NAME)
+    height, width = class_codes.shape
+    n_rows = -(-height // cell_pixels)
+    n_cols = -(-width // cell_pixels)
+    col_cells = np.arange(width, dtype=np.int64) // cell_pixels
+    counts = np.zeros(n_rows * n_cols * n_classes, dtype=np.int64)
+    for row0 in range(0, height, block_rows):
+        rows = slice(row0, row0 + block_rows)
+        row_cells = np.arange(row0, min(height, row0 + block_rows), dtype=np.int64) // cell_pixels
+        keys = (row_cells[:, None] * n_cols + col_cells[None, :]) * n_classes + class_codes[rows]
+        counts += np.bincount(keys.ravel(), minlength=counts.size)
+    return counts.reshape(n_rows, n_cols, n_classes)
+
+
+def nested_grid_histograms(
+    class_codes: np.ndarray,
+    pixel_size_m: float,
+    sizes_m: list[int],
+) -> dict[int, np.ndarray]:
+    """Histogramas de todas as resolucoes a partir de uma unica passada na mais fina.
+
+    Cada nivel mais grosso soma blocos de celulas da mais fina, entao coincide com a
+    contagem direta sobre os pixels (as grades partem do mesmo canto do recorte).
+    """
+    finest = min(sizes_m)
+    cell_pixels = round(finest / pixel_size_m)
+    if cell_pixels < 1 or not math.isclose(cell_pixels * pixel_size_m, finest):
+        raise ValueError(f"Resolucao {finest} m nao e multipla do pixel de {pixel_size_m} m")
+    for size in sizes_m:
+        if size % finest:
+            raise ValueError(f"Resolucao {size} m nao e multipla da mais fina ({finest} m)")
+
+    base = regular_grid_histograms(class_codes, cell_pixels)
+    return {size: base if size == finest else sum_blocks(base, size // finest) for size in sizes_m}
+
+
+def regular_grid_geometry(
+    n_rows: int,
+    n_cols: int,
+    size_m: int,
+    crop_transform,
+    shape: tuple[int, int],
+    to_lonlat: Transformer,
+) -> tuple[list[dict], list[dict]]:
+    """Centro e bounds em lon/lat de cada celula da grade regular, em ordem de linha.
+
+    As celulas da borda sao cortadas ao recorte; os quatro cantos de todas as celulas
+    sao reprojetados numa unica chamada.
+    """
+    left, top = crop_transform.c, crop_transform.f
+    right = left + shape[1] * crop_transform.a
+    bottom = top + shape[0] * crop_transform.e
+    x0 = left + np.arange(n_cols) * size_m
+    x1 = np.minimum(x0 + size_m, right)
+    y1 = top - np.arange(n_rows) * size_m
+    y0 = np.maximum(y1 - size_m, bottom)
+    xs0, ys0 = np.meshgrid(x0, y0)
+    xs1, ys1 = np.meshgrid(x1, y1)
+
+    corner_x = np.stack([xs0, xs1, xs0, xs1]).ravel()
+    corner_y = np.stack([ys0, ys0, ys1, ys1]).ravel()
+    lng, lat = to_lonlat.transform(corner_x, corner_y)
+    lng = np.asarray(lng).reshape(4, -1)
+    lat = np.asarray(lat).reshape(4, -1)
+    center_lng, center_lat = to_lonlat.transform(((xs0 + xs1) / 2).ravel(), ((ys0 + ys1) / 2).ravel())
+
+    centers = [{"lat": float(la), "lng": float(lo)} for la, lo in zip(center_lat, center_lng)]
+    extents = zip(lat.max(axis=0), lat.min(axis=0), lng.max(axis=0), lng.min(axis=0))
+    bounds = [
+        {"north": float(north), "south": float(south), "east": float(east), "west": float(west)}
+        for north, south, east, west in extents
+    ]
+    return centers, bounds
+
+
+def grid_cell_entry(cell_id: str, center: dict, bounds: dict, dominant_code: int, stats: dict) -> dict:
+    """Celula operacional no formato de terrain-grid.json."""
+    snapshot, provenance = class_code_snapshot(dominant_code, cell_id)
+    return {
+        "cellId": cell_id,
+        "datasetVersion": DATASET_VERSION_V2,
+        "center": center,
+        "bounds": bounds,
+        "thematicClass": {
+            "source": "bdc-raster-pixel-derived",
+            "value": snapshot["thematic_class"],
+        },
+        "terrainSnapshotBase": snapshot,
+        "provenance": provenance,
+        "pixelStats": {
+            "pixelCount": stats["pixel_count"],
+            "validPixelCount": stats["valid_pixel_count"],
+            "classFractions": stats.get("class_fractions"),
+        },
+    }
+
+
+def build_grid_level(
+    size_m: int,
+    histograms: np.ndarray,
+    crop_transform,
+    crop_crs,
+    shape: tuple[int, int],
+    farm_bounds: dict,
+) -> dict:
+    """Produto de grade de uma resolucao a partir dos histogramas (linha, coluna, codigo)."""
+    n_rows, n_cols, n_classes = histograms.shape
+    to_lonlat = Transformer.from_crs(crop_crs, "EPSG:4326", always_xy=True)
+    centers, bounds = regular_grid_geometry(n_rows, n_cols, size_m, crop_transform, shape, to_lonlat)
+    observations = summarize_cell_histograms(histograms.reshape(-1, n_classes))
+
+    cells = []
+    for index, (dominant_code, stats) in enumerate(observations):
+        row, col = divmod(index, n_cols)
+        cell_id = f"paladino-{size_m}m-r{row + 1}-c{col + 1}"
+        cells.append(grid_cell_entry(cell_id, centers[index], bounds[index], dominant_code, stats))
+    return {
+        "farmId": "fazenda-paladino",
+        "datasetVersion": DATASET_VERSION_V2,
+        "cellSizeMeters": size_m,
+        "rows": n_rows,
+        "cols": n_cols,
+        "bounds": farm_bounds,
+        "cells": cells,
     }
 
-    if valid_codes.size == 0:
-        return 0, stats
 
-    values, counts = np.unique(valid_codes, return_counts=True)
-    dominant_code = int(values[np.argmax(counts)])
-    stats["dominant_code"] = dominant_code
-    stats["dominant_count"] = int(np.max(counts))
-    return dominant_code, stats
+def grid_level_path(size_m: int) -> Path:
+    return BASE_DIR / "data" / f"terrain-grid-{size_m}m.json"
+
 
+def asset_cache_dir(cache_dir: Path, url: str) -> Path:
+    """Diretorio do cache de um asset: um por URL, com um arquivo .npy por bloco do COG."""
+    return cache_dir / hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
 
-def build_raster_payload(bounds: dict, class_codes: np.ndarray) -> dict:
+
+def cog_metadata(src, url: str) -> dict:
+    block_height, block_width = src.block_shapes[0]
+    return {
+        "url": url,
+        "crs": src.crs.to_wkt(),
+        "transform": list(src.transform)[:6],
+        "width": src.width,
+        "height": src.height,
+        "dtype": src.dtypes[0],
+        "nodata": src.nodata,
+        "block_height": block_height,
+        "block_width": block_width,
+    }
+
+
+def open_cached_cog(url: str, bounds_lonlat: dict, cache_dir: Path, offline: bool, stack: ExitStack):
+    """Abre o recorte de um COG remoto a partir do cache local de blocos.
+
+    So os blocos internos do COG que cruzam ``bounds_lonlat`` sao baixados (uma vez,
+    via /vsicurl/) e gravados em ``cache_dir``; o recorte alinhado aos blocos e
+    montado num GeoTIFF em memoria com a mesma grade do original. Com ``offline``
+    um bloco ausente no cache e erro em vez de download.
+    """
+    asset_dir = asset_cache_dir(cache_dir, url)
+    meta_path = asset_dir / "meta.json"
+    remote = None
+    if meta_path.exists():
+        with open(meta_path, encoding="utf-8") as file:
+            meta = json.load(file)
+    else:
+        if offline:
+            raise FileNotFoundError(f"asset fora do cache local ({cache_dir}): {url}")
+        remote = stack.enter_context(rasterio.open(f"/vsicurl/{url}"))
+        meta = cog_metadata(remote, url)
+        asset_dir.mkdir(parents=True, exist_ok=True)
+        with open(meta_path, "w", encoding="utf-8") as file:
+            json.dump(meta, file, indent=2)
+
+    crs = CRS.from_wkt(meta["crs"])
+    transform = Affine(*meta["transform"])
+    block_height, block_width = meta["block_height"], meta["block_width"]
+    transformer = Transformer.from_crs("EPSG:4326", crs, always_xy=True)
+    window = from_bounds(*projected_bounds(bounds_lonlat, transformer), transform=transform)
+    window = window.round_offsets().round_lengths()
+    row0 = min(max(0, int(window.row_off)), meta["height"] - 1)
+    col0 = min(max(0, int(window.col_off)), meta["width"] - 1)
+    row1 = min(meta["height"], max(row0 + 1, int(window.row_off + window.height)))
+    col1 = min(meta["width"], max(col0 + 1, int(window.col_off + window.width)))
+    block_rows = range(row0 // block_height, math.ceil(row1 / block_height))
+    block_cols = range(col0 // block_width, math.ceil(col1 / block_width))
+    mosaic = Window(
+        block_cols.start * block_width,
+        block_rows.start * block_height,
+        min(meta["width"], block_cols.stop * block_width) - block_cols.start * block_width,
+        min(meta["height"], block_rows.stop * block_height) - block_rows.start * block_height,
+    )
+
+    memfile = stack.enter_context(MemoryFile())
+    with memfile.open(
+        driver="GTiff",
+        width=int(mosaic.width),
+        height=int(mosaic.height),
+        count=1,
+        dtype=meta["dtype"],
+        crs=crs,
+        transform=window_transform(mosaic, transform),
+        nodata=meta["nodata"],
+    ) as dst:
+        for block_row in block_rows:
+            for block_col in block_cols:
+                block = Window(
+                    block_col * block_width,
+                    block_row * block_height,
+                    min(block_width, meta["width"] - block_col * block_width),
+                    min(block_height, meta["height"] - block_row * block_height),
+                )
+                block_path = asset_dir / f"{block_row}_{block_col}.npy"
+                if block_path.exists():
+                    data = np.load(block_path)
+                else:
+                    if offline:
+                        raise FileNotFoundError(f"bloco {block_row},{block_col} fora do cache local: {url}")
+                    if remote is None:
+                        remote = stack.enter_context(rasterio.open(f"/vsicurl/{url}"))
+                    data = remote.read(1, window=block)
+                    partial_path = block_path.with_suffix(".part.npy")
+                    np.save(partial_path, data)
+                    os.replace(partial_path, block_path)
+                row_off = block.row_off - mosaic.row_off
+                col_off = block.col_off - mosaic.col_off
+                dst.write(data, 1, window=Window(col_off, row_off, data.shape[1], data.shape[0]))
+    return stack.enter_context(memfile.open())
+
+
+def local_asset_path(source_dir: Path, asset: str, url: str) -> Path | None:
+    """GeoTIFF pre-baixado do asset: mesmo nome do arquivo da URL ou ``{asset}.tif``."""
+    for candidate in (source_dir / Path(urlparse(url).path).name, source_dir / f"{asset}.tif"):
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def open_asset(asset: str, url: str, bounds_lonlat: dict, args: argparse.Namespace, stack: ExitStack):
+    """Abre um asset do BDC: arquivo local em --source-dir, cache de blocos ou /vsicurl/ direto."""
+    if args.source_dir is not None:
+        path = local_asset_path(args.source_dir, asset, url)
+        if path is None:
+            raise FileNotFoundError(f"{asset} nao encontrado em {args.source_dir}")
+        print(f"  {asset}: {path}")
+        return stack.enter_context(rasterio.open(path))
+    if args.no_cache:
+        print(f"  {asset}: /vsicurl/ sem cache")
+        return stack.enter_context(rasterio.open(f"/vsicurl/{url}"))
+    print(f"  {asset}: cache de blocos em {asset_cache_dir(args.cache_dir, url)}")
+    return open_cached_cog(url, bounds_lonlat, args.cache_dir, args.offline, stack)
+
+
+def encode_varints(values: np.ndarray) -> bytes:
+    """Inteiros nao negativos em LEB128 (7 bits por byte, bit alto = continua)."""
+    values = values.astype(np.uint64)
+    sizes = np.ones(values.size, dtype=np.int64)
+    for shift in (7, 14, 21, 28, 35, 42, 49, 56, 63):
+        sizes += values >= np.uint64(1 << shift)
+    starts = np.cumsum(sizes) - sizes
+    out = np.zeros(int(sizes.sum()), dtype=np.uint8)
+    for byte_index in range(int(sizes.max(initial=0))):
+        has_byte = sizes > byte_index
+        chunk = (values[has_byte] >> np.uint64(7 * byte_index)) & np.uint64(0x7F)
+        more = (sizes[has_byte] > byte_index + 1).astype(np.uint64) << np.uint64(7)
+        out[starts[has_byte] + byte_index] = (chunk | more).astype(np.uint8)
+    return out.tobytes()
+
+
+def encode_tile(codes: np.ndarray, bits_per_pixel: int) -> list:
+    """Codifica um tile como ``["constant", codigo]``, ``["rle", b64]`` ou ``["bitpack", b64]``.
+
+    RLE: uma varint por sequencia, ``(comprimento - 1) << bits_per_pixel | codigo``, em
+    ordem de linhas. Bitpack: ``bits_per_pixel`` bits por pixel, do bit menos
+    significativo para o mais significativo. Fica a menor das duas.
+    """
+    flat = codes.reshape(-1)
+    run_starts = np.flatnonzero(np.r_[True, flat[1:] != flat[:-1]])
+    if run_starts.size == 1:
+        return ["constant", int(flat[0])]
+
+    run_lengths = np.diff(np.r_[run_starts, flat.size])
+    rle = encode_varints(((run_lengths - 1) << bits_per_pixel) | flat[run_starts])
+    bits = np.unpackbits(flat[:, None], axis=1, bitorder="little")[:, :bits_per_pixel]
+    packed = np.packbits(bits.reshape(-1), bitorder="little").tobytes()
+    if len(rle) <= len(packed):
+        return ["rle", base64.b64encode(rle).decode("ascii")]
+    return ["bitpack", base64.b64encode(packed).decode("ascii")]
+
+
+def encode_tiles(class_codes: np.ndarray, tile_size: int, bits_per_pixel: int) -> dict:
+    """``tileEncoding`` e ``tiles`` de um raster de classes, na ordem das linhas de tiles.
+
+    O tile (i, j) cobre as linhas ``i * tileSize`` ate ``min((i + 1) * tileSize, height)``
+    e o mesmo para colunas.
+    """
+    height, width = class_codes.shape
+    return {
+        "tileEncoding": {
+            "tileSize": tile_size,
+            "tilesX": math.ceil(width / tile_size),
+            "tilesY": math.ceil(height / tile_size),
+            "bitsPerPixel": bits_per_pixel,
+        },
+        "tiles": [
+            encode_tile(class_codes[row : row + tile_size, col : col + tile_size], bits_per_pixel)
+            for row in range(0, height, tile_size)
+            for col in range(0, width, tile_size)
+        ],
+    }
+
+
+def class_soil_lookup() -> dict[str, np.ndarray]:
+    """Parametros de solo de cada codigo de classe (NaN para invalido e agua).
+
+    Calculado uma unica vez com as mesmas funcoes escalares de class_code_snapshot().
+    """
+    tables = {name: np.full(len(CLASS_CODE_TO_NAME), np.nan) for name in SOIL_BANDS}
+    for code in CLASS_CODE_TO_NAME:
+        snapshot, _ = class_code_snapshot(code, "")
+        for name in SOIL_BANDS:
+            if snapshot[name] is not None:
+                tables[name][code] = snapshot[name]
+    return tables
+
+
+def soil_parameter_bands(
+    class_codes: np.ndarray,
+    water_content: np.ndarray | None = None,
+    lookup: dict[str, np.ndarray] | None = None,
+) -> dict[str, np.ndarray]:
+    """Bandas de SOIL_BANDS por pixel a partir dos codigos de classe.
+
+    Sem ``water_content`` cada banda e uma consulta a tabela por classe. Com ele, a
+    umidade por pixel (m3/m3; NaN = usar a da classe) substitui a da tabela e a
+    succao, o fator de concentracao e sigma_p sao recalculados pixel a pixel. Pixels
+    invalidos ou de agua ficam NaN em todas as bandas.
+    """
+    lookup = lookup or class_soil_lookup()
+    bands = {name: lookup[name][class_codes] for name in SOIL_BANDS}
+    if water_content is None:
+        return bands
+
+    soil_pixels = ~np.isnan(bands["clay_content"])
+    water = np.where(np.isnan(water_content), bands["water_content"], water_content)
+    bands["water_content"] = np.where(soil_pixels, water, np.nan)
+    bands["matric_suction"] = matric_suction_kpa_array(bands["water_content"])
+    bands["conc_factor"] = conc_factor_array(bands["matric_suction"])
+    bands["sigma_p"] = sigma_p_severiano_array(bands["clay_content"], bands["matric_suction"])
+    return bands
+
+
+def read_water_content(path: Path, crs, transform, shape: tuple[int, int]) -> np.ndarray:
+    """Umidade volumetrica reamostrada (bilinear) para a grade do recorte; sem dado = NaN."""
+    water = np.full(shape, np.nan, dtype=np.float32)
+    with rasterio.open(path) as src:
+        reproject(
+            source=rasterio.band(src, 1),
+            destination=water,
+            dst_transform=transform,
+            dst_crs=crs,
+            dst_nodata=np.nan,
+            resampling=Resampling.bilinear,
+        )
+    return water
+
+
+def write_soil_raster(
+    path: Path,
+    class_codes: np.ndarray,
+    crs,
+    transform,
+    water_content: np.ndarray | None = None,
+    block_rows: int = CLASSIFY_BLOCK_ROWS,
+) -> None:
+    """Grava SOIL_BANDS como GeoTIFF float32 multibanda (DEFLATE), em faixas de linhas."""
+    lookup = class_soil_lookup()
+    height, width = class_codes.shape
+    profile = {
+        "driver": "GTiff",
+        "width": width,
+        "height": height,
+        "count": len(SOIL_BANDS),
+        "dtype": "float32",
+        "crs": crs,
+        "transform": transform,
+        "nodata": np.nan,
+        "tiled": True,
+        "blockxsize": RASTER_TILE_SIZE,
+        "blockysize": RASTER_TILE_SIZE,
+        "compress": "deflate",
+        "predictor": 3,
+        "interleave": "band",
+    }
+    with rasterio.open(path, "w", **profile) as dst:
+        for index, name in enumerate(SOIL_BANDS, start=1):
+            dst.set_band_description(index, name)
+        for row0 in range(0, height, block_rows):
+            rows = slice(row0, row0 + block_rows)
+            block_water = water_content[rows] if water_content is not None else None
+            bands = soil_parameter_bands(class_codes[rows], block_water, lookup)
+            window = Window(0, row0, width, bands[SOIL_BANDS[0]].shape[0])
+            for index, name in enumerate(SOIL_BANDS, start=1):
+                dst.write(bands[name].astype(np.float32), index, window=window)
+
+
+def build_raster_payload(bounds: dict, class_codes: np.ndarray, tile_size: int = RASTER_TILE_SIZE) -> dict:
+    """Payload do runtime: raster de classes em tiles, cada um com sua codificacao."""
+    bits_per_pixel = max(1, int(class_codes.max(initial=0)).bit_length())
     return {
         "farmId": "fazenda-paladino",
         "datasetVersion": DATASET_VERSION_V2,
@@ -231,11 +849,149 @@ def build_raster_payload(bounds: dict, class_codes: np.ndarray) -> dict:
             "3": "bare_soil",
             "4": "water",
         },
-        "classCodesBase64": base64.b64encode(class_codes.tobytes()).decode("ascii"),
+        **encode_tiles(class_codes, tile_size, bits_per_pixel),
     }
 
 
+def sum_blocks(counts: np.ndarray, factor: int = 2) -> np.ndarray:
+    """Soma blocos ``factor`` x ``factor`` das duas primeiras dimensoes.
+
+    Bordas incompletas contam so os elementos existentes; mascaras booleanas viram uint32.
+    """
+    height, width = counts.shape[:2]
+    rest = counts.shape[2:]
+    padded_shape = (-(-height // factor) * factor, -(-width // factor) * factor, *rest)
+    padded = np.zeros(padded_shape, dtype=counts.dtype)
+    padded[:height, :width] = counts
+    blocks = padded.reshape(padded.shape[0] // factor, factor, padded.shape[1] // factor, factor, *rest)
+    return blocks.sum(axis=(1, 3), dtype=np.promote_types(counts.dtype, np.uint32))
+
+
+def mode_from_histograms(counts: np.ndarray) -> np.ndarray:
+    """Classe valida mais frequente de cada pixel (menor codigo no empate); 0 sem pixels validos."""
+    return np.where(counts.any(axis=-1), 1 + np.argmax(counts, axis=-1), 0).astype(np.uint8)
+
+
+def build_class_pyramid(class_codes: np.ndarray, min_size: int = RASTER_TILE_SIZE) -> list[np.ndarray]:
+    """Niveis 2x, 4x, 8x... por moda, ate o nivel caber em ``min_size`` pixels de lado.
+
+    Cada nivel soma os histogramas de classes 2x2 do nivel anterior, entao o pixel do
+    nivel k e a moda exata do bloco 2^k x 2^k do raster original (pixels invalidos,
+    codigo 0, nao votam).
+    """
+    n_classes = len(CLASS_CODE_TO_NAME)
+    levels = []
+    counts = None
+    size = max(class_codes.shape)
+    while size > min_size:
+        if counts is None:
+            counts = np.stack(
+                [sum_blocks(class_codes == code) for code in range(1, n_classes)], axis=-1
+            )
+        else:
+            counts = sum_blocks(counts)
+        levels.append(mode_from_histograms(counts))
+        size = max(counts.shape[:2])
+    return levels
+
+
+def build_pyramid_payload(bounds: dict, class_codes: np.ndarray, tile_size: int = RASTER_TILE_SIZE) -> dict:
+    """Manifesto e tiles das visoes gerais; o nivel 0 e o proprio terrain-bdc-raster."""
+    bits_per_pixel = max(1, int(class_codes.max(initial=0)).bit_length())
+    levels = []
+    for index, level_codes in enumerate(build_class_pyramid(class_codes, tile_size), start=1):
+        levels.append(
+            {
+                "level": index,
+                "factor": 2**index,
+                "width": int(level_codes.shape[1]),
+                "height": int(level_codes.shape[0]),
+                **encode_tiles(level_codes, tile_size, bits_per_pixel),
+            }
+        )
+    return {
+        "farmId": "fazenda-paladino",
+        "datasetVersion": DATASET_VERSION_V2,
+        "bounds": bounds,
+        "width": int(class_codes.shape[1]),
+        "height": int(class_codes.shape[0]),
+        "downsampling": "mode",
+        "baseLevel": "terrain-bdc-raster.json",
+        "levels": levels,
+    }
+
+
+def write_runtime_payload(payload: dict, json_path: Path, js_path: Path, js_global: str) -> None:
+    """Grava o JSON e o gemeo .js carregado pelo index.html, ambos compactos."""
+    text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    with open(json_path, "w", encoding="utf-8") as file:
+        file.write(text)
+    with open(js_path, "w", encoding="utf-8") as file:
+        file.write(f"window.{js_global} = {text};\n")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Inferencia pixelada de parametros de solo a partir do BDC.")
+    parser.add_argument(
+        "--source-dir",
+        type=Path,
+        default=None,
+        help="Diretorio com NDVI/SCL ja baixados (nome do arquivo da URL ou NDVI.tif/SCL.tif).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=COG_CACHE_DIR,
+        help="Cache local dos blocos dos COGs que cobrem a fazenda.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Nao acessa a rede: usa apenas --source-dir ou blocos ja presentes no cache.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Le os COGs direto via /vsicurl/, sem gravar nem consultar o cache.",
+    )
+    parser.add_argument(
+        "--water-content",
+        type=Path,
+        default=None,
+        help="GeoTIFF de umidade volumetrica (m3/m3) por pixel; sem ele usa a umidade da tabela por classe.",
+    )
+    parser.add_argument(
+        "--soil-out",
+        type=Path,
+        default=SOIL_PATH,
+        help="GeoTIFF multibanda com os parametros de solo por pixel.",
+    )
+    parser.add_argument(
+        "--grid-sizes-m",
+        default=",".join(str(size) for size in GRID_LEVEL_SIZES_M),
+        help=(
+            "Resolucoes das grades aninhadas em metros, separadas por virgula (vazio desativa); "
+            "cada uma gera terrain-grid-<N>m.json."
+        ),
+    )
+    args = parser.parse_args()
+    try:
+        args.grid_sizes_m = sorted({int(size) for size in args.grid_sizes_m.split(",") if size.strip()})
+    except ValueError:
+        parser.error(f"--grid-sizes-m invalido: {args.grid_sizes_m}")
+    if any(size <= 0 for size in args.grid_sizes_m):
+        parser.error("--grid-sizes-m aceita apenas resolucoes positivas.")
+    if args.grid_sizes_m and any(size % args.grid_sizes_m[0] for size in args.grid_sizes_m):
+        parser.error("--grid-sizes-m: cada resolucao deve ser multipla da mais fina.")
+    if args.water_content is not None and not args.water_content.exists():
+        parser.error(f"--water-content nao encontrado: {args.water_content}")
+    if args.offline and args.no_cache and args.source_dir is None:
+        parser.error("--offline com --no-cache exige --source-dir.")
+    return args
+
+
 def main():
+    args = parse_args()
     print("Carregando terrain-sources.json...")
     with open(SOURCES_PATH, encoding="utf-8") as file:
         sources = json.load(file)
@@ -255,12 +1011,12 @@ def main():
     print(f"  observacao: {obs['itemId']} ({obs['datetime'][:10]})")
     print(f"  celulas operacionais: {len(cells)}")
 
-    ndvi_vsicurl = f"/vsicurl/{ndvi_url}"
-    scl_vsicurl = f"/vsicurl/{scl_url}"
-    print("\nLendo recorte completo do BDC via /vsicurl/...")
+    print("\nLendo recorte completo do BDC...")
 
     try:
-        with rasterio.open(ndvi_vsicurl) as src_ndvi, rasterio.open(scl_vsicurl) as src_scl:
+        with ExitStack() as stack:
+            src_ndvi = open_asset("NDVI", ndvi_url, farm_bounds, args, stack)
+            src_scl = open_asset("SCL", scl_url, farm_bounds, args, stack)
             t_ndvi = Transformer.from_crs("EPSG:4326", src_ndvi.crs, always_xy=True)
             t_scl = Transformer.from_crs("EPSG:4326", src_scl.crs, always_xy=True)
 
@@ -269,23 +1025,22 @@ def main():
             ndvi_window = from_bounds(*ndvi_bounds, transform=src_ndvi.transform).round_offsets().round_lengths()
             scl_window = from_bounds(*scl_bounds, transform=src_scl.transform).round_offsets().round_lengths()
 
-            ndvi_data = src_ndvi.read(1, window=ndvi_window, masked=True)
-            scl_data = src_scl.read(1, window=scl_window, masked=True)
-
-            if ndvi_data.shape != scl_data.shape:
-                sys.exit(
-                    f"ERRO: NDVI e SCL com shapes diferentes no recorte ({ndvi_data.shape} vs {scl_data.shape})"
-                )
+            crop_shape = (int(scl_window.height), int(scl_window.width))
+            ndvi_shape = (int(ndvi_window.height), int(ndvi_window.width))
+            if ndvi_shape != crop_shape:
+                sys.exit(f"ERRO: NDVI e SCL com shapes diferentes no recorte ({ndvi_shape} vs {crop_shape})")
 
-            class_codes = classify_full_raster(ndvi_data, scl_data)
+            class_codes = np.empty(crop_shape, dtype=np.uint8)
+            for row0, block_codes in iter_classified_blocks(src_ndvi, src_scl, ndvi_window, scl_window):
+                class_codes[row0 : row0 + block_codes.shape[0]] = block_codes
             crop_transform = window_transform(scl_window, src_scl.transform)
-            grid_observations = [
-                aggregate_cell_class(class_codes, cell["bounds"], t_scl, crop_transform)
-                for cell in cells
-            ]
+            crop_crs = src_scl.crs
+            grid_observations = aggregate_grid_cells(
+                class_codes, [cell["bounds"] for cell in cells], t_scl, crop_transform
+            )
 
     except Exception as error:
-        sys.exit(f"ERRO ao acessar COGs via /vsicurl/: {error}")
+        sys.exit(f"ERRO ao acessar NDVI/SCL do BDC: {error}")
 
     print(
         f"  raster local: {class_codes.shape[1]} colunas x {class_codes.shape[0]} linhas "
@@ -298,24 +1053,11 @@ def main():
 
     for cell, (dominant_code, stats) in zip(cells, grid_observations):
         cell_id = cell["cellId"]
-        snapshot, provenance = class_code_snapshot(dominant_code, cell_id)
+        entry = grid_cell_entry(cell_id, cell["center"], cell["bounds"], dominant_code, stats)
+        snapshot = entry["terrainSnapshotBase"]
         if snapshot["sigma_p"] is not None:
             sigma_p_count += 1
-
-        enriched_cells.append(
-            {
-                "cellId": cell_id,
-                "datasetVersion": DATASET_VERSION_V2,
-                "center": cell["center"],
-                "bounds": cell["bounds"],
-                "thematicClass": {
-                    "source": "bdc-raster-pixel-derived",
-                    "value": snapshot["thematic_class"],
-                },
-                "terrainSnapshotBase": snapshot,
-                "provenance": provenance,
-            }
-        )
+        enriched_cells.append(entry)
 
         print(
             f"  {cell_id}: class={snapshot['thematic_class'] or 'invalid'} "
@@ -323,10 +1065,22 @@ def main():
         )
 
     raster_payload = build_raster_payload(farm_bounds, class_codes)
-    print(f"\nGravando {RASTER_PATH}...")
-    with open(RASTER_PATH, "w", encoding="utf-8") as file:
-        json.dump(raster_payload, file, ensure_ascii=False, indent=2)
-    print("  OK")
+    print(f"\nGravando {RASTER_PATH} e {RASTER_JS_PATH.name}...")
+    write_runtime_payload(raster_payload, RASTER_PATH, RASTER_JS_PATH, RASTER_JS_GLOBAL)
+    print(f"  OK ({len(raster_payload['tiles'])} tiles)")
+
+    pyramid_payload = build_pyramid_payload(farm_bounds, class_codes)
+    print(f"Gravando {PYRAMID_PATH} e {PYRAMID_JS_PATH.name}...")
+    write_runtime_payload(pyramid_payload, PYRAMID_PATH, PYRAMID_JS_PATH, PYRAMID_JS_GLOBAL)
+    print(f"  OK ({len(pyramid_payload['levels'])} niveis)")
+
+    water_content = None
+    if args.water_content is not None:
+        print(f"Reamostrando umidade por pixel de {args.water_content}...")
+        water_content = read_water_content(args.water_content, crop_crs, crop_transform, class_codes.shape)
+    print(f"Gravando {args.soil_out}...")
+    write_soil_raster(args.soil_out, class_codes, crop_crs, crop_transform, water_content)
+    print(f"  OK ({len(SOIL_BANDS)} bandas: {', '.join(SOIL_BANDS)})")
 
     grid_v2 = {
         "farmId": grid["farmId"],
@@ -340,15 +1094,35 @@ def main():
         json.dump(grid_v2, file, ensure_ascii=False, indent=2)
     print("  OK")
 
+    if args.grid_sizes_m:
+        print(f"Derivando grades aninhadas ({', '.join(f'{size} m' for size in args.grid_sizes_m)})...")
+        try:
+            level_histograms = nested_grid_histograms(class_codes, crop_transform.a, args.grid_sizes_m)
+        except ValueError as error:
+            sys.exit(f"ERRO: {error}")
+        for size in args.grid_sizes_m:
+            level = build_grid_level(
+                size, level_histograms[size], crop_transform, crop_crs, class_codes.shape, farm_bounds
+            )
+            path = grid_level_path(size)
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(level, file, ensure_ascii=False, separators=(",", ":"))
+            print(f"  {path.name}: {level['rows']} x {level['cols']} celulas")
+
     inference_chain = {
         "observation_item_id": obs["itemId"],
         "observation_date": obs["datetime"][:10],
         "observation_season": "final do periodo chuvoso (marco)",
         "assets_used": ["NDVI", "SCL"],
-        "ndvi_scale_factor": 10000,
+        "ndvi_scale_factor": NDVI_SCALE,
         "pixel_processing": "classificacao pixel a pixel no recorte operacional completo",
-        "raster_runtime_product": "terrain-bdc-raster.json (classCodesBase64 + bounds + width + height)",
+        "raster_runtime_product": "terrain-bdc-raster.json (tiles RLE/bitpack + tileEncoding + bounds)",
+        "soil_raster_product": f"terrain-bdc-soil.tif (float32 por pixel: {', '.join(SOIL_BANDS)})",
+        "soil_raster_water_content": (
+            f"por pixel ({args.water_content.name})" if args.water_content else "tabela por classe"
+        ),
         "grid_compatibility": "terrain-grid.json derivado por agregacao do raster apenas para missao/exportacao",
+        "grid_levels": [grid_level_path(size).name for size in args.grid_sizes_m],
         "classification": (
             "SCL + NDVI threshold: "
             "SCL=4 NDVI>=0.5 -> vegetation_dense; "
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+verificar-tiles-bdc.py
+Ida e volta da codificacao de tiles do raster BDC
+
+Codifica rasters sinteticos com ``encode_tiles`` de enriquecer-grade-bdc.py e os
+decodifica no node com ``src/domains/terrain.js`` (o mesmo codigo do runtime):
+tile a tile (``decodeTerrainTileAt``), o raster inteiro (``getTerrainClassCodes``)
+e pixel a pixel pelo cache de tiles (``resolveTerrainPixel``). Os casos cobrem
+tiles constantes, RLE (inclusive sequencias com varints de varios bytes),
+bitpack e tiles de borda incompletos.
+
+    python prototipo/scripts/verificar-tiles-bdc.py
+
+Sai com codigo 1 se alguma decodificacao divergir dos codigos originais.
+"""
+
+import base64
+import importlib.util
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+ENCODER_PATH = BASE_DIR / "scripts" / "enriquecer-grade-bdc.py"
+RUNTIME_SOURCES = (BASE_DIR / "src" / "core" / "bootstrap.js", BASE_DIR / "src" / "domains" / "terrain.js")
+
+NODE_DECODER = r"""
+const fs = require("fs");
+const vm = require("vm");
+const input = JSON.parse(fs.readFileSync(0, "utf8"));
+const context = { atob: (value) => Buffer.from(value, "base64").toString("binary") };
+context.window = context;
+vm.createContext(context);
+input.sources.forEach((path) => vm.runInContext(fs.readFileSync(path, "utf8"), context, { filename: path }));
+const terrain = context.SoloCompactado.getModule("domains", "terrain");
+const encode = (codes) => Buffer.from(codes.buffer, codes.byteOffset, codes.length).toString("base64");
+
+const results = input.rasters.map((raster) => {
+  const tiled = new Uint8Array(raster.width * raster.height);
+  const pixels = new Uint8Array(raster.width * raster.height);
+  const hydrated = terrain.hydrateTerrainRaster(raster);
+
+  for (let tileRow = 0; tileRow < raster.tileEncoding.tilesY; tileRow += 1) {
+    for (let tileCol = 0; tileCol < raster.tileEncoding.tilesX; tileCol += 1) {
+      const tile = terrain.decodeTerrainTileAt(raster, tileRow, tileCol);
+      for (let row = 0; row < tile.height; row += 1) {
+        tiled.set(
+          tile.codes.subarray(row * tile.width, (row + 1) * tile.width),
+          (tile.row0 + row) * raster.width + tile.col0
+        );
+      }
+    }
+  }
+  for (let row = 0; row < raster.height; row += 1) {
+    for (let col = 0; col < raster.width; col += 1) {
+      const pixel = terrain.resolveTerrainPixel({ lat: raster.height - row - 0.5, lng: col + 0.5 }, hydrated);
+      pixels[pixel.index] = pixel.class_code;
+    }
+  }
+  return {
+    tiles: encode(tiled),
+    pixels: encode(pixels),
+    full: encode(terrain.getTerrainClassCodes(hydrated))
+  };
+});
+process.stdout.write(JSON.stringify(results));
+"""
+
+
+def load_encoder():
+    spec = importlib.util.spec_from_file_location("enriquecer_grade_bdc", ENCODER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_cases() -> list[tuple[str, np.ndarray, int, set[str]]]:
+    """(nome, codigos, tileSize, codificacoes que o caso precisa exercitar)."""
+    rng = np.random.default_rng(47)
+
+    constant = np.full((300, 300), 3, dtype=np.uint8)
+
+    # Faixas longas: RLE ganha do bitpack e as sequencias passam de 2^14 pixels.
+    long_runs = np.ones((256, 256), dtype=np.uint8)
+    long_runs.reshape(-1)[40000:] = 2
+    long_runs[-1, -1] = 4
+
+    noise = rng.integers(0, 5, size=(256, 256), dtype=np.uint8)
+
+    # 257 x 130 com tiles de 64: ultima coluna de tiles com 1 pixel e ultima linha com 2.
+    ragged = np.repeat(rng.integers(1, 5, size=(130, 1), dtype=np.uint8), 257, axis=1)
+    ragged[:, 64:128] = rng.integers(0, 5, size=(130, 64), dtype=np.uint8)
+    ragged[:64, 128:192] = 2
+    ragged[128:, :] = rng.integers(0, 5, size=(2, 257), dtype=np.uint8)
+
+    # Mais tiles que o cache do runtime: a leitura pixel a pixel passa por descartes do LRU.
+    binary = (rng.random((70, 90)) < 0.5).astype(np.uint8)
+
+    return [
+        ("constante", constant, 256, {"constant"}),
+        ("rle", long_runs, 256, {"rle"}),
+        ("bitpack", noise, 256, {"bitpack"}),
+        ("borda", ragged, 64, {"constant", "rle", "bitpack"}),
+        ("1 bit", binary, 16, {"bitpack"}),
+    ]
+
+
+def main():
+    node = shutil.which("node")
+    if node is None:
+        sys.exit("node nao encontrado no PATH.")
+
+    encoder = load_encoder()
+    cases = synthetic_cases()
+    rasters = []
+    for name, codes, tile_size, expected_kinds in cases:
+        raster = encoder.build_raster_payload({}, codes, tile_size)
+        height, width = codes.shape
+        raster["bounds"] = {"west": 0.0, "east": float(width), "south": 0.0, "north": float(height)}
+        kinds = {tile[0] for tile in raster["tiles"]}
+        if not expected_kinds <= kinds:
+            sys.exit(f"Caso {name}: esperava tiles {sorted(expected_kinds)}, codificou {sorted(kinds)}.")
+        rasters.append(raster)
+
+    completed = subprocess.run(
+        [node, "-e", NODE_DECODER],
+        input=json.dumps({"sources": [str(path) for path in RUNTIME_SOURCES], "rasters": rasters}),
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        sys.exit(f"Decodificador JS falhou:\n{completed.stderr}")
+
+    failures = 0
+    for (name, codes, tile_size, _), raster, result in zip(cases, rasters, json.loads(completed.stdout)):
+        expected = codes.reshape(-1)
+        kinds = sorted({tile[0] for tile in raster["tiles"]})
+        for path, encoded in result.items():
+            decoded = np.frombuffer(base64.b64decode(encoded), dtype=np.uint8)
+            if decoded.size != expected.size:
+                mismatches = expected.size
+            else:
+                mismatches = int(np.count_nonzero(decoded != expected))
+            if mismatches:
+                failures += 1
+                print(f"[FALHA] {name} ({path}): {mismatches} pixels divergentes")
+        print(
+            f"{name}: {codes.shape[1]}x{codes.shape[0]}, tile {tile_size}, "
+            f"{len(raster['tiles'])} tiles ({', '.join(kinds)})"
+        )
+
+    if failures:
+        sys.exit(1)
+    print("Ida e volta Python -> JS sem divergencias.")
+
+
+if __name__ == "__main__":
+    main()
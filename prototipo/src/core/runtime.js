@@ -31,6 +31,7 @@
       datasetError: null,
       terrainGrid: null,
       terrainRaster: null,
+      terrainPyramid: null,
       terrainManifest: null,
       mission: null,
       currentCell: null,
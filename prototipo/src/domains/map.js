@@ -17,30 +17,59 @@
     };
   }
 
-  function buildBdcOverlay(raster) {
+  // Tiles da piramide BDC mantidos prontos (canvas ja convertido) fora da vista.
+  var BDC_PYRAMID_TILE_CACHE_LIMIT = 48;
+
+  function buildBdcPalette() {
+    var palette = new Uint8ClampedArray(256 * 4);
+    var code;
+    var thematic;
+    var style;
+    var rgb;
+
+    for (code = 0; code < 256; code += 1) {
+      thematic = code === 1 ? "vegetation_dense" : code === 2 ? "vegetation_sparse" : code === 3 ? "bare_soil" : code === 4 ? "water" : "_invalid";
+      style = BDC_THEMATIC_COLORS[thematic] || BDC_THEMATIC_COLORS._invalid;
+      rgb = hexToRgb(style.color);
+      palette[code * 4] = rgb.r;
+      palette[code * 4 + 1] = rgb.g;
+      palette[code * 4 + 2] = rgb.b;
+      palette[code * 4 + 3] = Math.round(style.fillOpacity * 255);
+    }
+
+    return palette;
+  }
+
+  function paintClassCodes(codes, width, height, palette) {
     var canvas = document.createElement("canvas");
     var context;
     var imageData;
     var index;
+    var paletteIndex;
+    var pixelIndex;
 
-    canvas.width = raster.width;
-    canvas.height = raster.height;
+    canvas.width = width;
+    canvas.height = height;
     context = canvas.getContext("2d");
-    imageData = context.createImageData(raster.width, raster.height);
-
-    for (index = 0; index < raster.classCodes.length; index += 1) {
-      var code = raster.classCodes[index];
-      var thematic = code === 1 ? "vegetation_dense" : code === 2 ? "vegetation_sparse" : code === 3 ? "bare_soil" : code === 4 ? "water" : "_invalid";
-      var style = BDC_THEMATIC_COLORS[thematic] || BDC_THEMATIC_COLORS._invalid;
-      var rgb = hexToRgb(style.color);
-      var pixelIndex = index * 4;
-      imageData.data[pixelIndex] = rgb.r;
-      imageData.data[pixelIndex + 1] = rgb.g;
-      imageData.data[pixelIndex + 2] = rgb.b;
-      imageData.data[pixelIndex + 3] = Math.round(style.fillOpacity * 255);
+    imageData = context.createImageData(width, height);
+
+    for (index = 0; index < codes.length; index += 1) {
+      paletteIndex = codes[index] * 4;
+      pixelIndex = index * 4;
+      imageData.data[pixelIndex] = palette[paletteIndex];
+      imageData.data[pixelIndex + 1] = palette[paletteIndex + 1];
+      imageData.data[pixelIndex + 2] = palette[paletteIndex + 2];
+      imageData.data[pixelIndex + 3] = palette[paletteIndex + 3];
     }
 
     context.putImageData(imageData, 0, 0);
+    return canvas;
+  }
+
+  function buildBdcOverlay(raster) {
+    var terrainModule = app.getModule("domains", "terrain");
+    var codes = terrainModule.getTerrainClassCodes(raster);
+    var canvas = paintClassCodes(codes, raster.width, raster.height, buildBdcPalette());
     return global.L.imageOverlay(
       canvas.toDataURL("image/png"),
       [[raster.bounds.south, raster.bounds.west], [raster.bounds.north, raster.bounds.east]],
@@ -48,6 +77,166 @@
     );
   }
 
+  function isPyramidCompatible(raster, pyramid) {
+    return Boolean(
+      pyramid &&
+        Array.isArray(pyramid.levels) &&
+        pyramid.datasetVersion === raster.datasetVersion &&
+        pyramid.width === raster.width &&
+        pyramid.height === raster.height
+    );
+  }
+
+  function createBdcPyramidOverlay(map, raster, pyramid) {
+    var terrainModule = app.getModule("domains", "terrain");
+    var palette = buildBdcPalette();
+    var bounds = raster.bounds;
+    var layer = global.L.layerGroup();
+    var tileSize = pyramid.levels.length ? pyramid.levels[0].tileEncoding.tileSize : 256;
+    var levels = [
+      {
+        factor: 1,
+        width: raster.width,
+        height: raster.height,
+        tileSize: tileSize,
+        decodeTile: function decodeBaseTile(tileRow, tileCol) {
+          var row0 = tileRow * tileSize;
+          var col0 = tileCol * tileSize;
+          var width = Math.min(tileSize, raster.width - col0);
+          var height = Math.min(tileSize, raster.height - row0);
+          var codes;
+          var classCodes;
+          var start;
+          var row;
+
+          if (raster.tileEncoding && raster.tileEncoding.tileSize === tileSize && !raster.classCodes) {
+            // Mesmo recorte de tile do raster: decodifica so este tile (as camadas ja ficam em cache).
+            return terrainModule.decodeTerrainTileAt(raster, tileRow, tileCol);
+          }
+          classCodes = terrainModule.getTerrainClassCodes(raster);
+          codes = new Uint8Array(width * height);
+          for (row = 0; row < height; row += 1) {
+            start = (row0 + row) * raster.width + col0;
+            codes.set(classCodes.subarray(start, start + width), row * width);
+          }
+          return { width: width, height: height, codes: codes };
+        }
+      }
+    ].concat(
+      pyramid.levels.map(function (level) {
+        return {
+          factor: level.factor,
+          width: level.width,
+          height: level.height,
+          tileSize: level.tileEncoding.tileSize,
+          decodeTile: function decodePyramidTile(tileRow, tileCol) {
+            return terrainModule.decodeTerrainTileAt(level, tileRow, tileCol);
+          }
+        };
+      })
+    );
+    var tileOverlays = {};
+    var cacheOrder = [];
+
+    function chooseLevel() {
+      var west = map.latLngToLayerPoint([bounds.north, bounds.west]);
+      var east = map.latLngToLayerPoint([bounds.north, bounds.east]);
+      var screenPixelsPerRasterPixel = Math.abs(east.x - west.x) / raster.width;
+      var chosen = levels[0];
+
+      levels.forEach(function (level) {
+        if (level.factor * screenPixelsPerRasterPixel <= 1) {
+          chosen = level;
+        }
+      });
+      return chosen;
+    }
+
+    function tileLatLngBounds(level, tileRow, tileCol) {
+      var span = level.tileSize * level.factor;
+      var row0 = (tileRow * span) / raster.height;
+      var row1 = Math.min((tileRow + 1) * span, raster.height) / raster.height;
+      var col0 = (tileCol * span) / raster.width;
+      var col1 = Math.min((tileCol + 1) * span, raster.width) / raster.width;
+      var latSpan = bounds.north - bounds.south;
+      var lngSpan = bounds.east - bounds.west;
+
+      return global.L.latLngBounds(
+        [bounds.north - row1 * latSpan, bounds.west + col0 * lngSpan],
+        [bounds.north - row0 * latSpan, bounds.west + col1 * lngSpan]
+      );
+    }
+
+    function getTileOverlay(level, tileRow, tileCol) {
+      var key = level.factor + ":" + tileRow + ":" + tileCol;
+      var tile;
+      var position = cacheOrder.indexOf(key);
+
+      if (position >= 0) {
+        cacheOrder.splice(position, 1);
+      } else {
+        tile = level.decodeTile(tileRow, tileCol);
+        tileOverlays[key] = global.L.imageOverlay(
+          paintClassCodes(tile.codes, tile.width, tile.height, palette).toDataURL("image/png"),
+          tileLatLngBounds(level, tileRow, tileCol),
+          { interactive: false, opacity: 1 }
+        );
+      }
+      cacheOrder.push(key);
+      return tileOverlays[key];
+    }
+
+    function refresh() {
+      var level;
+      var view;
+      var visible = [];
+      var tileRow;
+      var tileCol;
+      var evicted;
+
+      if (!map.hasLayer(layer)) {
+        return;
+      }
+
+      level = chooseLevel();
+      view = map.getBounds();
+      for (tileRow = 0; tileRow * level.tileSize < level.height; tileRow += 1) {
+        for (tileCol = 0; tileCol * level.tileSize < level.width; tileCol += 1) {
+          if (view.intersects(tileLatLngBounds(level, tileRow, tileCol))) {
+            visible.push(getTileOverlay(level, tileRow, tileCol));
+          }
+        }
+      }
+
+      layer.eachLayer(function (overlay) {
+        if (visible.indexOf(overlay) < 0) {
+          layer.removeLayer(overlay);
+        }
+      });
+      visible.forEach(function (overlay) {
+        if (!layer.hasLayer(overlay)) {
+          layer.addLayer(overlay);
+        }
+      });
+
+      while (cacheOrder.length > Math.max(BDC_PYRAMID_TILE_CACHE_LIMIT, visible.length)) {
+        evicted = tileOverlays[cacheOrder.shift()];
+        if (layer.hasLayer(evicted)) {
+          layer.removeLayer(evicted);
+        }
+      }
+      Object.keys(tileOverlays).forEach(function (key) {
+        if (cacheOrder.indexOf(key) < 0) {
+          delete tileOverlays[key];
+        }
+      });
+    }
+
+    map.on("zoomend moveend", refresh);
+    layer.on("add", refresh);
+    return layer;
+  }
+
   function createMapDomain(config) {
     var runtime = config.runtime;
     var plannerView = runtime.coveragePlanner.view;
@@ -133,7 +322,7 @@
       var nextMode = mode === "bdc" ? "bdc" : "imagery";
       var raster = runtime.terrainRaster;
 
-      if (nextMode === "bdc" && (!raster || !raster.classCodes || !raster.classCodes.length)) {
+      if (nextMode === "bdc" && !app.getModule("domains", "terrain").hasTerrainClassCodes(raster)) {
         config.pushUiMessage("Camada BDC indisponivel ate o carregamento do dataset.", 2200);
         config.renderHud();
         return;
@@ -141,7 +330,9 @@
 
       if (nextMode === "bdc") {
         if (!bdcOverlayLayer && raster) {
-          bdcOverlayLayer = buildBdcOverlay(raster);
+          bdcOverlayLayer = isPyramidCompatible(raster, runtime.terrainPyramid)
+            ? createBdcPyramidOverlay(map, raster, runtime.terrainPyramid)
+            : buildBdcOverlay(raster);
         }
         if (imageryBaseLayer && map.hasLayer(imageryBaseLayer)) {
           map.removeLayer(imageryBaseLayer);
@@ -173,11 +364,7 @@
       plannerView.imagery_failed = true;
       runtime.mapTileFailed = true;
 
-      rasterReady = Boolean(
-        runtime.terrainRaster &&
-          runtime.terrainRaster.classCodes &&
-          runtime.terrainRaster.classCodes.length
-      );
+      rasterReady = app.getModule("domains", "terrain").hasTerrainClassCodes(runtime.terrainRaster);
 
       if (plannerView.map_base === "imagery" && rasterReady) {
         setMapBase("bdc");
@@ -7,6 +7,8 @@
     3: "bare_soil",
     4: "water"
   };
+  // Tiles lidos mantidos por raster (LRU); a consulta por posicao toca poucos tiles vizinhos.
+  var TERRAIN_TILE_CACHE_SIZE = 16;
   var BDC_SOIL_LOOKUP = {
     vegetation_dense: { clay_content: 0.45, water_content: 0.35, bulk_density: 1.15 },
     vegetation_sparse: { clay_content: 0.35, water_content: 0.28, bulk_density: 1.30 },
@@ -50,8 +52,150 @@
     return result;
   }
 
+  function decodeRunLengthTile(bytes, pixelCount, bitsPerPixel) {
+    // Varints de um tile cabem em 31 bits: comprimento <= tileSize^2 deslocado por bitsPerPixel.
+    var result = new Uint8Array(pixelCount);
+    var codeMask = (1 << bitsPerPixel) - 1;
+    var offset = 0;
+    var position = 0;
+    var value;
+    var shift;
+    var byte;
+    var code;
+    var end;
+
+    while (offset < bytes.length) {
+      value = 0;
+      shift = 0;
+      do {
+        byte = bytes[offset];
+        offset += 1;
+        value |= (byte & 0x7f) << shift;
+        shift += 7;
+      } while (byte & 0x80);
+      code = value & codeMask;
+      end = position + (value >>> bitsPerPixel) + 1;
+      if (end > pixelCount) {
+        break;
+      }
+      if (end - position > 32) {
+        result.fill(code, position, end);
+        position = end;
+      } else {
+        while (position < end) {
+          result[position] = code;
+          position += 1;
+        }
+      }
+    }
+
+    if (position !== pixelCount) {
+      throw new Error("Tile RLE do raster BDC com tamanho inconsistente.");
+    }
+    return result;
+  }
+
+  function readBitPackedCode(bytes, index, bitsPerPixel, mask) {
+    var bitIndex = index * bitsPerPixel;
+    var byteIndex = bitIndex >> 3;
+
+    return ((bytes[byteIndex] | (bytes[byteIndex + 1] << 8)) >> (bitIndex & 7)) & mask;
+  }
+
+  function decodeBitPackedTile(bytes, pixelCount, bitsPerPixel) {
+    var result = new Uint8Array(pixelCount);
+    var mask = (1 << bitsPerPixel) - 1;
+    var index;
+
+    if (bytes.length * 8 < pixelCount * bitsPerPixel) {
+      throw new Error("Tile bitpack do raster BDC com tamanho inconsistente.");
+    }
+    for (index = 0; index < pixelCount; index += 1) {
+      result[index] = readBitPackedCode(bytes, index, bitsPerPixel, mask);
+    }
+    return result;
+  }
+
+  function decodeTerrainTile(tile, pixelCount, bitsPerPixel) {
+    if (tile[0] === "constant") {
+      return new Uint8Array(pixelCount).fill(tile[1]);
+    }
+    if (tile[0] === "rle") {
+      return decodeRunLengthTile(decodeBase64ToUint8Array(tile[1]), pixelCount, bitsPerPixel);
+    }
+    if (tile[0] === "bitpack") {
+      return decodeBitPackedTile(decodeBase64ToUint8Array(tile[1]), pixelCount, bitsPerPixel);
+    }
+    throw new Error("Codificacao de tile desconhecida no raster BDC: " + tile[0]);
+  }
+
+  function decodeTerrainTileAt(raster, tileRow, tileCol) {
+    var encoding = raster.tileEncoding;
+    var tileSize = encoding.tileSize;
+    var row0 = tileRow * tileSize;
+    var col0 = tileCol * tileSize;
+    var width = Math.min(tileSize, raster.width - col0);
+    var height = Math.min(tileSize, raster.height - row0);
+
+    return {
+      row0: row0,
+      col0: col0,
+      width: width,
+      height: height,
+      codes: decodeTerrainTile(
+        raster.tiles[tileRow * encoding.tilesX + tileCol],
+        width * height,
+        encoding.bitsPerPixel
+      )
+    };
+  }
+
+  function decodeTiledClassCodes(raster) {
+    var codes = new Uint8Array(raster.width * raster.height);
+    var tileRow;
+    var tileCol;
+    var tile;
+    var row;
+
+    for (tileRow = 0; tileRow < raster.tileEncoding.tilesY; tileRow += 1) {
+      for (tileCol = 0; tileCol < raster.tileEncoding.tilesX; tileCol += 1) {
+        tile = decodeTerrainTileAt(raster, tileRow, tileCol);
+        for (row = 0; row < tile.height; row += 1) {
+          codes.set(
+            tile.codes.subarray(row * tile.width, (row + 1) * tile.width),
+            (tile.row0 + row) * raster.width + tile.col0
+          );
+        }
+      }
+    }
+
+    return codes;
+  }
+
+  function hasTiledClassCodes(raster) {
+    return Boolean(
+      raster.tileEncoding &&
+        Array.isArray(raster.tiles) &&
+        raster.tiles.length === raster.tileEncoding.tilesX * raster.tileEncoding.tilesY
+    );
+  }
+
   function hydrateTerrainRaster(raster) {
-    var codes = decodeBase64ToUint8Array(raster.classCodesBase64);
+    var codes;
+
+    if (typeof raster.classCodesBase64 !== "string") {
+      // Raster em tiles: decodifica sob demanda em readTerrainClassCode; o raster inteiro
+      // so e montado por getTerrainClassCodes (camada BDC sem piramide).
+      if (!hasTiledClassCodes(raster)) {
+        throw new Error("Raster BDC local com dimensoes inconsistentes.");
+      }
+      return Object.assign({}, raster, {
+        classCodes: null,
+        tileCache: new Map()
+      });
+    }
+
+    codes = decodeBase64ToUint8Array(raster.classCodesBase64);
     if (codes.length !== raster.width * raster.height) {
       throw new Error("Raster BDC local com dimensoes inconsistentes.");
     }
@@ -61,6 +205,87 @@
     });
   }
 
+  function hasTerrainClassCodes(raster) {
+    return Boolean(raster && ((raster.classCodes && raster.classCodes.length) || raster.tileCache));
+  }
+
+  function getTerrainClassCodes(raster) {
+    if (!raster.classCodes) {
+      raster.classCodes = decodeTiledClassCodes(raster);
+    }
+    return raster.classCodes;
+  }
+
+  function loadTerrainTileEntry(raster, tileRow, tileCol) {
+    var encoding = raster.tileEncoding;
+    var tile = raster.tiles[tileRow * encoding.tilesX + tileCol];
+    var row0 = tileRow * encoding.tileSize;
+    var col0 = tileCol * encoding.tileSize;
+    var width = Math.min(encoding.tileSize, raster.width - col0);
+    var height = Math.min(encoding.tileSize, raster.height - row0);
+    var entry = {
+      row0: row0,
+      col0: col0,
+      width: width,
+      height: height,
+      constant: null,
+      packed: null,
+      codes: null
+    };
+
+    if (tile[0] === "constant") {
+      entry.constant = tile[1];
+    } else if (tile[0] === "bitpack") {
+      // Mantem os bytes empacotados: ler um pixel e O(1) e evita desempacotar o tile inteiro.
+      entry.packed = decodeBase64ToUint8Array(tile[1]);
+      if (entry.packed.length * 8 < width * height * encoding.bitsPerPixel) {
+        throw new Error("Tile bitpack do raster BDC com tamanho inconsistente.");
+      }
+    } else {
+      entry.codes = decodeTerrainTile(tile, width * height, encoding.bitsPerPixel);
+    }
+    return entry;
+  }
+
+  function readTerrainTileEntry(raster, tileRow, tileCol) {
+    var key = tileRow * raster.tileEncoding.tilesX + tileCol;
+    var entry = raster.tileCache.get(key);
+
+    if (entry) {
+      // Reinsere para manter a ordem de uso do Map (LRU).
+      raster.tileCache.delete(key);
+    } else {
+      entry = loadTerrainTileEntry(raster, tileRow, tileCol);
+      if (raster.tileCache.size >= TERRAIN_TILE_CACHE_SIZE) {
+        raster.tileCache.delete(raster.tileCache.keys().next().value);
+      }
+    }
+    raster.tileCache.set(key, entry);
+    return entry;
+  }
+
+  function readTerrainClassCode(raster, row, col) {
+    var encoding;
+    var tileSize;
+    var entry;
+    var index;
+
+    if (raster.classCodes) {
+      return raster.classCodes[row * raster.width + col];
+    }
+    encoding = raster.tileEncoding;
+    tileSize = encoding.tileSize;
+    entry = readTerrainTileEntry(raster, Math.floor(row / tileSize), Math.floor(col / tileSize));
+    if (entry.constant !== null) {
+      return entry.constant;
+    }
+    index = (row - entry.row0) * entry.width + (col - entry.col0);
+    if (entry.packed) {
+      return readBitPackedCode(entry.packed, index, encoding.bitsPerPixel, (1 << encoding.bitsPerPixel) - 1);
+    }
+    return entry.codes[index];
+  }
+
   function validateDatasets(grid, raster, manifest) {
     var invalidCell;
 
@@ -92,7 +317,7 @@
       typeof raster.width !== "number" ||
       typeof raster.height !== "number" ||
       !raster.bounds ||
-      typeof raster.classCodesBase64 !== "string"
+      (typeof raster.classCodesBase64 !== "string" && !hasTiledClassCodes(raster))
     ) {
       return { valid: false, reason: "Raster BDC local invalido." };
     }
@@ -172,7 +397,7 @@
     col = Math.min(raster.width - 1, Math.max(0, Math.floor(xRatio * raster.width)));
     row = Math.min(raster.height - 1, Math.max(0, Math.floor(yRatio * raster.height)));
     index = row * raster.width + col;
-    classCode = raster.classCodes[index];
+    classCode = readTerrainClassCode(raster, row, col);
     thematicClass = BDC_CLASS_CODE_TO_NAME[classCode] || null;
 
     return {
@@ -221,11 +446,21 @@
     loadTerrainRaster: function loadTerrainRaster() {
       return cloneDataset(global.__SOLO_TERRAIN_BDC_RASTER__, "data/terrain-bdc-raster.js");
     },
+    loadTerrainPyramid: function loadTerrainPyramid() {
+      // Opcional: sem a piramide o mapa desenha o raster inteiro numa unica camada.
+      return global.__SOLO_TERRAIN_BDC_PYRAMID__
+        ? cloneDataset(global.__SOLO_TERRAIN_BDC_PYRAMID__, "data/terrain-bdc-pyramid.js")
+        : null;
+    },
     loadTerrainSources: function loadTerrainSources() {
       return cloneDataset(global.__SOLO_TERRAIN_SOURCES__, "data/terrain-sources.js");
     },
     validateDatasets: validateDatasets,
     hydrateTerrainRaster: hydrateTerrainRaster,
+    hasTerrainClassCodes: hasTerrainClassCodes,
+    getTerrainClassCodes: getTerrainClassCodes,
+    decodeTerrainTile: decodeTerrainTile,
+    decodeTerrainTileAt: decodeTerrainTileAt,
     resolveTerrainPixel: resolveTerrainPixel,
     resolveCell: resolveCell,
     buildTerrainSnapshot: buildTerrainSnapshot,
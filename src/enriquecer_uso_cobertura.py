@@ -13,29 +13,100 @@ O script opera offline e foi pensado para pré-processamento periódico.
 from __future__ import annotations
 
 import argparse
+import hashlib
 import math
-from dataclasses import dataclass
+import os
+import re
+import sqlite3
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Callable, Dict, Iterable, List, TypeVar
 
 import numpy as np
 import pandas as pd
 
 try:
     import rasterio
-    from rasterio.transform import rowcol
+    from rasterio.crs import CRS
     from rasterio.warp import transform as warp_transform
+    from rasterio.windows import Window
 except ImportError as exc:  # pragma: no cover - falha explícita em runtime
     raise SystemExit(
         "Dependência ausente: instale 'rasterio' para usar o enriquecimento geoespacial."
     ) from exc
 
+# Janelas de leitura maiores que isto são quebradas em blocos ocupados pela rota.
+MAX_WINDOW_PIXELS = 16_000_000
+WINDOW_BLOCK_PX = 1024
+
+T = TypeVar("T")
+
+# Acima deste número de classes na janela a moda volta a ser calculada por extração
+# das vizinhanças (rasters contínuos não se beneficiam de tabelas por classe).
+MAX_SAT_CLASSES = 64
+
+
+# Alcance padrão da busca por feições em --dist-to; mais longe a distância fica vazia.
+DEFAULT_DISTANCE_MAX_M = 1000.0
+# Passos maiores que isto entre fixos são falha de GPS e não geram pegada de roda.
+DEFAULT_MAX_STEP_M = 100.0
+
 
 @dataclass(frozen=True)
 class RasterSpec:
     prefix: str
     raster_path: Path
     legend_csv: Path | None = None
+    # Classes (ou 'edge', bordas entre classes) para as colunas dist_to_{alvo}_m.
+    distance_targets: tuple[str, ...] = ()
+    distance_max_m: float = DEFAULT_DISTANCE_MAX_M
+    # Bitola e largura do pneu (m) para as colunas de pegada das rodas.
+    footprint: tuple[float, float] | None = None
+
+
+@dataclass(frozen=True)
+class StackSpec:
+    """Série temporal: um arquivo multibanda (``label`` None) ou um arquivo por época."""
+
+    prefix: str
+    entries: tuple[tuple[str | None, Path], ...]
+    legend_csv: Path | None = None
+
+
+INTERPOLATIONS = ("nearest", "bilinear", "bicubic")
+
+
+@dataclass(frozen=True)
+class ContinuousSpec:
+    """Raster contínuo (MDE, NDVI, umidade): valor interpolado e estatísticas da janela."""
+
+    prefix: str
+    raster_path: Path
+    interpolation: str = "bilinear"
+    terrain: bool = False
+    percentiles: tuple[float, ...] = ()
+
+
+@dataclass(frozen=True)
+class PixelIndex:
+    """Pixel de cada ponto da rota em uma grade raster e os pixels distintos visitados.
+
+    Logs densos repetem o mesmo pixel dezenas de vezes; as estatísticas são calculadas
+    uma vez por pixel distinto e redistribuídas por ``point_to_pixel``. O índice só
+    depende da grade (CRS, transformação e dimensões) e pode ser reaproveitado entre
+    rasters alinhados.
+    """
+
+    rows: np.ndarray
+    cols: np.ndarray
+    inside: np.ndarray
+    pixel_rows: np.ndarray  # pixels distintos dentro do raster
+    pixel_cols: np.ndarray
+    point_to_pixel: np.ndarray  # posição em pixel_rows/pixel_cols; -1 fora do raster
 
 
 def parse_raster_spec(spec: str, default_prefix: str) -> RasterSpec:
@@ -62,6 +133,83 @@ def parse_raster_spec(spec: str, default_prefix: str) -> RasterSpec:
     )
 
 
+def parse_stack_spec(spec: str, default_prefix: str = "serie") -> StackSpec:
+    """Lê 'serie.tif', 'prefixo::serie.tif' ou 'prefixo::2019=a.tif,2020=b.tif[::legenda.csv]'.
+
+    Um único arquivo sem rótulo é multibanda: cada banda é uma época. Numa lista, o
+    rótulo de cada arquivo é o texto antes de '=' ou, sem ele, o nome do arquivo.
+    """
+    tokens = [token.strip() for token in spec.split("::")]
+    if not spec.strip() or len(tokens) > 3:
+        raise ValueError(
+            f"Especificação de série inválida: '{spec}'. Use 'serie.tif', 'prefixo::serie.tif' "
+            "ou 'prefixo::2019=a.tif,2020=b.tif::legenda.csv'."
+        )
+    prefix = tokens[0] if len(tokens) > 1 else default_prefix
+    files = tokens[1] if len(tokens) > 1 else tokens[0]
+    legend_csv = Path(tokens[2]) if len(tokens) == 3 else None
+
+    items = [item.strip() for item in files.split(",") if item.strip()]
+    if len(items) == 1 and "=" not in items[0]:
+        return StackSpec(prefix=prefix, entries=((None, Path(items[0])),), legend_csv=legend_csv)
+    entries = []
+    for item in items:
+        label, _, path = item.rpartition("=")
+        entries.append((label.strip() or Path(path).stem, Path(path.strip())))
+    return StackSpec(prefix=prefix, entries=tuple(entries), legend_csv=legend_csv)
+
+
+def parse_continuous_spec(spec: str, default_prefix: str = "continuo") -> ContinuousSpec:
+    """Lê 'raster.tif', 'prefixo::raster.tif' ou 'prefixo::raster.tif::opções'.
+
+    Opções separadas por vírgula: o método de interpolação (nearest, bilinear ou
+    bicubic), 'terrain' para declividade/orientação e percentis da janela como 'p10'.
+    """
+    tokens = [token.strip() for token in spec.split("::")]
+    if not spec.strip() or len(tokens) > 3:
+        raise ValueError(
+            f"Especificação de raster contínuo inválida: '{spec}'. Use 'raster.tif', "
+            "'prefixo::raster.tif' ou 'prefixo::raster.tif::bicubic,terrain,p10,p90'."
+        )
+    prefix = tokens[0] if len(tokens) > 1 else default_prefix
+    raster_path = Path(tokens[1] if len(tokens) > 1 else tokens[0])
+    interpolation = "bilinear"
+    terrain = False
+    percentiles: List[float] = []
+    for option in (item.strip().lower() for item in (tokens[2] if len(tokens) == 3 else "").split(",")):
+        if not option:
+            continue
+        if option in INTERPOLATIONS:
+            interpolation = option
+        elif option == "terrain":
+            terrain = True
+        elif re.fullmatch(r"p\d+(\.\d+)?", option) and float(option[1:]) <= 100:
+            percentiles.append(float(option[1:]))
+        else:
+            raise ValueError(
+                f"Opção desconhecida '{option}' em '{spec}'. Use {', '.join(INTERPOLATIONS)}, "
+                "terrain ou pNN (percentil)."
+            )
+    return ContinuousSpec(prefix, raster_path, interpolation, terrain, tuple(percentiles))
+
+
+def parse_distance_targets(spec: str) -> tuple[str, tuple[str, ...]]:
+    """Lê 'prefixo::4,33,edge' em (prefixo, alvos); alvos são classes ou 'edge'."""
+    prefix, separator, targets = spec.partition("::")
+    items = tuple(item.strip().lower() for item in targets.split(",") if item.strip())
+    if not separator or not prefix.strip() or not items:
+        raise ValueError(f"Especificação de distância inválida: '{spec}'. Use 'prefixo::4,33,edge'.")
+    for item in items:
+        if item != "edge":
+            try:
+                float(item)
+            except ValueError as exc:
+                raise ValueError(
+                    f"Alvo de distância inválido '{item}' em '{spec}': use uma classe ou 'edge'."
+                ) from exc
+    return prefix.strip(), items
+
+
 def load_legend(legend_csv: Path | None) -> Dict[int, str]:
     if legend_csv is None:
         return {}
@@ -95,10 +243,140 @@ def transform_points(
     if dst_crs_str == src_crs:
         return x_values, y_values
 
-    x_out, y_out = warp_transform(src_crs, dst_crs, x_values.tolist(), y_values.tolist())
+    x_out, y_out = warp_transform(src_crs, dst_crs, x_values, y_values)
     return np.asarray(x_out, dtype=float), np.asarray(y_out, dtype=float)
 
 
+def step_lengths_m(
+    start_x: np.ndarray,
+    start_y: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    crs: str,
+) -> np.ndarray:
+    """Comprimento em metros de cada passo ``start -> ponto`` no CRS da rota.
+
+    Em CRS geográfico usa a distância geodésica no elipsoide do CRS; em CRS projetado
+    converte a distância euclidiana pela unidade linear do CRS.
+    """
+    route_crs = CRS.from_user_input(crs)
+    if route_crs.is_geographic:
+        _, _, lengths = crs_geod(crs).inv(start_x, start_y, x, y)
+        return np.asarray(lengths, dtype=float)
+    return np.hypot(x - start_x, y - start_y) * route_crs.linear_units_factor[1]
+
+
+def crs_geod(crs: object) -> object:
+    """``pyproj.Geod`` do elipsoide de um CRS geográfico."""
+    try:
+        from pyproj import CRS as ProjCRS
+    except ImportError as exc:  # pragma: no cover - falha explícita em runtime
+        raise SystemExit(
+            "Dependência ausente: instale 'pyproj' para medir distâncias em CRS geográfico."
+        ) from exc
+    return ProjCRS.from_user_input(crs).get_geod()
+
+
+def metres_per_unit(crs: object, y_values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Metros por unidade do CRS ao longo de x e de y em cada ponto (``y_values`` no próprio CRS).
+
+    Em CRS projetado é o fator da unidade linear; em CRS geográfico, o comprimento local
+    de um grau de longitude e de latitude no elipsoide do CRS.
+    """
+    y_values = np.asarray(y_values, dtype=float)
+    native_crs = CRS.from_user_input(crs)
+    if not native_crs.is_geographic:
+        factor = np.full(y_values.shape, native_crs.linear_units_factor[1])
+        return factor, factor.copy()
+    delta = 1e-3
+    lat = np.clip(y_values, -89.0, 89.0)
+    lon = np.zeros_like(lat)
+    geod = crs_geod(crs)
+    _, _, along_x = geod.inv(lon, lat, lon + delta, lat)  # type: ignore[attr-defined]
+    _, _, along_y = geod.inv(lon, lat - delta / 2.0, lon, lat + delta / 2.0)  # type: ignore[attr-defined]
+    return np.asarray(along_x, dtype=float) / delta, np.asarray(along_y, dtype=float) / delta
+
+
+def pixel_size_m(
+    dataset: rasterio.io.DatasetReader, rows: np.ndarray, cols: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Largura e altura (m) dos pixels ``(rows, cols)``; em CRS geográfico, na latitude de cada um."""
+    _, y_center = dataset.transform * (np.asarray(cols) + 0.5, np.asarray(rows) + 0.5)
+    scale_x, scale_y = metres_per_unit(dataset.crs, y_center)
+    res_x, res_y = dataset.res
+    return abs(res_x) * scale_x, abs(res_y) * scale_y
+
+
+class RouteSamplingCache:
+    """Coordenadas reprojetadas (por CRS) e ``PixelIndex`` (por grade) de uma rota.
+
+    Compartilhado entre as threads que amostram rasters diferentes: cada CRS é
+    reprojetado uma única vez e rasters alinhados reaproveitam o mesmo índice de pixels.
+    ``previous_xy`` é o ponto anterior ao primeiro (último do bloco anterior) e
+    ``previous_move_xy`` o último deslocamento antes do bloco (origem, destino), usados
+    pelas pegadas das rodas.
+    """
+
+    def __init__(
+        self,
+        x_values: np.ndarray,
+        y_values: np.ndarray,
+        route_crs: str,
+        previous_xy: tuple[float, float] | None = None,
+        previous_move_xy: tuple[tuple[float, float], tuple[float, float]] | None = None,
+    ) -> None:
+        self.x_values = np.asarray(x_values, dtype=float)
+        self.y_values = np.asarray(y_values, dtype=float)
+        self.route_crs = route_crs
+        self.previous_xy = previous_xy
+        self.previous_move_xy = previous_move_xy
+        self._values: Dict[tuple, object] = {}
+        self._locks: Dict[tuple, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def _get_or_compute(self, key: tuple, compute: Callable[[], T]) -> T:
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self._values:
+                self._values[key] = compute()
+            return self._values[key]  # type: ignore[return-value]
+
+    def native_coords(self, dst_crs: object) -> tuple[np.ndarray, np.ndarray]:
+        crs_key = dst_crs.to_string() if hasattr(dst_crs, "to_string") else str(dst_crs)
+        return self._get_or_compute(
+            ("crs", crs_key),
+            lambda: transform_points(self.x_values, self.y_values, src_crs=self.route_crs, dst_crs=dst_crs),
+        )
+
+    def native_previous(self, dst_crs: object) -> tuple[float, float] | None:
+        if self.previous_xy is None:
+            return None
+        x_native, y_native = transform_points(
+            np.array([self.previous_xy[0]]), np.array([self.previous_xy[1]]), self.route_crs, dst_crs
+        )
+        return float(x_native[0]), float(y_native[0])
+
+    def native_previous_heading(self, dst_crs: object) -> tuple[float, float] | None:
+        """Vetor unitário do último deslocamento antes do bloco, no CRS ``dst_crs``."""
+        if self.previous_move_xy is None:
+            return None
+        (x0, y0), (x1, y1) = self.previous_move_xy
+        x_native, y_native = transform_points(np.array([x0, x1]), np.array([y0, y1]), self.route_crs, dst_crs)
+        dx, dy = x_native[1] - x_native[0], y_native[1] - y_native[0]
+        step = np.hypot(dx, dy)
+        if not step > 0:
+            return None
+        return float(dx / step), float(dy / step)
+
+    def pixel_index(self, dataset: rasterio.io.DatasetReader) -> PixelIndex:
+        def compute() -> PixelIndex:
+            x_native, y_native = self.native_coords(dataset.crs)
+            return build_pixel_index(dataset.transform, dataset.height, dataset.width, x_native, y_native)
+
+        return self._get_or_compute(("grid",) + grid_key(dataset), compute)
+
+
 def compute_window_radius_px(dataset: rasterio.io.DatasetReader, radius_m: float) -> tuple[int, int]:
     if radius_m <= 0.0:
         return 0, 0
@@ -109,41 +387,527 @@ def compute_window_radius_px(dataset: rasterio.io.DatasetReader, radius_m: float
     return px, py
 
 
-def normalize_class_value(value: object) -> float | int | None:
-    if value is None:
-        return None
-    if isinstance(value, (np.floating, float)):
-        if np.isnan(value):
-            return None
-        if float(value).is_integer():
-            return int(value)
-        return float(value)
-    if isinstance(value, (np.integer, int)):
-        return int(value)
-    return None
-
+def pixel_indices(
+    transform: object,
+    x_values: np.ndarray,
+    y_values: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Linha/coluna de cada ponto pela afim inversa (equivale a ``rowcol`` vetorizado)."""
+    inverse = ~transform
+    cols = np.floor(inverse.a * x_values + inverse.b * y_values + inverse.c).astype(np.int64)
+    rows = np.floor(inverse.d * x_values + inverse.e * y_values + inverse.f).astype(np.int64)
+    return rows, cols
 
-def valid_window_values(window_values: np.ndarray, nodata: float | int | None) -> np.ndarray:
-    values = np.asarray(window_values).reshape(-1)
-    if values.size == 0:
-        return np.array([], dtype=float)
 
+def valid_pixel_mask(values: np.ndarray, nodata: float | int | None) -> np.ndarray:
+    valid = np.ones(values.shape, dtype=bool)
     if np.issubdtype(values.dtype, np.floating):
-        values = values[~np.isnan(values)]
-
+        valid &= ~np.isnan(values)
     if nodata is not None:
-        values = values[values != nodata]
+        valid &= values != nodata
+    return valid
+
+
+def row_modes(values: np.ndarray, valid: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Moda de cada linha entre os valores válidos (menor classe em empates) e nº de válidos.
+
+    Linhas sem valores válidos recebem NaN.
+    """
+    n_rows, n_cols = values.shape
+    counts = np.count_nonzero(valid, axis=1)
+    modes = np.full(n_rows, np.nan)
+    if n_rows == 0 or n_cols == 0:
+        return modes, counts
+
+    ordered = np.sort(np.where(valid, values.astype(float), np.inf), axis=1)
+    run_start = np.ones(ordered.shape, dtype=bool)
+    run_start[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    starts = np.flatnonzero(run_start)
+    run_len = np.diff(np.append(starts, ordered.size))
+    run_value = ordered.reshape(-1)[starts]
+    run_len[np.isinf(run_value)] = 0
+
+    # Cada linha começa uma sequência nova; a primeira de maior comprimento é a menor classe.
+    first_run = np.searchsorted(starts, np.arange(n_rows) * n_cols)
+    best_len = np.maximum.reduceat(run_len, first_run)
+    run_row = starts // n_cols
+    candidates = np.flatnonzero(run_len == best_len[run_row])
+    best_row, best_idx = np.unique(run_row[candidates], return_index=True)
+    has_valid = counts[best_row] > 0
+    modes[best_row[has_valid]] = run_value[candidates[best_idx]][has_valid]
+    return modes, counts
+
+
+def window_neighbourhoods(
+    band: np.ndarray,
+    valid: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    radius_x_px: int,
+    radius_y_px: int,
+    max_values: int = 4_000_000,
+) -> Iterable[tuple[slice, np.ndarray, np.ndarray]]:
+    """Vizinhanças de cada (linha, coluna) como linhas de uma matriz (ponto, pixel).
+
+    As janelas são extraídas por indexação avançada em blocos de pontos, com no máximo
+    ``max_values`` pixels materializados por vez. Gera (fatia dos pontos, valores,
+    válidos); pixels fora da banda contam como inválidos.
+    """
+    offsets_y = np.arange(-radius_y_px, radius_y_px + 1)
+    offsets_x = np.arange(-radius_x_px, radius_x_px + 1)
+    height, width = band.shape
+    chunk = max(1, max_values // (offsets_y.size * offsets_x.size))
+
+    for start in range(0, rows.size, chunk):
+        window_rows = rows[start : start + chunk, None] + offsets_y[None, :]
+        window_cols = cols[start : start + chunk, None] + offsets_x[None, :]
+        rows_in = (window_rows >= 0) & (window_rows < height)
+        cols_in = (window_cols >= 0) & (window_cols < width)
+        index = (
+            np.clip(window_rows, 0, height - 1)[:, :, None],
+            np.clip(window_cols, 0, width - 1)[:, None, :],
+        )
+        window_valid = valid[index] & rows_in[:, :, None] & cols_in[:, None, :]
+        n_points = window_rows.shape[0]
+        yield (
+            slice(start, start + n_points),
+            band[index].reshape(n_points, -1),
+            window_valid.reshape(n_points, -1),
+        )
 
+
+def window_modes(
+    band: np.ndarray,
+    valid: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    radius_x_px: int,
+    radius_y_px: int,
+    max_values: int = 4_000_000,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Classe modal e pixels válidos na vizinhança de cada (linha, coluna) da banda."""
+    modes = np.full(rows.size, np.nan)
+    counts = np.zeros(rows.size, dtype=np.int64)
+    for points, values, values_valid in window_neighbourhoods(
+        band, valid, rows, cols, radius_x_px, radius_y_px, max_values
+    ):
+        modes[points], counts[points] = row_modes(values, values_valid)
+    return modes, counts
+
+
+def box_sums(values: np.ndarray, row_start, row_stop, col_start, col_stop, dtype=np.float64) -> np.ndarray:
+    """Soma de ``values`` em cada retângulo [start, stop) via tabela de somas acumuladas.
+
+    ``values`` pode ter eixos iniciais (épocas de uma série); o resultado os preserva.
+    """
+    height, width = values.shape[-2:]
+    table = np.zeros(values.shape[:-2] + (height + 1, width + 1), dtype=dtype)
+    np.cumsum(np.cumsum(values, axis=-2, dtype=dtype), axis=-1, out=table[..., 1:, 1:])
+    return (
+        table[..., row_stop, col_stop]
+        - table[..., row_start, col_stop]
+        - table[..., row_stop, col_start]
+        + table[..., row_start, col_start]
+    )
+
+
+def box_counts(mask: np.ndarray, row_start, row_stop, col_start, col_stop) -> np.ndarray:
+    """Pixels verdadeiros de ``mask`` em cada retângulo [start, stop)."""
+    return box_sums(mask, row_start, row_stop, col_start, col_stop, dtype=np.int32)
+
+
+def window_bounds(
+    rows: np.ndarray, cols: np.ndarray, height: int, width: int, radius_x_px: int, radius_y_px: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Retângulos [start, stop) das vizinhanças, recortados à banda."""
+    return (
+        np.clip(rows - radius_y_px, 0, height),
+        np.clip(rows + radius_y_px + 1, 0, height),
+        np.clip(cols - radius_x_px, 0, width),
+        np.clip(cols + radius_x_px + 1, 0, width),
+    )
+
+
+def window_modes_sat(
+    band: np.ndarray,
+    valid: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    radius_x_px: int,
+    radius_y_px: int,
+    classes: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Como :func:`window_modes`, com uma tabela de somas acumuladas por classe.
+
+    Cada contagem de janela sai de quatro consultas por classe, independentemente do
+    raio. As tabelas são montadas uma classe por vez (em ordem crescente, mantendo
+    a menor classe nos empates) para limitar a memória a uma tabela da janela.
+    Com um cubo (época, linha, coluna) todas as épocas são resolvidas juntas.
+    """
+    bounds = window_bounds(rows, cols, *band.shape[-2:], radius_x_px, radius_y_px)
+
+    counts = box_counts(valid, *bounds).astype(np.int64)
+    modes = np.full(counts.shape, np.nan)
+    best = np.zeros(counts.shape, dtype=np.int64)
+    for value in classes:
+        class_counts = box_counts(valid & (band == value), *bounds)
+        better = class_counts > best
+        modes[better] = value
+        best[better] = class_counts[better]
+    return modes, counts
+
+
+def window_statistics(
+    band: np.ndarray,
+    valid: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    radius_x_px: int,
+    radius_y_px: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Escolhe entre tabelas por classe e extração das vizinhanças pelo custo estimado.
+
+    Aceita uma banda (linha, coluna) ou um cubo (época, linha, coluna).
+    """
+    classes = np.unique(band[valid])
+    n_layers = int(np.prod(band.shape[:-2], dtype=np.int64))
+    window_px = (2 * radius_x_px + 1) * (2 * radius_y_px + 1)
+    sat_cost = (classes.size + 1) * band.size
+    gather_cost = n_layers * rows.size * window_px * max(1.0, math.log2(window_px))
+    if classes.size <= MAX_SAT_CLASSES and sat_cost < gather_cost:
+        return window_modes_sat(band, valid, rows, cols, radius_x_px, radius_y_px, classes)
+    if band.ndim == 2:
+        return window_modes(band, valid, rows, cols, radius_x_px, radius_y_px)
+    per_layer = [
+        window_modes(layer, layer_valid, rows, cols, radius_x_px, radius_y_px)
+        for layer, layer_valid in zip(band, valid)
+    ]
+    return np.stack([modes for modes, _ in per_layer]), np.stack([counts for _, counts in per_layer])
+
+
+def class_id_column(values: np.ndarray) -> np.ndarray:
+    """Classes como inteiros quando todas são inteiras e presentes; senão float com NaN."""
+    if values.size and not np.isnan(values).any() and np.all(values == np.floor(values)):
+        return values.astype(np.int64)
     return values
 
 
-def modal_value(values: np.ndarray) -> float | int | None:
-    if values.size == 0:
-        return None
-    unique_values, counts = np.unique(values, return_counts=True)
-    idx = int(np.argmax(counts))
-    value = unique_values[idx]
-    return normalize_class_value(value)
+def route_read_windows(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    inside: np.ndarray,
+    height: int,
+    width: int,
+    radius_x_px: int,
+    radius_y_px: int,
+    max_window_pixels: int = MAX_WINDOW_PIXELS,
+    block_px: int = WINDOW_BLOCK_PX,
+) -> List[tuple[Window, np.ndarray]]:
+    """Janelas de leitura que cobrem os pixels da rota mais o raio da vizinhança.
+
+    Retorna pares (janela, índices dos pontos atendidos). Rotas compactas usam uma
+    única janela; rotas extensas são agrupadas pelos blocos ``block_px`` x ``block_px``
+    que ocupam, de modo que memória e I/O acompanham a área percorrida.
+    """
+    point_idx = np.flatnonzero(inside)
+    if point_idx.size == 0:
+        return []
+
+    def window_for(idx: np.ndarray) -> Window:
+        row_start = max(0, int(rows[idx].min()) - radius_y_px)
+        row_stop = min(height, int(rows[idx].max()) + radius_y_px + 1)
+        col_start = max(0, int(cols[idx].min()) - radius_x_px)
+        col_stop = min(width, int(cols[idx].max()) + radius_x_px + 1)
+        return Window(col_start, row_start, col_stop - col_start, row_stop - row_start)
+
+    window = window_for(point_idx)
+    if window.width * window.height <= max_window_pixels:
+        return [(window, point_idx)]
+
+    n_blocks_x = -(-width // block_px)
+    block_key = (rows[point_idx] // block_px) * n_blocks_x + cols[point_idx] // block_px
+    order = np.argsort(block_key, kind="stable")
+    _, starts = np.unique(block_key[order], return_index=True)
+    return [(window_for(idx), idx) for idx in np.split(point_idx[order], starts[1:])]
+
+
+def grid_key(dataset: rasterio.io.DatasetReader) -> tuple:
+    """Identifica a grade de um raster; rasters com a mesma chave compartilham ``PixelIndex``."""
+    crs = dataset.crs.to_string() if dataset.crs is not None else ""
+    return (crs, tuple(dataset.transform)[:6], dataset.height, dataset.width)
+
+
+def build_pixel_index(
+    transform: object,
+    height: int,
+    width: int,
+    x_native: np.ndarray,
+    y_native: np.ndarray,
+) -> PixelIndex:
+    rows, cols = pixel_indices(
+        transform, np.asarray(x_native, dtype=float), np.asarray(y_native, dtype=float)
+    )
+    inside = (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+
+    keys, point_to_inside = np.unique(rows[inside] * width + cols[inside], return_inverse=True)
+    point_to_pixel = np.full(rows.size, -1, dtype=np.int64)
+    point_to_pixel[inside] = point_to_inside
+    return PixelIndex(
+        rows=rows,
+        cols=cols,
+        inside=inside,
+        pixel_rows=keys // width,
+        pixel_cols=keys % width,
+        point_to_pixel=point_to_pixel,
+    )
+
+
+class RasterStack:
+    """Bandas alinhadas lidas juntas como um cubo (época, linha, coluna).
+
+    Vem de um arquivo multibanda (uma banda por época) ou de vários arquivos na mesma
+    grade. Expõe CRS, transformação, dimensões e resolução como um dataset do rasterio.
+    """
+
+    def __init__(self, bands: List[tuple[rasterio.io.DatasetReader, int]], epochs: List[str]) -> None:
+        if not bands:
+            raise ValueError("Série temporal sem bandas.")
+        if len(epochs) != len(bands):
+            raise ValueError("Cada banda da série precisa de um rótulo de época.")
+        reference = bands[0][0]
+        for dataset, _ in bands[1:]:
+            if grid_key(dataset) != grid_key(reference):
+                raise ValueError(
+                    f"Rasters da série precisam estar na mesma grade: {reference.name} x {dataset.name}"
+                )
+        self.bands = bands
+        self.epochs = epochs
+        self.crs = reference.crs
+        self.transform = reference.transform
+        self.height = reference.height
+        self.width = reference.width
+        self.res = reference.res
+        self.nodata = [dataset.nodatavals[index - 1] for dataset, index in bands]
+        self.dtype = np.result_type(*(dataset.dtypes[index - 1] for dataset, index in bands))
+
+    def read(self, window: Window) -> np.ndarray:
+        cube = np.empty((len(self.bands), int(window.height), int(window.width)), dtype=self.dtype)
+        start = 0
+        while start < len(self.bands):
+            # Bandas consecutivas do mesmo arquivo saem de uma única leitura.
+            dataset = self.bands[start][0]
+            stop = start + 1
+            while stop < len(self.bands) and self.bands[stop][0] is dataset:
+                stop += 1
+            cube[start:stop] = dataset.read([index for _, index in self.bands[start:stop]], window=window)
+            start = stop
+        return cube
+
+    def valid_mask(self, cube: np.ndarray) -> np.ndarray:
+        return np.stack([valid_pixel_mask(layer, nodata) for layer, nodata in zip(cube, self.nodata)])
+
+
+def file_sha256(path: Path, block_bytes: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(block_bytes), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class PixelStatsStore:
+    """Cache em disco (SQLite) das estatísticas por pixel, reaproveitado entre execuções.
+
+    A chave é o hash SHA-256 do conteúdo do raster, a banda, o raio da janela e o pixel
+    (linha, coluna). O hash de cada arquivo é guardado junto com tamanho e ``mtime`` e
+    só é recalculado quando eles mudam; se o conteúdo mudou, as entradas do hash antigo
+    são descartadas. Pode ser compartilhado entre threads.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS raster_files (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS pixel_stats (
+                    sha256 TEXT NOT NULL,
+                    band INTEGER NOT NULL,
+                    radius_m REAL NOT NULL,
+                    row INTEGER NOT NULL,
+                    col INTEGER NOT NULL,
+                    class_point REAL,
+                    class_mode REAL,
+                    valid_pixels INTEGER NOT NULL,
+                    PRIMARY KEY (sha256, band, radius_m, row, col)
+                ) WITHOUT ROWID;
+                CREATE TEMP TABLE wanted (idx INTEGER PRIMARY KEY, row INTEGER, col INTEGER);
+                """
+            )
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def content_hash(self, path: Path) -> str:
+        path = Path(path).resolve()
+        stat = path.stat()
+        with self._lock:
+            known = self._connection.execute(
+                "SELECT size, mtime_ns, sha256 FROM raster_files WHERE path = ?", (str(path),)
+            ).fetchone()
+        if known is not None and known[:2] == (stat.st_size, stat.st_mtime_ns):
+            return known[2]
+
+        sha = file_sha256(path)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO raster_files VALUES (?, ?, ?, ?)",
+                (str(path), stat.st_size, stat.st_mtime_ns, sha),
+            )
+            if known is not None and known[2] != sha:
+                self._connection.execute(
+                    "DELETE FROM pixel_stats WHERE sha256 = ? "
+                    "AND NOT EXISTS (SELECT 1 FROM raster_files WHERE sha256 = ?)",
+                    (known[2], known[2]),
+                )
+        return sha
+
+    def layer_keys(self, stack: RasterStack) -> List[tuple[str, int]]:
+        return [(self.content_hash(Path(dataset.name)), index) for dataset, index in stack.bands]
+
+    def lookup(
+        self,
+        layers: List[tuple[str, int]],
+        radius_m: float,
+        pixel_rows: np.ndarray,
+        pixel_cols: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Valores guardados por (camada, pixel) e a máscara dos que foram encontrados."""
+        shape = (len(layers), pixel_rows.size)
+        point_values = np.full(shape, np.nan)
+        mode_values = np.full(shape, np.nan)
+        valid_counts = np.zeros(shape, dtype=np.int64)
+        found = np.zeros(shape, dtype=bool)
+        with self._lock:
+            self._connection.execute("DELETE FROM wanted")
+            self._connection.executemany(
+                "INSERT INTO wanted VALUES (?, ?, ?)",
+                zip(range(pixel_rows.size), pixel_rows.tolist(), pixel_cols.tolist()),
+            )
+            for t, (sha, band) in enumerate(layers):
+                # CROSS JOIN fixa ``wanted`` no laço externo: uma busca pela chave primária por pixel.
+                rows = self._connection.execute(
+                    "SELECT w.idx, s.class_point, s.class_mode, s.valid_pixels FROM wanted AS w "
+                    "CROSS JOIN pixel_stats AS s ON s.sha256 = ? AND s.band = ? AND s.radius_m = ? "
+                    "AND s.row = w.row AND s.col = w.col",
+                    (sha, band, float(radius_m)),
+                ).fetchall()
+                if not rows:
+                    continue
+                idx, point, mode, counts = zip(*rows)
+                idx = np.asarray(idx, dtype=np.int64)
+                # NaN é gravado como NULL pelo SQLite e volta como None.
+                point_values[t, idx] = np.asarray(point, dtype=float)
+                mode_values[t, idx] = np.asarray(mode, dtype=float)
+                valid_counts[t, idx] = counts
+                found[t, idx] = True
+            self._connection.execute("DELETE FROM wanted")
+        return point_values, mode_values, valid_counts, found
+
+    def save(
+        self,
+        layers: List[tuple[str, int]],
+        radius_m: float,
+        pixel_rows: np.ndarray,
+        pixel_cols: np.ndarray,
+        point_values: np.ndarray,
+        mode_values: np.ndarray,
+        valid_counts: np.ndarray,
+    ) -> None:
+        rows, cols = pixel_rows.tolist(), pixel_cols.tolist()
+        with self._lock, self._connection:
+            for t, (sha, band) in enumerate(layers):
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO pixel_stats VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    zip(
+                        [sha] * len(rows),
+                        [band] * len(rows),
+                        [float(radius_m)] * len(rows),
+                        rows,
+                        cols,
+                        point_values[t].tolist(),
+                        mode_values[t].tolist(),
+                        valid_counts[t].tolist(),
+                    ),
+                )
+
+
+def sample_stack_pixels(
+    stack: RasterStack,
+    pixel_rows: np.ndarray,
+    pixel_cols: np.ndarray,
+    radius_m: float,
+    store: PixelStatsStore | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Classe no pixel, classe modal e pixels válidos na vizinhança, por (época, pixel).
+
+    Com ``store`` só os pixels ausentes do cache são lidos do raster, e entram nele.
+    """
+    if store is not None:
+        layers = store.layer_keys(stack)
+        point_values, mode_values, valid_counts, found = store.lookup(
+            layers, radius_m, pixel_rows, pixel_cols
+        )
+        missing = ~found.all(axis=0)
+        if missing.any():
+            computed = sample_stack_pixels(stack, pixel_rows[missing], pixel_cols[missing], radius_m)
+            store.save(layers, radius_m, pixel_rows[missing], pixel_cols[missing], *computed)
+            point_values[:, missing], mode_values[:, missing], valid_counts[:, missing] = computed
+        return point_values, mode_values, valid_counts
+
+    radius_x_px, radius_y_px = compute_window_radius_px(stack, radius_m)
+    shape = (len(stack.bands), pixel_rows.size)
+    point_values = np.full(shape, np.nan)
+    mode_values = np.full(shape, np.nan)
+    valid_counts = np.zeros(shape, dtype=np.int64)
+
+    windows = route_read_windows(
+        pixel_rows,
+        pixel_cols,
+        np.ones(pixel_rows.size, dtype=bool),
+        stack.height,
+        stack.width,
+        radius_x_px,
+        radius_y_px,
+        max_window_pixels=max(1, MAX_WINDOW_PIXELS // len(stack.bands)),
+    )
+    for window, pixel_idx in windows:
+        cube = stack.read(window)
+        valid = stack.valid_mask(cube)
+        # Índices locais à janela; a janela já inclui o raio recortado ao raster.
+        rows_local = pixel_rows[pixel_idx] - int(window.row_off)
+        cols_local = pixel_cols[pixel_idx] - int(window.col_off)
+        point_values[:, pixel_idx] = np.where(
+            valid[:, rows_local, cols_local], cube[:, rows_local, cols_local], np.nan
+        )
+        mode_values[:, pixel_idx], valid_counts[:, pixel_idx] = window_statistics(
+            cube, valid, rows_local, cols_local, radius_x_px, radius_y_px
+        )
+    return point_values, mode_values, valid_counts
+
+
+def scatter_to_points(pixel_index: PixelIndex, values: np.ndarray, fill: float | int) -> np.ndarray:
+    """Leva valores por pixel distinto (último eixo) para os pontos da rota."""
+    out = np.full(values.shape[:-1] + (pixel_index.inside.size,), fill, dtype=values.dtype)
+    out[..., pixel_index.inside] = values[..., pixel_index.point_to_pixel[pixel_index.inside]]
+    return out
 
 
 def sample_raster(
@@ -151,126 +915,1304 @@ def sample_raster(
     x_native: np.ndarray,
     y_native: np.ndarray,
     radius_m: float,
+    pixel_index: PixelIndex | None = None,
+    store: PixelStatsStore | None = None,
 ) -> pd.DataFrame:
-    band = dataset.read(1)
-    nodata = dataset.nodata
-    radius_x_px, radius_y_px = compute_window_radius_px(dataset, radius_m)
+    if pixel_index is None:
+        pixel_index = build_pixel_index(dataset.transform, dataset.height, dataset.width, x_native, y_native)
 
-    rows: List[dict[str, object]] = []
-    height, width = band.shape
+    # Estatísticas por pixel distinto; os pontos recebem o valor do seu pixel no final.
+    point_values, mode_values, valid_counts = sample_stack_pixels(
+        RasterStack([(dataset, 1)], [""]), pixel_index.pixel_rows, pixel_index.pixel_cols, radius_m, store
+    )
+    return pd.DataFrame(
+        {
+            "pixel_row": pixel_index.rows,
+            "pixel_col": pixel_index.cols,
+            "class_id_point": class_id_column(scatter_to_points(pixel_index, point_values[0], np.nan)),
+            "class_id_mode": class_id_column(scatter_to_points(pixel_index, mode_values[0], np.nan)),
+            "window_valid_pixels": scatter_to_points(pixel_index, valid_counts[0], 0),
+            "inside_raster": pixel_index.inside,
+        }
+    )
 
-    for x_coord, y_coord in zip(x_native, y_native, strict=True):
-        row_idx, col_idx = rowcol(dataset.transform, x_coord, y_coord)
-        inside = 0 <= row_idx < height and 0 <= col_idx < width
 
-        current_value = None
-        current_window = np.array([], dtype=band.dtype)
-        if inside:
-            current_value = normalize_class_value(band[row_idx, col_idx])
+def epoch_number(label: str) -> float:
+    """Valor numérico de um rótulo de época ('2019', 'classification_2019' -> 2019)."""
+    match = re.search(r"(\d+(?:\.\d+)?)\D*$", label)
+    if match is None:
+        raise ValueError(f"Rótulo de época sem valor numérico: '{label}'.")
+    return float(match.group(1))
 
-            row_start = max(0, row_idx - radius_y_px)
-            row_stop = min(height, row_idx + radius_y_px + 1)
-            col_start = max(0, col_idx - radius_x_px)
-            col_stop = min(width, col_idx + radius_x_px + 1)
-            current_window = band[row_start:row_stop, col_start:col_stop]
 
-        valid_values = valid_window_values(current_window, nodata)
-        if current_value == nodata:
-            current_value = None
+def epochs_for_times(epochs: List[str], time_values: pd.Series) -> np.ndarray:
+    """Índice da época vigente para cada ponto: a última época <= tempo do ponto.
 
-        rows.append(
-            {
-                "pixel_row": int(row_idx),
-                "pixel_col": int(col_idx),
-                "class_id_point": current_value,
-                "class_id_mode": modal_value(valid_values),
-                "window_valid_pixels": int(valid_values.size),
-                "inside_raster": bool(inside),
-            }
+    Pontos anteriores à primeira época usam a primeira; tempos ausentes recebem -1.
+    Tempos não numéricos são lidos como datas e comparados pelo ano.
+    """
+    if pd.api.types.is_numeric_dtype(time_values):
+        times = time_values.to_numpy(dtype=float)
+    else:
+        times = pd.to_datetime(time_values, errors="coerce").dt.year.to_numpy(dtype=float)
+    epoch_values = np.array([epoch_number(label) for label in epochs])
+    order = np.argsort(epoch_values, kind="stable")
+    position = np.clip(np.searchsorted(epoch_values[order], times, side="right") - 1, 0, len(epochs) - 1)
+    return np.where(np.isnan(times), -1, order[position])
+
+
+def sample_stack(
+    stack: RasterStack,
+    x_native: np.ndarray,
+    y_native: np.ndarray,
+    radius_m: float,
+    pixel_index: PixelIndex | None = None,
+    point_epochs: np.ndarray | None = None,
+    store: PixelStatsStore | None = None,
+) -> pd.DataFrame:
+    """Como :func:`sample_raster`, com colunas ``{época}_*`` para cada época da série.
+
+    Com ``point_epochs`` (ver :func:`epochs_for_times`) também gera as colunas sem
+    época, com o valor da época vigente em cada ponto, e a coluna ``epoch``.
+    """
+    if pixel_index is None:
+        pixel_index = build_pixel_index(stack.transform, stack.height, stack.width, x_native, y_native)
+    point_values, mode_values, valid_counts = (
+        scatter_to_points(pixel_index, values, fill)
+        for values, fill in zip(
+            sample_stack_pixels(stack, pixel_index.pixel_rows, pixel_index.pixel_cols, radius_m, store),
+            (np.nan, np.nan, 0),
         )
+    )
 
-    return pd.DataFrame(rows)
+    columns: Dict[str, np.ndarray] = {
+        "pixel_row": pixel_index.rows,
+        "pixel_col": pixel_index.cols,
+        "inside_raster": pixel_index.inside,
+    }
+    for t, epoch in enumerate(stack.epochs):
+        columns[f"{epoch}_class_id_point"] = class_id_column(point_values[t])
+        columns[f"{epoch}_class_id_mode"] = class_id_column(mode_values[t])
+        columns[f"{epoch}_window_valid_pixels"] = valid_counts[t]
+
+    if point_epochs is not None:
+        matched = point_epochs >= 0
+        pick = np.where(matched, point_epochs, 0)
+        points = np.arange(pick.size)
+        columns["epoch"] = np.where(matched, np.asarray(stack.epochs, dtype=object)[pick], None)
+        columns["class_id_point"] = class_id_column(np.where(matched, point_values[pick, points], np.nan))
+        columns["class_id_mode"] = class_id_column(np.where(matched, mode_values[pick, points], np.nan))
+        columns["window_valid_pixels"] = np.where(matched, valid_counts[pick, points], 0)
+    return pd.DataFrame(columns)
+
+
+def vertical_feature_distance(mask: np.ndarray) -> np.ndarray:
+    """Distância, em linhas, de cada pixel à feição mais próxima na mesma coluna (inf se não há).
+
+    Primeira passada da transformada de distância euclidiana separável.
+    """
+    height = mask.shape[0]
+    row_ids = np.arange(height, dtype=np.int32)[:, None]
+    above = np.maximum.accumulate(np.where(mask, row_ids, -1), axis=0)
+    below = np.minimum.accumulate(np.where(mask, row_ids, height)[::-1], axis=0)[::-1]
+    distance = np.minimum(
+        np.where(above >= 0, row_ids - above, np.inf),
+        np.where(below < height, below - row_ids, np.inf),
+    )
+    return distance
+
+
+def feature_distances(
+    mask: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    res_x: float | np.ndarray,
+    res_y: float | np.ndarray,
+    max_distance_m: float,
+    max_values: int = 4_000_000,
+) -> np.ndarray:
+    """Distância euclidiana (m) de cada (linha, coluna) à feição mais próxima de ``mask``.
+
+    A passada vertical cobre toda a janela; a horizontal (mínimo de dx² + dy² sobre as
+    colunas vizinhas) só é avaliada nos pixels pedidos, até ``max_distance_m``. Pixels
+    sem feição nesse alcance recebem NaN. ``res_x``/``res_y`` (m) podem variar por
+    pixel pedido, como em rasters com CRS geográfico.
+    """
+    distances = np.full(rows.size, np.nan)
+    if rows.size == 0:
+        return distances
+    res_x = np.broadcast_to(np.abs(np.asarray(res_x, dtype=float)), rows.shape)
+    res_y = np.broadcast_to(np.abs(np.asarray(res_y, dtype=float)), rows.shape)
+    vertical_px = vertical_feature_distance(mask)
+    width = mask.shape[1]
+    radius_px = int(math.ceil(max_distance_m / float(res_x.min())))
+    offsets = np.arange(-radius_px, radius_px + 1)
+    chunk = max(1, max_values // offsets.size)
+
+    for start in range(0, rows.size, chunk):
+        block = slice(start, start + chunk)
+        block_cols = cols[block, None] + offsets[None, :]
+        inside = (block_cols >= 0) & (block_cols < width)
+        column_m = vertical_px[rows[block, None], np.clip(block_cols, 0, width - 1)] * res_y[block, None]
+        offsets_m = offsets[None, :] * res_x[block, None]
+        squared = np.where(inside, column_m**2 + offsets_m**2, np.inf).min(axis=1)
+        distances[block] = np.where(squared <= max_distance_m**2, np.sqrt(squared), np.nan)
+    return distances
+
+
+def class_edge_mask(band: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """Pixels válidos com algum vizinho (4-conectado) válido de outra classe."""
+    edges = np.zeros(band.shape, dtype=bool)
+    differs_v = valid[1:, :] & valid[:-1, :] & (band[1:, :] != band[:-1, :])
+    differs_h = valid[:, 1:] & valid[:, :-1] & (band[:, 1:] != band[:, :-1])
+    edges[1:, :] |= differs_v
+    edges[:-1, :] |= differs_v
+    edges[:, 1:] |= differs_h
+    edges[:, :-1] |= differs_h
+    return edges
+
+
+def sample_class_distances(
+    dataset: rasterio.io.DatasetReader,
+    pixel_index: PixelIndex,
+    targets: tuple[str, ...],
+    max_distance_m: float,
+) -> Dict[str, np.ndarray]:
+    """Colunas ``dist_to_{alvo}_m`` por ponto: distância do pixel do ponto à classe alvo.
+
+    Cada janela de leitura inclui ``max_distance_m`` em volta dos pixels da rota, de
+    modo que feições fora dela estão sempre além do alcance. Em CRS geográfico o
+    tamanho do pixel em metros é tomado na latitude de cada pixel da rota.
+    """
+    pixel_rows, pixel_cols = pixel_index.pixel_rows, pixel_index.pixel_cols
+    distances = {target: np.full(pixel_rows.size, np.nan) for target in targets}
+    res_x_m, res_y_m = pixel_size_m(dataset, pixel_rows, pixel_cols)
+    halo_x = int(math.ceil(max_distance_m / float(res_x_m.min(initial=np.inf))))
+    halo_y = int(math.ceil(max_distance_m / float(res_y_m.min(initial=np.inf))))
+
+    windows = route_read_windows(
+        pixel_rows,
+        pixel_cols,
+        np.ones(pixel_rows.size, dtype=bool),
+        dataset.height,
+        dataset.width,
+        halo_x,
+        halo_y,
+    )
+    for window, pixel_idx in windows:
+        band = dataset.read(1, window=window)
+        valid = valid_pixel_mask(band, dataset.nodata)
+        rows_local = pixel_rows[pixel_idx] - int(window.row_off)
+        cols_local = pixel_cols[pixel_idx] - int(window.col_off)
+        for target in targets:
+            mask = class_edge_mask(band, valid) if target == "edge" else valid & (band == float(target))
+            distances[target][pixel_idx] = feature_distances(
+                mask, rows_local, cols_local, res_x_m[pixel_idx], res_y_m[pixel_idx], max_distance_m
+            )
 
+    return {
+        f"dist_to_{target if target == 'edge' else format(float(target), 'g')}_m": scatter_to_points(
+            pixel_index, values, np.nan
+        )
+        for target, values in distances.items()
+    }
 
-def enrich_route_with_raster(
-    route_df: pd.DataFrame,
-    x_col: str,
-    y_col: str,
-    route_crs: str,
+
+def wheel_rectangles(
+    x: np.ndarray,
+    y: np.ndarray,
+    gauge_m: float,
+    tyre_width_m: float,
+    previous_xy: tuple[float, float] | None = None,
+    max_step_m: float = DEFAULT_MAX_STEP_M,
+    previous_heading: tuple[float, float] | None = None,
+    scale_xy: tuple[np.ndarray, np.ndarray] | None = None,
+) -> np.ndarray:
+    """Retângulos percorridos pelas rodas esquerda e direita entre fixos consecutivos.
+
+    Forma (roda, ponto, vértice, xy), com a roda esquerda primeiro em relação ao rumo.
+    Cada ponto recebe o trecho desde o fixo anterior; parado, repete o último rumo e
+    vira a área de contato do pneu. ``previous_heading`` é o rumo (unitário) herdado
+    do bloco anterior para os pontos antes do primeiro deslocamento. Sem rumo
+    conhecido ou com passo maior que ``max_step_m`` (falha de GPS) os vértices ficam NaN.
+
+    ``scale_xy`` são os metros por unidade de x e de y em cada ponto (ver
+    :func:`metres_per_unit`); passos, bitola e largura do pneu são medidos em metros no
+    plano local de cada ponto. Sem ele, ``x``/``y`` já estão em metros.
+    """
+    scale_x, scale_y = (1.0, 1.0) if scale_xy is None else scale_xy
+    scale_x = np.broadcast_to(np.asarray(scale_x, dtype=float), x.shape)
+    scale_y = np.broadcast_to(np.asarray(scale_y, dtype=float), y.shape)
+    start_x = np.concatenate([[previous_xy[0] if previous_xy is not None else np.nan], x[:-1]])
+    start_y = np.concatenate([[previous_xy[1] if previous_xy is not None else np.nan], y[:-1]])
+    dx, dy = (x - start_x) * scale_x, (y - start_y) * scale_y
+    step = np.hypot(dx, dy)
+    moving = step > 0
+    # Rumo do último deslocamento (propagado para os pontos parados).
+    last_move = np.maximum.accumulate(np.where(moving, np.arange(x.size), -1))
+    has_move = last_move >= 0
+    has_heading = (has_move | (previous_heading is not None)) & (step <= max_step_m)
+    pick = np.maximum(last_move, 0)
+    inherited_x, inherited_y = np.nan, np.nan
+    if previous_heading is not None:
+        inherited_x, inherited_y = previous_heading[0] * scale_x, previous_heading[1] * scale_y
+        inherited_norm = np.hypot(inherited_x, inherited_y)
+        inherited_x, inherited_y = inherited_x / inherited_norm, inherited_y / inherited_norm
+    ux = np.where(has_move, dx[pick] / np.where(moving[pick], step[pick], 1.0), inherited_x)
+    uy = np.where(has_move, dy[pick] / np.where(moving[pick], step[pick], 1.0), inherited_y)
+    ux = np.where(has_heading, ux, np.nan)
+    uy = np.where(has_heading, uy, np.nan)
+
+    # Parado, o retângulo vira a área de contato (largura do pneu nas duas direções).
+    half_length = np.maximum(np.where(moving, step, 0.0), tyre_width_m) / 2.0
+    center_x = np.where(moving, (start_x + x) / 2.0, x)
+    center_y = np.where(moving, (start_y + y) / 2.0, y)
+    left_x, left_y = -uy, ux
+    along = np.array([1.0, 1.0, -1.0, -1.0])[None, :]
+    across = np.array([1.0, -1.0, -1.0, 1.0])[None, :] * tyre_width_m / 2.0
+
+    wheels = []
+    for side in (1.0, -1.0):
+        # Deslocamentos dos vértices em metros, convertidos para unidades do CRS no ponto.
+        offset_x = (side * left_x * gauge_m / 2.0)[:, None] + along * (ux * half_length)[:, None]
+        offset_y = (side * left_y * gauge_m / 2.0)[:, None] + along * (uy * half_length)[:, None]
+        corners_x = center_x[:, None] + (offset_x + across * left_x[:, None]) / scale_x[:, None]
+        corners_y = center_y[:, None] + (offset_y + across * left_y[:, None]) / scale_y[:, None]
+        wheels.append(np.stack([corners_x, corners_y], axis=-1))
+    return np.stack(wheels)
+
+
+def run_offsets(lengths: np.ndarray) -> np.ndarray:
+    """0, 1, ..., n-1 para cada sequência de ``lengths``, concatenados (``np.repeat`` com contador)."""
+    starts = np.cumsum(lengths) - lengths
+    return np.arange(int(lengths.sum())) - np.repeat(starts, lengths)
+
+
+def rasterize_convex_polygons(
+    poly_cols: np.ndarray,
+    poly_rows: np.ndarray,
+    height: int,
+    width: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pixels tocados por polígonos convexos (vértices em coordenadas de pixel), por varredura.
+
+    Para cada polígono e cada linha de pixels que ele cruza, as arestas são recortadas
+    à faixa da linha e o intervalo de colunas sai dos extremos recortados; tudo
+    vetorizado sobre (polígono, linha) e depois sobre os pixels. Retorna (polígono,
+    linha, coluna) de cada pixel tocado dentro de ``height`` x ``width``.
+    """
+    # Vértices no primeiro eixo: as reduções sobre 3-4 vértices viram operações entre linhas.
+    poly_cols = np.ascontiguousarray(poly_cols.T)
+    poly_rows = np.ascontiguousarray(poly_rows.T)
+    n_vertices, n_polys = poly_cols.shape
+    finite = np.isfinite(poly_cols).all(axis=0) & np.isfinite(poly_rows).all(axis=0)
+    with np.errstate(invalid="ignore"):
+        low = np.floor(poly_rows.min(axis=0))
+        high = np.maximum(np.ceil(poly_rows.max(axis=0)) - 1, low)
+    row_min = np.clip(np.nan_to_num(low), 0, height).astype(np.int64)
+    row_max = np.clip(np.nan_to_num(high, nan=-1.0), -1, height - 1).astype(np.int64)
+    n_bands = np.where(finite, np.maximum(row_max - row_min + 1, 0), 0)
+
+    band_poly = np.repeat(np.arange(n_polys), n_bands)
+    band_row = row_min[band_poly] + run_offsets(n_bands)
+
+    x0, y0 = poly_cols[:, band_poly], poly_rows[:, band_poly]
+    next_vertex = (np.arange(n_vertices) + 1) % n_vertices
+    x1, y1 = x0[next_vertex], y0[next_vertex]
+    top = band_row[None, :].astype(float)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t_top = (top - y0) / (y1 - y0)
+        t_bottom = (top + 1.0 - y0) / (y1 - y0)
+    horizontal = y1 == y0
+    t_low = np.where(horizontal, 0.0, np.maximum(0.0, np.minimum(t_top, t_bottom)))
+    t_high = np.where(horizontal, 1.0, np.minimum(1.0, np.maximum(t_top, t_bottom)))
+    crosses = np.where(horizontal, (y0 >= top) & (y0 <= top + 1.0), t_low <= t_high)
+    x_low = x0 + t_low * (x1 - x0)
+    x_high = x0 + t_high * (x1 - x0)
+    band_x_min = np.where(crosses, np.minimum(x_low, x_high), np.inf).min(axis=0)
+    band_x_max = np.where(crosses, np.maximum(x_low, x_high), -np.inf).max(axis=0)
+
+    col_start = np.clip(np.floor(band_x_min), 0, width).astype(np.int64)
+    col_stop = np.clip(np.maximum(np.ceil(band_x_max), np.floor(band_x_min) + 1), 0, width).astype(np.int64)
+    n_cols = np.maximum(col_stop - col_start, 0)
+    pixel_band = np.repeat(np.arange(band_poly.size), n_cols)
+    pixel_col = col_start[pixel_band] + run_offsets(n_cols)
+    return band_poly[pixel_band], band_row[pixel_band], pixel_col
+
+
+def footprint_class_stats(
+    values: np.ndarray,
+    poly_ids: np.ndarray,
+    n_polys: int,
+    classes: np.ndarray,
+    fraction_classes: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Classe dominante, sua fração, pixels válidos e frações de cada classe pedida, por polígono.
+
+    ``values`` são as classes (válidas) dos pixels tocados e ``classes`` as classes
+    possíveis em ordem crescente; empates ficam com a menor classe.
+    """
+    codes = np.searchsorted(classes, values)
+    counts = np.bincount(poly_ids * classes.size + codes, minlength=n_polys * classes.size)
+    counts = counts.reshape(n_polys, classes.size)
+    totals = counts.sum(axis=1)
+    has_pixels = totals > 0
+    modes = np.full(n_polys, np.nan)
+    mode_fraction = np.full(n_polys, np.nan)
+    fractions = np.full((fraction_classes.size, n_polys), np.nan)
+    if classes.size:
+        best = counts.argmax(axis=1)
+        modes[has_pixels] = classes[best[has_pixels]]
+        mode_fraction[has_pixels] = counts[has_pixels, best[has_pixels]] / totals[has_pixels]
+    position = np.searchsorted(classes, fraction_classes)
+    for k, (value, pos) in enumerate(zip(fraction_classes, position)):
+        present = pos < classes.size and classes[min(pos, classes.size - 1)] == value
+        class_counts = counts[:, pos] if present else np.zeros(n_polys, dtype=np.int64)
+        fractions[k, has_pixels] = class_counts[has_pixels] / totals[has_pixels]
+    return modes, mode_fraction, totals, fractions
+
+
+def sample_footprint(
+    dataset: rasterio.io.DatasetReader,
+    x_native: np.ndarray,
+    y_native: np.ndarray,
+    gauge_m: float,
+    tyre_width_m: float,
+    fraction_classes: Iterable[int] = (),
+    previous_xy: tuple[float, float] | None = None,
+    previous_heading: tuple[float, float] | None = None,
+) -> Dict[str, np.ndarray]:
+    """Colunas ``{roda}_*`` (left/right) com as classes sob cada roda entre fixos consecutivos.
+
+    Conta todos os pixels tocados pelo retângulo da roda: classe dominante, sua fração,
+    pixels válidos e ``frac_{classe}`` para cada classe de ``fraction_classes``. Em
+    raster com CRS geográfico bitola e pneu são convertidos pela escala local do ponto.
+    """
+    x_native = np.asarray(x_native, dtype=float)
+    y_native = np.asarray(y_native, dtype=float)
+    rectangles = wheel_rectangles(
+        x_native,
+        y_native,
+        gauge_m,
+        tyre_width_m,
+        previous_xy,
+        previous_heading=previous_heading,
+        scale_xy=metres_per_unit(dataset.crs, y_native),
+    )
+    n_wheels, n_points = rectangles.shape[:2]
+    inverse = ~dataset.transform
+    corner_x, corner_y = rectangles[..., 0].reshape(-1, 4), rectangles[..., 1].reshape(-1, 4)
+    poly_cols = inverse.a * corner_x + inverse.b * corner_y + inverse.c
+    poly_rows = inverse.d * corner_x + inverse.e * corner_y + inverse.f
+    fraction_classes = np.asarray(sorted(fraction_classes), dtype=float)
+
+    n_polys = poly_cols.shape[0]
+    modes = np.full(n_polys, np.nan)
+    mode_fraction = np.full(n_polys, np.nan)
+    totals = np.zeros(n_polys, dtype=np.int64)
+    fractions = np.full((fraction_classes.size, n_polys), np.nan)
+
+    with np.errstate(invalid="ignore"):
+        center_cols = np.floor(poly_cols.mean(axis=1))
+        center_rows = np.floor(poly_rows.mean(axis=1))
+        half_cols = np.nan_to_num(np.ceil(np.ptp(poly_cols, axis=1) / 2.0))
+        half_rows = np.nan_to_num(np.ceil(np.ptp(poly_rows, axis=1) / 2.0))
+    inside = (
+        np.isfinite(center_rows)
+        & (center_rows >= 0)
+        & (center_rows < dataset.height)
+        & (center_cols >= 0)
+        & (center_cols < dataset.width)
+    )
+    center_rows = np.where(inside, center_rows, 0).astype(np.int64)
+    center_cols = np.where(inside, center_cols, 0).astype(np.int64)
+    windows = route_read_windows(
+        center_rows,
+        center_cols,
+        inside,
+        dataset.height,
+        dataset.width,
+        int(half_cols[inside].max(initial=0)) + 1,
+        int(half_rows[inside].max(initial=0)) + 1,
+    )
+    for window, poly_idx in windows:
+        band = dataset.read(1, window=window)
+        valid = valid_pixel_mask(band, dataset.nodata)
+        row_off, col_off = int(window.row_off), int(window.col_off)
+        ids, rows, cols = rasterize_convex_polygons(
+            poly_cols[poly_idx] - col_off, poly_rows[poly_idx] - row_off, band.shape[0], band.shape[1]
+        )
+        keep = valid[rows, cols]
+        values = band[rows[keep], cols[keep]].astype(float)
+        (
+            modes[poly_idx],
+            mode_fraction[poly_idx],
+            totals[poly_idx],
+            fractions[:, poly_idx],
+        ) = footprint_class_stats(values, ids[keep], poly_idx.size, np.unique(values), fraction_classes)
+
+    columns: Dict[str, np.ndarray] = {}
+    for wheel, name in enumerate(("left", "right")):
+        points = slice(wheel * n_points, (wheel + 1) * n_points)
+        columns[f"{name}_class_mode"] = class_id_column(modes[points])
+        columns[f"{name}_mode_fraction"] = mode_fraction[points]
+        columns[f"{name}_valid_pixels"] = totals[points]
+        for value, column in zip(fraction_classes, fractions[:, points]):
+            columns[f"{name}_frac_{value:g}"] = column
+    return columns
+
+
+def sample_raster_spec(
+    cache: RouteSamplingCache,
     raster_spec: RasterSpec,
     window_radius_m: float,
+    store: PixelStatsStore | None = None,
 ) -> pd.DataFrame:
+    """Colunas ``{prefixo}_*`` de um raster para todos os pontos da rota em ``cache``."""
     if not raster_spec.raster_path.exists():
         raise FileNotFoundError(f"Raster não encontrado: {raster_spec.raster_path}")
 
     legend = load_legend(raster_spec.legend_csv)
-
     with rasterio.open(raster_spec.raster_path) as dataset:
-        x_native, y_native = transform_points(
-            route_df[x_col].to_numpy(dtype=float),
-            route_df[y_col].to_numpy(dtype=float),
-            src_crs=route_crs,
-            dst_crs=dataset.crs,
+        return sample_open_raster(cache, dataset, raster_spec, legend, window_radius_m, store=store)
+
+
+def sample_open_raster(
+    cache: RouteSamplingCache,
+    dataset: rasterio.io.DatasetReader,
+    raster_spec: RasterSpec,
+    legend: Dict[int, str],
+    window_radius_m: float,
+    stable_dtypes: bool = False,
+    store: PixelStatsStore | None = None,
+) -> pd.DataFrame:
+    """Como :func:`sample_raster_spec`, com o raster já aberto e a legenda já lida.
+
+    Com ``stable_dtypes`` as colunas de classe têm o mesmo tipo em qualquer bloco da
+    rota (``Int64`` para rasters inteiros, ``float64`` para os demais; nomes como
+    ``string``), o que permite gravar blocos sucessivos no mesmo CSV/Parquet.
+    """
+    x_native, y_native = cache.native_coords(dataset.crs)
+    sampled_df = sample_raster(
+        dataset,
+        x_native,
+        y_native,
+        radius_m=window_radius_m,
+        pixel_index=cache.pixel_index(dataset),
+        store=store,
+    )
+    if raster_spec.distance_targets:
+        distances = sample_class_distances(
+            dataset, cache.pixel_index(dataset), raster_spec.distance_targets, raster_spec.distance_max_m
+        )
+        for column, values in distances.items():
+            sampled_df[column] = values
+    if raster_spec.footprint is not None:
+        gauge_m, tyre_width_m = raster_spec.footprint
+        footprint = sample_footprint(
+            dataset,
+            x_native,
+            y_native,
+            gauge_m,
+            tyre_width_m,
+            fraction_classes=legend.keys(),
+            previous_xy=cache.native_previous(dataset.crs),
+            previous_heading=cache.native_previous_heading(dataset.crs),
         )
-        sampled_df = sample_raster(dataset, x_native, y_native, radius_m=window_radius_m)
+        for column, values in footprint.items():
+            sampled_df[column] = values
+    if stable_dtypes:
+        class_dtype = "Int64" if np.issubdtype(np.dtype(dataset.dtypes[0]), np.integer) else "float64"
+        for column in ("class_id_point", "class_id_mode"):
+            sampled_df[column] = sampled_df[column].astype(class_dtype)
 
     prefix = raster_spec.prefix
-    sampled_df = sampled_df.rename(
-        columns={
-            "pixel_row": f"{prefix}_pixel_row",
-            "pixel_col": f"{prefix}_pixel_col",
-            "class_id_point": f"{prefix}_class_id_point",
-            "class_id_mode": f"{prefix}_class_id_mode",
-            "window_valid_pixels": f"{prefix}_window_valid_pixels",
-            "inside_raster": f"{prefix}_inside_raster",
-        }
-    )
+    sampled_df = sampled_df.add_prefix(f"{prefix}_")
 
     sampled_df[f"{prefix}_source_raster"] = str(raster_spec.raster_path)
     if legend:
         sampled_df[f"{prefix}_class_name_point"] = sampled_df[f"{prefix}_class_id_point"].map(legend)
         sampled_df[f"{prefix}_class_name_mode"] = sampled_df[f"{prefix}_class_id_mode"].map(legend)
+        if stable_dtypes:
+            for column in (f"{prefix}_class_name_point", f"{prefix}_class_name_mode"):
+                sampled_df[column] = sampled_df[column].astype("string")
+    return sampled_df
+
+
+def open_stack(spec: StackSpec, stack: ExitStack) -> RasterStack:
+    """Abre os arquivos da série no ``ExitStack`` e monta o :class:`RasterStack`."""
+    for _, path in spec.entries:
+        if not path.exists():
+            raise FileNotFoundError(f"Raster não encontrado: {path}")
+    if len(spec.entries) == 1 and spec.entries[0][0] is None:
+        dataset = stack.enter_context(rasterio.open(spec.entries[0][1]))
+        epochs = [
+            description or str(index) for index, description in enumerate(dataset.descriptions, start=1)
+        ]
+        return RasterStack([(dataset, index) for index in range(1, dataset.count + 1)], epochs)
+    bands = [(stack.enter_context(rasterio.open(path)), 1) for _, path in spec.entries]
+    return RasterStack(bands, [str(label) for label, _ in spec.entries])
+
+
+def sample_stack_spec(
+    cache: RouteSamplingCache,
+    stack_spec: StackSpec,
+    window_radius_m: float,
+    time_values: pd.Series | None = None,
+    store: PixelStatsStore | None = None,
+) -> pd.DataFrame:
+    """Colunas ``{prefixo}_{época}_*`` de uma série temporal para os pontos em ``cache``."""
+    legend = load_legend(stack_spec.legend_csv)
+    with ExitStack() as files:
+        stack = open_stack(stack_spec, files)
+        return sample_open_stack(cache, stack, stack_spec, legend, window_radius_m, time_values, store=store)
+
+
+def sample_open_stack(
+    cache: RouteSamplingCache,
+    stack: RasterStack,
+    stack_spec: StackSpec,
+    legend: Dict[int, str],
+    window_radius_m: float,
+    time_values: pd.Series | None = None,
+    stable_dtypes: bool = False,
+    store: PixelStatsStore | None = None,
+) -> pd.DataFrame:
+    """Como :func:`sample_open_raster` para uma série; ``time_values`` escolhe a época de cada ponto."""
+    x_native, y_native = cache.native_coords(stack.crs)
+    point_epochs = epochs_for_times(stack.epochs, time_values) if time_values is not None else None
+    sampled_df = sample_stack(
+        stack,
+        x_native,
+        y_native,
+        radius_m=window_radius_m,
+        pixel_index=cache.pixel_index(stack),
+        point_epochs=point_epochs,
+        store=store,
+    )
+    class_columns = [
+        column
+        for column in sampled_df.columns
+        if column.endswith(("class_id_point", "class_id_mode"))
+    ]
+    if stable_dtypes:
+        class_dtype = "Int64" if np.issubdtype(stack.dtype, np.integer) else "float64"
+        for column in class_columns:
+            sampled_df[column] = sampled_df[column].astype(class_dtype)
+        if "epoch" in sampled_df.columns:
+            sampled_df["epoch"] = sampled_df["epoch"].astype("string")
+    if legend and point_epochs is not None:
+        for kind in ("point", "mode"):
+            sampled_df[f"class_name_{kind}"] = sampled_df[f"class_id_{kind}"].map(legend)
+            if stable_dtypes:
+                sampled_df[f"class_name_{kind}"] = sampled_df[f"class_name_{kind}"].astype("string")
+
+    prefix = stack_spec.prefix
+    sampled_df = sampled_df.add_prefix(f"{prefix}_")
+    sampled_df[f"{prefix}_source_raster"] = ",".join(str(path) for _, path in stack_spec.entries)
+    return sampled_df
+
+
+def window_moments(
+    band: np.ndarray,
+    valid: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    radius_x_px: int,
+    radius_y_px: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Média, desvio padrão (populacional) e pixels válidos na vizinhança de cada pixel.
+
+    Usa tabelas de somas acumuladas de x e x² quando montá-las custa menos que extrair
+    as vizinhanças. Os valores são centrados na média da banda antes das somas para
+    limitar o cancelamento numérico na variância.
+    """
+    window_px = (2 * radius_x_px + 1) * (2 * radius_y_px + 1)
+    means = np.full(rows.size, np.nan)
+    stds = np.full(rows.size, np.nan)
+    if 3 * band.size < rows.size * window_px:
+        reference = float(band[valid].mean()) if valid.any() else 0.0
+        centered = np.where(valid, band - reference, 0.0)
+        bounds = window_bounds(rows, cols, *band.shape, radius_x_px, radius_y_px)
+        counts = box_counts(valid, *bounds).astype(np.int64)
+        sums = box_sums(centered, *bounds)
+        squares = box_sums(centered * centered, *bounds)
+        filled = counts > 0
+        centered_means = sums[filled] / counts[filled]
+        means[filled] = centered_means + reference
+        stds[filled] = np.sqrt(np.maximum(squares[filled] / counts[filled] - centered_means**2, 0.0))
+        return means, stds, counts
+
+    counts = np.zeros(rows.size, dtype=np.int64)
+    for points, values, values_valid in window_neighbourhoods(
+        band, valid, rows, cols, radius_x_px, radius_y_px
+    ):
+        n = values_valid.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(values_valid, values, 0.0).sum(axis=1) / n
+            deviation = np.where(values_valid, values - mean[:, None], 0.0)
+            stds[points] = np.sqrt((deviation * deviation).sum(axis=1) / n)
+        means[points] = mean
+        counts[points] = n
+    return means, stds, counts
+
+
+def window_percentiles(
+    band: np.ndarray,
+    valid: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    radius_x_px: int,
+    radius_y_px: int,
+    percentiles: tuple[float, ...],
+) -> np.ndarray:
+    """Percentis dos valores válidos da vizinhança, com forma (percentil, pixel)."""
+    out = np.full((len(percentiles), rows.size), np.nan)
+    for points, values, values_valid in window_neighbourhoods(
+        band, valid, rows, cols, radius_x_px, radius_y_px
+    ):
+        with warnings.catch_warnings():
+            # Vizinhanças sem valor válido resultam em NaN.
+            warnings.simplefilter("ignore", RuntimeWarning)
+            out[:, points] = np.nanpercentile(np.where(values_valid, values, np.nan), percentiles, axis=1)
+    return out
+
+
+def horn_terrain(
+    band: np.ndarray,
+    valid: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    res_x: float | np.ndarray,
+    res_y: float | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Declividade (graus) e orientação (graus a partir do norte, sentido horário) de Horn.
+
+    Calculadas só nos pixels pedidos, a partir da vizinhança 3x3; a borda da banda é
+    replicada e um vizinho inválido deixa o pixel sem valor. Terreno plano não tem
+    orientação (NaN). ``res_x``/``res_y`` são o tamanho do pixel em metros, por pixel
+    pedido em rasters com CRS geográfico.
+    """
+    height, width = band.shape
+    values = np.where(valid, band, np.nan)
+
+    def at(dy: int, dx: int) -> np.ndarray:
+        return values[np.clip(rows + dy, 0, height - 1), np.clip(cols + dx, 0, width - 1)]
+
+    a, b, c = at(-1, -1), at(-1, 0), at(-1, 1)
+    d, f = at(0, -1), at(0, 1)
+    g, h, i = at(1, -1), at(1, 0), at(1, 1)
+    dz_dx = ((c + 2 * f + i) - (a + 2 * d + g)) / (8.0 * np.abs(res_x))
+    dz_dy = ((g + 2 * h + i) - (a + 2 * b + c)) / (8.0 * np.abs(res_y))
+    slope = np.degrees(np.arctan(np.hypot(dz_dx, dz_dy)))
+    aspect = np.mod(90.0 - np.degrees(np.arctan2(dz_dy, -dz_dx)), 360.0)
+    aspect[(dz_dx == 0) & (dz_dy == 0)] = np.nan
+    return slope, aspect
+
+
+def cubic_weights(fraction: np.ndarray) -> np.ndarray:
+    """Pesos da convolução cúbica de Keys (a = -0.5) para os vizinhos -1, 0, 1 e 2."""
+    distance = np.abs(fraction[:, None] - np.arange(-1, 3)[None, :])
+    near = (1.5 * distance - 2.5) * distance * distance + 1.0
+    far = ((-0.5 * distance + 2.5) * distance - 4.0) * distance + 2.0
+    return np.where(distance <= 1.0, near, np.where(distance < 2.0, far, 0.0))
+
+
+def interpolate_points(
+    band: np.ndarray,
+    valid: np.ndarray,
+    row_frac: np.ndarray,
+    col_frac: np.ndarray,
+    method: str,
+) -> np.ndarray:
+    """Valor da banda em posições fracionárias (linha, coluna) medidas em centros de pixel.
+
+    Na bilinear, vizinhos inválidos saem da média e os pesos restantes são
+    renormalizados; na bicúbica, um vizinho inválido faz o ponto usar a bilinear.
+    """
+    height, width = band.shape
+    if method == "nearest":
+        rows = np.clip(np.floor(row_frac + 0.5).astype(np.int64), 0, height - 1)
+        cols = np.clip(np.floor(col_frac + 0.5).astype(np.int64), 0, width - 1)
+        return np.where(valid[rows, cols], band[rows, cols], np.nan)
+
+    row0 = np.floor(row_frac).astype(np.int64)
+    col0 = np.floor(col_frac).astype(np.int64)
+    fr = row_frac - row0
+    fc = col_frac - col0
+    if method == "bicubic":
+        offsets = np.arange(-1, 3)
+        weights_r, weights_c = cubic_weights(fr), cubic_weights(fc)
+    else:
+        offsets = np.arange(0, 2)
+        weights_r = np.stack([1.0 - fr, fr], axis=1)
+        weights_c = np.stack([1.0 - fc, fc], axis=1)
+    index = (
+        np.clip(row0[:, None] + offsets[None, :], 0, height - 1)[:, :, None],
+        np.clip(col0[:, None] + offsets[None, :], 0, width - 1)[:, None, :],
+    )
+    weights = weights_r[:, :, None] * weights_c[:, None, :]
+    neighbour_valid = valid[index]
+    values = np.where(neighbour_valid, band[index], 0.0)
+    if method == "bicubic":
+        result = (weights * values).sum(axis=(1, 2))
+        incomplete = ~neighbour_valid.all(axis=(1, 2))
+        if incomplete.any():
+            result[incomplete] = interpolate_points(
+                band, valid, row_frac[incomplete], col_frac[incomplete], "bilinear"
+            )
+        return result
+    weights = np.where(neighbour_valid, weights, 0.0)
+    total = weights.sum(axis=(1, 2))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(total > 0, (weights * values).sum(axis=(1, 2)) / total, np.nan)
+
+
+def sample_continuous(
+    dataset: rasterio.io.DatasetReader,
+    x_native: np.ndarray,
+    y_native: np.ndarray,
+    radius_m: float,
+    interpolation: str = "bilinear",
+    terrain: bool = False,
+    percentiles: tuple[float, ...] = (),
+    pixel_index: PixelIndex | None = None,
+) -> pd.DataFrame:
+    """Valor interpolado em cada ponto e média/desvio/percentis da janela no seu pixel.
+
+    Estatísticas de janela e terreno são calculadas uma vez por pixel distinto, como
+    em :func:`sample_raster`; só a interpolação usa a posição exata de cada ponto.
+    """
+    if interpolation not in INTERPOLATIONS:
+        raise ValueError(f"Interpolação '{interpolation}' inválida. Use {', '.join(INTERPOLATIONS)}.")
+    x_native = np.asarray(x_native, dtype=float)
+    y_native = np.asarray(y_native, dtype=float)
+    if pixel_index is None:
+        pixel_index = build_pixel_index(dataset.transform, dataset.height, dataset.width, x_native, y_native)
+    radius_x_px, radius_y_px = compute_window_radius_px(dataset, radius_m)
+    halo = 2 if interpolation == "bicubic" else 1
+    pixel_rows, pixel_cols = pixel_index.pixel_rows, pixel_index.pixel_cols
+    n_pixels = pixel_rows.size
+
+    inverse = ~dataset.transform
+    col_frac = inverse.a * x_native + inverse.b * y_native + inverse.c - 0.5
+    row_frac = inverse.d * x_native + inverse.e * y_native + inverse.f - 0.5
+
+    values = np.full(pixel_index.inside.size, np.nan)
+    means = np.full(n_pixels, np.nan)
+    stds = np.full(n_pixels, np.nan)
+    counts = np.zeros(n_pixels, dtype=np.int64)
+    pixel_percentiles = np.full((len(percentiles), n_pixels), np.nan)
+    slopes = np.full(n_pixels, np.nan)
+    aspects = np.full(n_pixels, np.nan)
+    if terrain:
+        res_x_m, res_y_m = pixel_size_m(dataset, pixel_rows, pixel_cols)
+
+    windows = route_read_windows(
+        pixel_rows,
+        pixel_cols,
+        np.ones(n_pixels, dtype=bool),
+        dataset.height,
+        dataset.width,
+        max(radius_x_px, halo),
+        max(radius_y_px, halo),
+    )
+    in_window = np.zeros(n_pixels, dtype=bool)
+    for window, pixel_idx in windows:
+        band = dataset.read(1, window=window).astype(np.float64)
+        valid = valid_pixel_mask(band, dataset.nodata)
+        row_off, col_off = int(window.row_off), int(window.col_off)
+        rows_local = pixel_rows[pixel_idx] - row_off
+        cols_local = pixel_cols[pixel_idx] - col_off
+
+        means[pixel_idx], stds[pixel_idx], counts[pixel_idx] = window_moments(
+            band, valid, rows_local, cols_local, radius_x_px, radius_y_px
+        )
+        if percentiles:
+            pixel_percentiles[:, pixel_idx] = window_percentiles(
+                band, valid, rows_local, cols_local, radius_x_px, radius_y_px, percentiles
+            )
+        if terrain:
+            slopes[pixel_idx], aspects[pixel_idx] = horn_terrain(
+                band, valid, rows_local, cols_local, res_x_m[pixel_idx], res_y_m[pixel_idx]
+            )
+
+        # Pontos cujos pixels esta janela atende; recorte à janela replica a borda do raster.
+        in_window[:] = False
+        in_window[pixel_idx] = True
+        points = np.flatnonzero(pixel_index.inside & in_window[np.maximum(pixel_index.point_to_pixel, 0)])
+        values[points] = interpolate_points(
+            band, valid, row_frac[points] - row_off, col_frac[points] - col_off, interpolation
+        )
+
+    columns: Dict[str, np.ndarray] = {
+        "pixel_row": pixel_index.rows,
+        "pixel_col": pixel_index.cols,
+        "inside_raster": pixel_index.inside,
+        "value": values,
+        "window_mean": scatter_to_points(pixel_index, means, np.nan),
+        "window_std": scatter_to_points(pixel_index, stds, np.nan),
+        "window_valid_pixels": scatter_to_points(pixel_index, counts, 0),
+    }
+    for q, column in zip(percentiles, pixel_percentiles):
+        columns[f"window_p{q:g}"] = scatter_to_points(pixel_index, column, np.nan)
+    if terrain:
+        columns["slope_deg"] = scatter_to_points(pixel_index, slopes, np.nan)
+        columns["aspect_deg"] = scatter_to_points(pixel_index, aspects, np.nan)
+    return pd.DataFrame(columns)
+
+
+def sample_continuous_spec(
+    cache: RouteSamplingCache,
+    spec: ContinuousSpec,
+    window_radius_m: float,
+) -> pd.DataFrame:
+    """Colunas ``{prefixo}_*`` de um raster contínuo para todos os pontos da rota em ``cache``."""
+    if not spec.raster_path.exists():
+        raise FileNotFoundError(f"Raster não encontrado: {spec.raster_path}")
+    with rasterio.open(spec.raster_path) as dataset:
+        return sample_open_continuous(cache, dataset, spec, window_radius_m)
+
+
+def sample_open_continuous(
+    cache: RouteSamplingCache,
+    dataset: rasterio.io.DatasetReader,
+    spec: ContinuousSpec,
+    window_radius_m: float,
+) -> pd.DataFrame:
+    x_native, y_native = cache.native_coords(dataset.crs)
+    sampled_df = sample_continuous(
+        dataset,
+        x_native,
+        y_native,
+        radius_m=window_radius_m,
+        interpolation=spec.interpolation,
+        terrain=spec.terrain,
+        percentiles=spec.percentiles,
+        pixel_index=cache.pixel_index(dataset),
+    )
+    sampled_df = sampled_df.add_prefix(f"{spec.prefix}_")
+    sampled_df[f"{spec.prefix}_source_raster"] = str(spec.raster_path)
+    return sampled_df
 
+
+def enrich_route_with_raster(
+    route_df: pd.DataFrame,
+    x_col: str,
+    y_col: str,
+    route_crs: str,
+    raster_spec: RasterSpec,
+    window_radius_m: float,
+) -> pd.DataFrame:
+    cache = RouteSamplingCache(
+        route_df[x_col].to_numpy(dtype=float), route_df[y_col].to_numpy(dtype=float), route_crs
+    )
+    sampled_df = sample_raster_spec(cache, raster_spec, window_radius_m)
     return pd.concat([route_df.reset_index(drop=True), sampled_df], axis=1)
 
 
+def enrich_route_with_rasters(
+    route_df: pd.DataFrame,
+    x_col: str,
+    y_col: str,
+    route_crs: str,
+    raster_specs: List[RasterSpec],
+    window_radius_m: float,
+    workers: int | None = None,
+    stack_specs: List[StackSpec] | None = None,
+    time_col: str | None = None,
+    store: PixelStatsStore | None = None,
+    continuous_specs: List[ContinuousSpec] | None = None,
+) -> pd.DataFrame:
+    """Amostra vários rasters em paralelo (threads) e junta as colunas uma única vez.
+
+    Leitura (GDAL), reprojeção (PROJ) e as operações NumPy liberam o GIL. A ordem das
+    colunas segue ``raster_specs``, ``stack_specs`` e ``continuous_specs``; com
+    ``time_col`` cada série também recebe as colunas da época vigente em cada ponto. Com
+    ``store`` as estatísticas de pixels já vistos em execuções anteriores vêm do cache
+    em disco.
+    """
+    stack_specs = stack_specs or []
+    continuous_specs = continuous_specs or []
+    cache = RouteSamplingCache(
+        route_df[x_col].to_numpy(dtype=float), route_df[y_col].to_numpy(dtype=float), route_crs
+    )
+    time_values = route_df[time_col].reset_index(drop=True) if time_col is not None else None
+    if workers is None:
+        workers = min(len(raster_specs) + len(stack_specs) + len(continuous_specs), os.cpu_count() or 1)
+    if workers < 1:
+        raise ValueError("--workers deve ser >= 1.")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(sample_raster_spec, cache, spec, window_radius_m, store) for spec in raster_specs
+        ]
+        futures += [
+            executor.submit(sample_stack_spec, cache, spec, window_radius_m, time_values, store)
+            for spec in stack_specs
+        ]
+        futures += [
+            executor.submit(sample_continuous_spec, cache, spec, window_radius_m) for spec in continuous_specs
+        ]
+        sampled = [future.result() for future in futures]
+    return pd.concat([route_df.reset_index(drop=True), *sampled], axis=1)
+
+
+@dataclass
+class TransitionState:
+    """Estado de :func:`add_transition_features` entre blocos consecutivos da mesma rota."""
+
+    last_xy: tuple[float, float] | None = None
+    last_move_xy: tuple[tuple[float, float], tuple[float, float]] | None = None
+    cumulative_distance_m: float = 0.0
+    last_class: Dict[str, object] = field(default_factory=dict)
+
+
+def class_codes(values: np.ndarray) -> np.ndarray:
+    """Códigos inteiros das classes, na ordem de aparição; -1 para classe ausente."""
+    codes, _ = pd.factorize(values, use_na_sentinel=True)
+    return codes
+
+
 def add_transition_features(
     route_df: pd.DataFrame,
     prefixes: Iterable[str],
     x_col: str,
     y_col: str,
+    route_crs: str,
+    state: TransitionState | None = None,
 ) -> pd.DataFrame:
+    """Distâncias ao longo da rota (em metros, ver :func:`step_lengths_m`) e mudanças de
+    classe modal por prefixo.
+
+    Há mudança quando a classe modal difere da do ponto anterior e ambas existem. Com
+    ``state`` o bloco continua o anterior: o primeiro ponto mede a distância e a
+    mudança de classe em relação ao último ponto do bloco anterior, e ``state`` é
+    atualizado para o próximo bloco (inclusive o último deslocamento, que dá o rumo
+    das rodas enquanto o bloco seguinte começa parado).
+    """
     enriched = route_df.copy()
-
-    dx = enriched[x_col].diff().fillna(0.0)
-    dy = enriched[y_col].diff().fillna(0.0)
-    enriched["segment_length_m"] = np.sqrt(dx**2 + dy**2)
-    enriched["cumulative_distance_m"] = enriched["segment_length_m"].cumsum()
+    resume = state is not None and state.last_xy is not None and len(enriched) > 0
+
+    x = enriched[x_col].to_numpy(dtype=float)
+    y = enriched[y_col].to_numpy(dtype=float)
+    if resume:
+        start_x, start_y = state.last_xy  # type: ignore[union-attr, misc]
+    else:
+        start_x, start_y = (x[0], y[0]) if x.size else (0.0, 0.0)
+    previous_x = np.concatenate([[start_x], x])[:-1]
+    previous_y = np.concatenate([[start_y], y])[:-1]
+    enriched["segment_length_m"] = np.nan_to_num(
+        step_lengths_m(previous_x, previous_y, x, y, route_crs), nan=0.0
+    )
+    offset = state.cumulative_distance_m if state is not None else 0.0
+    # Soma a partir do acumulado anterior na mesma ordem de uma rota inteira.
+    enriched["cumulative_distance_m"] = np.cumsum(
+        np.concatenate([[offset], enriched["segment_length_m"].to_numpy()])
+    )[1:]
 
     for prefix in prefixes:
         mode_col = f"{prefix}_class_id_mode"
         if mode_col not in enriched.columns:
             continue
-        enriched[f"{prefix}_class_change"] = (
-            enriched[mode_col].astype("string") != enriched[mode_col].shift(1).astype("string")
-        ).fillna(False)
-
+        modes = enriched[mode_col].to_numpy(dtype=float, na_value=np.nan)
+        previous = state.last_class.get(prefix, np.nan) if resume else np.nan  # type: ignore[union-attr]
+        codes = class_codes(np.concatenate([[previous], modes]))
+        enriched[f"{prefix}_class_change"] = (codes[1:] != codes[:-1]) & (codes[1:] >= 0) & (codes[:-1] >= 0)
+        if state is not None and len(enriched) > 0:
+            state.last_class[prefix] = float(modes[-1])
+
+    if state is not None and len(enriched) > 0:
+        moves = np.flatnonzero((x != previous_x) | (y != previous_y))
+        moves = moves[np.isfinite(x[moves] + y[moves] + previous_x[moves] + previous_y[moves])]
+        if moves.size:
+            last = moves[-1]
+            state.last_move_xy = (
+                (float(previous_x[last]), float(previous_y[last])),
+                (float(x[last]), float(y[last])),
+            )
+        state.last_xy = (float(x[-1]), float(y[-1]))
+        state.cumulative_distance_m = float(enriched["cumulative_distance_m"].iloc[-1])
     return enriched
 
 
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(
-        description="Enriquece trajetos CSV com classes de uso/cobertura do solo de rasters locais."
-    )
-    parser.add_argument("--route-csv", type=Path, required=True, help="CSV com o trajeto GPS/RTK.")
-    parser.add_argument("--output-csv", type=Path, required=True, help="CSV enriquecido de saída.")
-    parser.add_argument("--x-col", default="x", help="Coluna X/longitude/easting do CSV.")
-    parser.add_argument("--y-col", default="y", help="Coluna Y/latitude/northing do CSV.")
-    parser.add_argument(
-        "--route-crs",
-        default="EPSG:4326",
-        help="CRS das coordenadas do trajeto. Ex.: EPSG:4326, EPSG:31983.",
-    )
+SEGMENT_COLUMNS = {
+    "prefix": "string",
+    "start_index": "int64",
+    "end_index": "int64",
+    "class_id": "float64",
+    "class_name": "string",
+    "n_points": "int64",
+    "length_m": "float64",
+    "duration_s": "float64",
+}
+
+
+@dataclass
+class SegmentState:
+    """Estado de :func:`transition_segments` entre blocos: o último trecho de cada prefixo
+    fica aberto até o bloco seguinte dizer se ele continua."""
+
+    rows_seen: int = 0
+    last_time: float | None = None
+    open_segments: Dict[str, pd.DataFrame] = field(default_factory=dict)
+
+
+def time_seconds(values: pd.Series) -> np.ndarray:
+    """Instantes em segundos: colunas numéricas como estão, datas/horas desde 1970 (UTC)."""
+    if pd.api.types.is_numeric_dtype(values):
+        return values.to_numpy(dtype=float, na_value=np.nan)
+    times = pd.to_datetime(values, errors="coerce", utc=True)
+    return (times - pd.Timestamp(0, tz="UTC")).dt.total_seconds().to_numpy(dtype=float, na_value=np.nan)
+
+
+def transition_segments(
+    route_df: pd.DataFrame,
+    prefixes: Iterable[str],
+    time_col: str | None = None,
+    state: SegmentState | None = None,
+) -> pd.DataFrame:
+    """Tabela de trechos homogêneos (mesma classe modal consecutiva) por prefixo.
+
+    Espera as colunas de :func:`add_transition_features`. Cada ponto contribui com o
+    passo desde o ponto anterior, então ``length_m`` (e ``duration_s``, com
+    ``time_col``) somam o total da rota. Pontos sem classe formam trechos próprios.
+    Com ``state`` os índices continuam os dos blocos anteriores e o último trecho de
+    cada prefixo só é devolvido quando termina (ver :func:`flush_segments`).
+    """
+    n = len(route_df)
+    offset = state.rows_seen if state is not None else 0
+    lengths = route_df["segment_length_m"].to_numpy(dtype=float)
+    durations = np.full(n, np.nan)
+    if time_col is not None:
+        if time_col not in route_df.columns:
+            raise ValueError(f"Coluna de tempo '{time_col}' não encontrada no trajeto.")
+        times = time_seconds(route_df[time_col])
+        if n:
+            start = state.last_time if state is not None and state.last_time is not None else times[0]
+            durations = np.diff(times, prepend=start)
+            if state is not None:
+                state.last_time = float(times[-1])
+
+    segments = []
+    for prefix in prefixes:
+        mode_col = f"{prefix}_class_id_mode"
+        if mode_col not in route_df.columns or n == 0:
+            continue
+        modes = route_df[mode_col].to_numpy(dtype=float, na_value=np.nan)
+        codes = class_codes(modes)
+        starts = np.flatnonzero(np.concatenate([[True], codes[1:] != codes[:-1]]))
+        ends = np.append(starts[1:], n) - 1
+        name_col = f"{prefix}_class_name_mode"
+        prefix_segments = pd.DataFrame(
+            {
+                "prefix": prefix,
+                "start_index": starts + offset,
+                "end_index": ends + offset,
+                "class_id": modes[starts],
+                "class_name": route_df[name_col].to_numpy()[starts] if name_col in route_df.columns else None,
+                "n_points": ends - starts + 1,
+                "length_m": np.add.reduceat(lengths, starts),
+                "duration_s": np.add.reduceat(durations, starts),
+            }
+        ).astype(SEGMENT_COLUMNS)
+        if state is not None:
+            prefix_segments = continue_open_segment(state.open_segments.pop(prefix, None), prefix_segments)
+            state.open_segments[prefix] = prefix_segments.iloc[-1:].reset_index(drop=True)
+            prefix_segments = prefix_segments.iloc[:-1]
+        segments.append(prefix_segments)
+
+    if state is not None:
+        state.rows_seen += n
+    if not segments:
+        return pd.DataFrame(columns=list(SEGMENT_COLUMNS)).astype(SEGMENT_COLUMNS)
+    return pd.concat(segments, ignore_index=True)
+
+
+def continue_open_segment(open_segment: pd.DataFrame | None, segments: pd.DataFrame) -> pd.DataFrame:
+    """Junta o trecho aberto do bloco anterior ao primeiro trecho do bloco, se a classe continua."""
+    if open_segment is None:
+        return segments
+    previous_class = open_segment["class_id"].iloc[0]
+    first_class = segments["class_id"].iloc[0]
+    same_class = previous_class == first_class or (pd.isna(previous_class) and pd.isna(first_class))
+    if not same_class:
+        return pd.concat([open_segment, segments], ignore_index=True)
+    segments = segments.copy()
+    segments.loc[0, "start_index"] = open_segment["start_index"].iloc[0]
+    for column in ("n_points", "length_m", "duration_s"):
+        segments.loc[0, column] += open_segment[column].iloc[0]
+    return segments
+
+
+def flush_segments(state: SegmentState) -> pd.DataFrame:
+    """Trechos ainda abertos ao fim da rota."""
+    segments = list(state.open_segments.values())
+    state.open_segments.clear()
+    if not segments:
+        return pd.DataFrame(columns=list(SEGMENT_COLUMNS)).astype(SEGMENT_COLUMNS)
+    return pd.concat(segments, ignore_index=True)
+
+
+class ChunkWriter:
+    """Grava blocos de um DataFrame em sequência: Parquet para ``.parquet``, CSV nos demais casos."""
+
+    def __init__(self, out_path: Path) -> None:
+        self.out_path = out_path
+        self.parquet = out_path.suffix.lower() in (".parquet", ".pq")
+        self._parquet_writer = None
+        self._rows = 0
+
+    def write(self, frame: pd.DataFrame) -> None:
+        if self.parquet:
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError as exc:  # pragma: no cover - falha explícita em runtime
+                raise SystemExit("Dependência ausente: instale 'pyarrow' para gravar Parquet.") from exc
+            if self._parquet_writer is None:
+                table = pa.Table.from_pandas(frame, preserve_index=False)
+                self._parquet_writer = pq.ParquetWriter(self.out_path, table.schema)
+            else:
+                table = pa.Table.from_pandas(frame, schema=self._parquet_writer.schema, preserve_index=False)
+            self._parquet_writer.write_table(table)
+        else:
+            first = self._rows == 0
+            frame.to_csv(self.out_path, mode="w" if first else "a", header=first, index=False)
+        self._rows += len(frame)
+
+    def close(self) -> int:
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        return self._rows
+
+
+def prepare_route_frame(
+    route_df: pd.DataFrame, x_col: str, y_col: str, time_col: str | None = None
+) -> pd.DataFrame:
+    validate_route_columns(route_df, x_col, y_col, time_col)
+    route_df = route_df.copy()
+    route_df[x_col] = pd.to_numeric(route_df[x_col], errors="raise")
+    route_df[y_col] = pd.to_numeric(route_df[y_col], errors="raise")
+    return route_df
+
+
+def enrich_route_csv_in_chunks(
+    route_csv: Path,
+    out_path: Path,
+    x_col: str,
+    y_col: str,
+    route_crs: str,
+    raster_specs: List[RasterSpec],
+    window_radius_m: float,
+    chunk_rows: int,
+    workers: int | None = None,
+    stack_specs: List[StackSpec] | None = None,
+    time_col: str | None = None,
+    store: PixelStatsStore | None = None,
+    segments_path: Path | None = None,
+    timestamp_col: str | None = None,
+    continuous_specs: List[ContinuousSpec] | None = None,
+) -> int:
+    """Enriquece o CSV da rota em blocos de ``chunk_rows`` linhas, gravando bloco a bloco.
+
+    Os rasters ficam abertos durante toda a execução e a memória fica limitada pelo
+    tamanho do bloco (janelas lidas cobrem só os pixels do bloco). Distância acumulada
+    e mudanças de classe continuam entre blocos via :class:`TransitionState`; com
+    ``segments_path`` os trechos fechados de cada bloco (:class:`SegmentState`) são
+    guardados por prefixo e gravados no fim, na mesma ordem da execução sem blocos.
+    Retorna o número de linhas gravadas.
+    """
+    if chunk_rows < 1:
+        raise ValueError("--chunk-rows deve ser >= 1.")
+    stack_specs = stack_specs or []
+    continuous_specs = continuous_specs or []
+    for spec in [*raster_specs, *continuous_specs]:
+        if not spec.raster_path.exists():
+            raise FileNotFoundError(f"Raster não encontrado: {spec.raster_path}")
+    legends = [load_legend(spec.legend_csv) for spec in raster_specs]
+    stack_legends = [load_legend(spec.legend_csv) for spec in stack_specs]
+    prefixes = [spec.prefix for spec in raster_specs]
+    if time_col is not None:
+        prefixes += [spec.prefix for spec in stack_specs]
+    if workers is None:
+        workers = min(len(raster_specs) + len(stack_specs) + len(continuous_specs), os.cpu_count() or 1)
+    if workers < 1:
+        raise ValueError("--workers deve ser >= 1.")
+
+    state = TransitionState()
+    writer = ChunkWriter(out_path)
+    segment_state = SegmentState()
+    # A tabela de trechos é pequena perto da rota; agrupar por prefixo evita intercalar blocos.
+    segment_parts: Dict[str, List[pd.DataFrame]] = {prefix: [] for prefix in prefixes}
+    with ExitStack() as files, ThreadPoolExecutor(max_workers=workers) as executor:
+        datasets = [files.enter_context(rasterio.open(spec.raster_path)) for spec in raster_specs]
+        stacks = [open_stack(spec, files) for spec in stack_specs]
+        continuous = [files.enter_context(rasterio.open(spec.raster_path)) for spec in continuous_specs]
+        for chunk in pd.read_csv(route_csv, chunksize=chunk_rows):
+            chunk = prepare_route_frame(chunk, x_col, y_col, time_col).reset_index(drop=True)
+            cache = RouteSamplingCache(
+                chunk[x_col].to_numpy(dtype=float),
+                chunk[y_col].to_numpy(dtype=float),
+                route_crs,
+                previous_xy=state.last_xy,
+                previous_move_xy=state.last_move_xy,
+            )
+            time_values = chunk[time_col] if time_col is not None else None
+            futures = [
+                executor.submit(
+                    sample_open_raster,
+                    cache,
+                    dataset,
+                    spec,
+                    legend,
+                    window_radius_m,
+                    stable_dtypes=True,
+                    store=store,
+                )
+                for dataset, spec, legend in zip(datasets, raster_specs, legends, strict=True)
+            ]
+            futures += [
+                executor.submit(
+                    sample_open_stack,
+                    cache,
+                    stack,
+                    spec,
+                    legend,
+                    window_radius_m,
+                    time_values,
+                    stable_dtypes=True,
+                    store=store,
+                )
+                for stack, spec, legend in zip(stacks, stack_specs, stack_legends, strict=True)
+            ]
+            futures += [
+                executor.submit(sample_open_continuous, cache, dataset, spec, window_radius_m)
+                for dataset, spec in zip(continuous, continuous_specs, strict=True)
+            ]
+            enriched = pd.concat([chunk, *(future.result() for future in futures)], axis=1)
+            enriched = add_transition_features(enriched, prefixes, x_col, y_col, route_crs, state=state)
+            writer.write(enriched)
+            if segments_path is not None:
+                closed = transition_segments(enriched, prefixes, timestamp_col, segment_state)
+                for prefix, part in closed.groupby("prefix", sort=False):
+                    segment_parts[prefix].append(part)
+    if segments_path is not None:
+        for prefix, part in flush_segments(segment_state).groupby("prefix", sort=False):
+            segment_parts[prefix].append(part)
+        segment_writer = ChunkWriter(segments_path)
+        ordered = [part for prefix in prefixes for part in segment_parts[prefix]]
+        segment_writer.write(
+            pd.concat(ordered, ignore_index=True)
+            if ordered
+            else pd.DataFrame(columns=list(SEGMENT_COLUMNS)).astype(SEGMENT_COLUMNS)
+        )
+        segment_writer.close()
+    return writer.close()
+
+
+def add_raster_arguments(parser: argparse.ArgumentParser) -> None:
+    """Argumentos dos rasters amostrados, comuns ao lote e ao serviço local."""
     parser.add_argument(
         "--window-radius-m",
         type=float,
@@ -295,49 +2237,227 @@ def parse_args() -> argparse.Namespace:
             "ou 'prefixo::arquivo.tif::legenda.csv'."
         ),
     )
+    parser.add_argument(
+        "--stack",
+        action="append",
+        default=[],
+        help=(
+            "Série temporal lida como cubo (época, linha, coluna). Formatos: 'serie.tif' "
+            "(multibanda, uma época por banda), 'prefixo::serie.tif[::legenda.csv]' ou "
+            "'prefixo::2019=a.tif,2020=b.tif[::legenda.csv]'."
+        ),
+    )
+    parser.add_argument(
+        "--continuous",
+        action="append",
+        default=[],
+        help=(
+            "Raster contínuo (MDE, NDVI, umidade): valor interpolado no ponto e média/desvio da "
+            "janela. Formatos: 'raster.tif', 'prefixo::raster.tif' ou "
+            "'prefixo::raster.tif::bicubic,terrain,p10,p90' (interpolação nearest/bilinear/bicubic, "
+            "declividade/orientação e percentis da janela)."
+        ),
+    )
+    parser.add_argument(
+        "--dist-to",
+        action="append",
+        default=[],
+        help=(
+            "Distância (m) de cada ponto a classes de um raster de --mapbiomas/--bdc, em colunas "
+            "{prefixo}_dist_to_{classe}_m. Formato: 'prefixo::4,33,edge' ('edge' = borda entre classes)."
+        ),
+    )
+    parser.add_argument(
+        "--dist-max-m",
+        type=float,
+        default=DEFAULT_DISTANCE_MAX_M,
+        help="Alcance da busca de --dist-to; feições mais distantes deixam a coluna vazia.",
+    )
+
+
+def raster_specs_from_args(
+    args: argparse.Namespace,
+) -> tuple[List[RasterSpec], List[StackSpec], List[ContinuousSpec]]:
+    """Especificações dos rasters a partir dos argumentos de :func:`add_raster_arguments`."""
+    raster_specs: List[RasterSpec] = []
+    raster_specs.extend(parse_raster_spec(item, default_prefix="mapbiomas") for item in args.mapbiomas)
+    raster_specs.extend(parse_raster_spec(item, default_prefix="bdc") for item in args.bdc)
+    if args.dist_max_m <= 0:
+        raise SystemExit("--dist-max-m deve ser > 0.")
+    for item in args.dist_to:
+        prefix, targets = parse_distance_targets(item)
+        matches = [i for i, spec in enumerate(raster_specs) if spec.prefix == prefix]
+        if not matches:
+            raise SystemExit(f"--dist-to: nenhum raster com prefixo '{prefix}'.")
+        for i in matches:
+            raster_specs[i] = replace(
+                raster_specs[i], distance_targets=targets, distance_max_m=args.dist_max_m
+            )
+    stack_specs = [parse_stack_spec(item) for item in args.stack]
+    continuous_specs = [parse_continuous_spec(item) for item in args.continuous]
+    if not raster_specs and not stack_specs and not continuous_specs:
+        raise SystemExit("Informe ao menos um raster em --mapbiomas, --bdc, --stack ou --continuous.")
+    return raster_specs, stack_specs, continuous_specs
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Enriquece trajetos CSV com classes de uso/cobertura do solo de rasters locais."
+    )
+    parser.add_argument("--route-csv", type=Path, required=True, help="CSV com o trajeto GPS/RTK.")
+    parser.add_argument(
+        "--output-csv",
+        type=Path,
+        required=True,
+        help="Arquivo enriquecido de saída (CSV; extensão .parquet grava Parquet).",
+    )
+    parser.add_argument("--x-col", default="x", help="Coluna X/longitude/easting do CSV.")
+    parser.add_argument("--y-col", default="y", help="Coluna Y/latitude/northing do CSV.")
+    parser.add_argument(
+        "--route-crs",
+        default="EPSG:4326",
+        help="CRS das coordenadas do trajeto. Ex.: EPSG:4326, EPSG:31983.",
+    )
+    add_raster_arguments(parser)
+    parser.add_argument(
+        "--footprint",
+        action="append",
+        default=[],
+        help=(
+            "Prefixo de um raster de --mapbiomas/--bdc amostrado sob as rodas: retângulos de cada "
+            "roda entre fixos consecutivos, com colunas {prefixo}_left_*/{prefixo}_right_* "
+            "(classe dominante, fração, pixels e fração de cada classe da legenda)."
+        ),
+    )
+    parser.add_argument("--track-gauge-m", type=float, default=None, help="Bitola (m) para --footprint.")
+    parser.add_argument(
+        "--tyre-width-m", type=float, default=0.6, help="Largura do pneu (m) para --footprint."
+    )
+    parser.add_argument(
+        "--time-col",
+        default=None,
+        help="Coluna de ano/data do trajeto; associa cada ponto à época vigente de cada --stack.",
+    )
+    parser.add_argument(
+        "--cache-db",
+        type=Path,
+        default=None,
+        help=(
+            "Banco SQLite com as estatísticas por pixel já calculadas, reaproveitado entre "
+            "execuções; invalidado automaticamente quando o conteúdo de um raster muda."
+        ),
+    )
+    parser.add_argument(
+        "--segments-out",
+        type=Path,
+        default=None,
+        help=(
+            "Grava também a tabela de trechos homogêneos (classe modal constante) por prefixo; "
+            "'.parquet' grava Parquet, demais extensões CSV."
+        ),
+    )
+    parser.add_argument(
+        "--timestamp-col",
+        default=None,
+        help="Coluna de instante de cada ponto (segundos ou data/hora) para a duração dos trechos.",
+    )
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=None,
+        help="Processa o trajeto em blocos de N linhas, gravando a saída incrementalmente.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Threads para amostrar rasters em paralelo (padrão: um por raster, até o nº de CPUs).",
+    )
     return parser.parse_args()
 
 
-def validate_route_columns(route_df: pd.DataFrame, x_col: str, y_col: str) -> None:
-    missing = [col for col in (x_col, y_col) if col not in route_df.columns]
+def validate_route_columns(
+    route_df: pd.DataFrame, x_col: str, y_col: str, time_col: str | None = None
+) -> None:
+    required = (x_col, y_col) if time_col is None else (x_col, y_col, time_col)
+    missing = [col for col in required if col not in route_df.columns]
     if missing:
         raise ValueError(f"CSV do trajeto não contém colunas obrigatórias: {missing}")
 
 
 def main() -> None:
     args = parse_args()
-    route_df = pd.read_csv(args.route_csv)
-    validate_route_columns(route_df, args.x_col, args.y_col)
 
-    route_df = route_df.copy()
-    route_df[args.x_col] = pd.to_numeric(route_df[args.x_col], errors="raise")
-    route_df[args.y_col] = pd.to_numeric(route_df[args.y_col], errors="raise")
-
-    raster_specs: List[RasterSpec] = []
-    raster_specs.extend(parse_raster_spec(item, default_prefix="mapbiomas") for item in args.mapbiomas)
-    raster_specs.extend(parse_raster_spec(item, default_prefix="bdc") for item in args.bdc)
-    if not raster_specs:
-        raise SystemExit("Informe ao menos um raster em --mapbiomas ou --bdc.")
+    raster_specs, stack_specs, continuous_specs = raster_specs_from_args(args)
+    if args.footprint and (args.track_gauge_m is None or args.track_gauge_m <= 0 or args.tyre_width_m <= 0):
+        raise SystemExit("--footprint exige --track-gauge-m e --tyre-width-m positivos.")
+    for prefix in args.footprint:
+        matches = [i for i, spec in enumerate(raster_specs) if spec.prefix == prefix]
+        if not matches:
+            raise SystemExit(f"--footprint: nenhum raster com prefixo '{prefix}'.")
+        for i in matches:
+            raster_specs[i] = replace(raster_specs[i], footprint=(args.track_gauge_m, args.tyre_width_m))
 
-    enriched_df = route_df
-    for raster_spec in raster_specs:
-        enriched_df = enrich_route_with_raster(
-            route_df=enriched_df,
+    args.output_csv.parent.mkdir(parents=True, exist_ok=True)
+    if args.segments_out is not None:
+        args.segments_out.parent.mkdir(parents=True, exist_ok=True)
+    store = PixelStatsStore(args.cache_db) if args.cache_db is not None else None
+    try:
+        if args.chunk_rows is not None:
+            enrich_route_csv_in_chunks(
+                route_csv=args.route_csv,
+                out_path=args.output_csv,
+                x_col=args.x_col,
+                y_col=args.y_col,
+                route_crs=args.route_crs,
+                raster_specs=raster_specs,
+                window_radius_m=args.window_radius_m,
+                chunk_rows=args.chunk_rows,
+                workers=args.workers,
+                stack_specs=stack_specs,
+                time_col=args.time_col,
+                store=store,
+                segments_path=args.segments_out,
+                timestamp_col=args.timestamp_col,
+                continuous_specs=continuous_specs,
+            )
+            return
+
+        route_df = prepare_route_frame(pd.read_csv(args.route_csv), args.x_col, args.y_col, args.time_col)
+        enriched_df = enrich_route_with_rasters(
+            route_df=route_df,
             x_col=args.x_col,
             y_col=args.y_col,
             route_crs=args.route_crs,
-            raster_spec=raster_spec,
+            raster_specs=raster_specs,
             window_radius_m=args.window_radius_m,
+            workers=args.workers,
+            stack_specs=stack_specs,
+            time_col=args.time_col,
+            store=store,
+            continuous_specs=continuous_specs,
         )
 
-    enriched_df = add_transition_features(
-        route_df=enriched_df,
-        prefixes=[spec.prefix for spec in raster_specs],
-        x_col=args.x_col,
-        y_col=args.y_col,
-    )
-    args.output_csv.parent.mkdir(parents=True, exist_ok=True)
-    enriched_df.to_csv(args.output_csv, index=False)
+        prefixes = [spec.prefix for spec in raster_specs]
+        if args.time_col is not None:
+            prefixes += [spec.prefix for spec in stack_specs]
+        enriched_df = add_transition_features(
+            route_df=enriched_df,
+            prefixes=prefixes,
+            x_col=args.x_col,
+            y_col=args.y_col,
+            route_crs=args.route_crs,
+        )
+        writer = ChunkWriter(args.output_csv)
+        writer.write(enriched_df)
+        writer.close()
+        if args.segments_out is not None:
+            segment_writer = ChunkWriter(args.segments_out)
+            segment_writer.write(transition_segments(enriched_df, prefixes, args.timestamp_col))
+            segment_writer.close()
+    finally:
+        if store is not None:
+            store.close()
 
 
 if __name__ == "__main__":
@@ -13,10 +13,11 @@ Observação:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import tempfile
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -36,6 +37,26 @@ SOIL_LAYER_PROFILES_KPA: Dict[str, List[Tuple[float, float]]] = {
     "wet_weak": [(0.30, 70.0), (1.00, 95.0), (2.00, 130.0), (5.00, 180.0)],
 }
 
+# (coluna do resumo, z_min, z_max, inclui z_min)
+SUMMARY_DEPTH_BANDS: List[Tuple[str, float, float, bool]] = [
+    ("mean_compaction_0_30m", 0.0, 0.30, True),
+    ("mean_compaction_30_100m", 0.30, 1.0, False),
+]
+
+# Alcance da pegada gaussiana considerado no recálculo incremental (em desvios-padrão).
+FOOTPRINT_HALO_SIGMAS = 6.0
+
+GEOMETRY_FILE = "geometria_3d.npz"
+STATE_FILE = "estado_simulacao_3d.npz"
+
+# Custos por operação usados na estimativa de tempo (ordem de grandeza, CPU de desenvolvimento).
+LOAD_NS_PER_POINT_COLUMN = 20.0
+PHYSICS_NS_PER_VOXEL_PASS = 6.0
+TILE_OVERHEAD_S = 15e-6
+
+# Lados de tile (células finas) testados pelo planejador, do maior para o menor.
+PLAN_TILE_CELLS = (256, 128, 64, 32, 16, 8)
+
 
 @dataclass
 class Soil3DParams:
@@ -64,6 +85,11 @@ class Domain3DParams:
     dy_m: float = 0.25
     dz_m: float = 0.20
 
+    # Grade adaptativa: células finas (dx, dy) só na faixa das trilhas de roda
+    grid_mode: str = "regular"  # regular | adaptive
+    refine_buffer_m: float = 1.0
+    coarse_factor: int = 4
+
 
 @dataclass
 class Traffic3DParams:
@@ -83,24 +109,133 @@ class Route3DParams:
     y_offset_m: float = 0.0
 
 
-def mean_in_depth_band(
-    z: np.ndarray,
-    values_3d: np.ndarray,
-    z_min: float,
-    z_max: float,
-    include_min: bool = False,
-) -> float:
+@dataclass
+class AdaptiveGrid:
+    """Grade em dois níveis: blocos grossos aninhados e células finas junto às trilhas.
+
+    Cada bloco cobre ``coarse_factor`` x ``coarse_factor`` células da grade regular
+    fina; blocos dentro da faixa de refinamento são substituídos por suas células
+    finas. ``cell_map`` associa cada célula fina (y, x) à célula adaptativa que a cobre.
+    """
+
+    x_fine: np.ndarray
+    y_fine: np.ndarray
+    cell_x: np.ndarray
+    cell_y: np.ndarray
+    cell_dx: np.ndarray
+    cell_dy: np.ndarray
+    level: np.ndarray  # 0 = bloco grosso, 1 = célula fina
+    cell_map: np.ndarray
+
+    @property
+    def n_cells(self) -> int:
+        return int(self.cell_x.size)
+
+    @property
+    def n_cells_regular(self) -> int:
+        return int(self.x_fine.size * self.y_fine.size)
+
+    @property
+    def cell_area_m2(self) -> np.ndarray:
+        return self.cell_dx * self.cell_dy
+
+    def to_regular(self, values: np.ndarray) -> np.ndarray:
+        """Projeta valores por célula (..., n_cells) na grade fina (..., ny, nx)."""
+        return np.asarray(values)[..., self.cell_map]
+
+
+@dataclass
+class Geometry3D:
+    """Etapa geométrica da simulação: rota, trilhas, grade e mapa de carga.
+
+    Não depende de parâmetros de solo nem da massa da máquina; pode ser reutilizada
+    em varreduras de umidade, ``compaction_alpha`` etc. e serializada em ``.npz``.
+    """
+
+    key: str
+    depth_m: float
+    footprint_m: Tuple[float, float]  # (contact_length_m, tire_width_m) usados no mapa de carga
+    load_scale: float  # máximo da soma de pegadas usado para normalizar load_map
+    centerline_xy: np.ndarray
+    left_track_xy: np.ndarray
+    right_track_xy: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+    load_map: np.ndarray
+    grid: AdaptiveGrid | None = None
+    lattice_offset: Tuple[int, int] = (0, 0)  # células finas (x, y) acrescentadas antes da origem original
+
+    @property
+    def n_columns(self) -> int:
+        return self.grid.n_cells if self.grid is not None else int(self.x.size * self.y.size)
+
+    def column_centers(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self.grid is not None:
+            return self.grid.cell_x, self.grid.cell_y
+        yy, xx = np.meshgrid(self.y, self.x, indexing="ij")
+        return xx.reshape(-1), yy.reshape(-1)
+
+    def column_weights(self) -> np.ndarray:
+        if self.grid is not None:
+            return self.grid.cell_area_m2
+        return np.ones(self.n_columns)
+
+    def column_map(self) -> np.ndarray:
+        """Coluna de cada célula fina (y, x); na grade regular, a própria célula."""
+        if self.grid is not None:
+            return self.grid.cell_map
+        return np.arange(self.n_columns).reshape(self.y.size, self.x.size)
+
+    def column_tiles(self, tile_cells: int) -> np.ndarray:
+        """Tile XY de cada coluna; um tile cobre ``tile_cells`` x ``tile_cells`` células finas.
+
+        Os tiles são alinhados à origem original do reticulado, então estender o domínio
+        (:func:`update_geometry`) não desloca os tiles já existentes.
+        """
+        return column_tile_ids(
+            self.x.size,
+            self.y.size,
+            tile_cells,
+            self.grid.cell_map if self.grid is not None else None,
+            self.lattice_offset,
+        )
+
+    def columns_near_points(self, points_xy: np.ndarray, half_x_m: float, half_y_m: float) -> np.ndarray:
+        near_fine = mark_cells_near_points(self.x, self.y, points_xy, half_x_m, half_y_m)
+        if self.grid is None:
+            return near_fine.reshape(-1)
+        near = np.zeros(self.grid.n_cells, dtype=bool)
+        near[self.grid.cell_map[near_fine]] = True
+        return near
+
+
+@dataclass
+class SimulationState3D:
+    """Estado da etapa física guardado por coluna e por tile para recálculo incremental."""
+
+    physics_key: str
+    tile_cells: int
+    load_scale: float
+    compaction_columns: np.ndarray  # (nz, n_colunas)
+    tile_ids: np.ndarray
+    tile_stats: np.ndarray  # (n_tiles, passadas, 1 + n_faixas): máximo e somas ponderadas por faixa
+    cell_map: np.ndarray | None = None  # coluna de cada célula fina do reticulado em que foram calculadas
+    origin_xy: Tuple[float, float] | None = None  # (x, y) da primeira célula fina desse reticulado
+    column_tiles: np.ndarray | None = None  # tile de cada coluna
+
+
+def depth_band_mask(z: np.ndarray, z_min: float, z_max: float, include_min: bool = False) -> np.ndarray:
+    """Camadas da faixa de profundidade; sem camada na faixa, usa a mais próxima do centro."""
     if include_min:
         mask = (z >= z_min) & (z <= z_max)
     else:
         mask = (z > z_min) & (z <= z_max)
 
-    if np.any(mask):
-        return float(np.mean(values_3d[mask, :, :]))
-
-    z_center = 0.5 * (z_min + z_max)
-    idx = int(np.argmin(np.abs(z - z_center)))
-    return float(np.mean(values_3d[idx : idx + 1, :, :]))
+    if not np.any(mask):
+        z_center = 0.5 * (z_min + z_max)
+        mask = np.arange(z.size) == int(np.argmin(np.abs(z - z_center)))
+    return mask
 
 
 def parse_layer_spec(layers_spec: str, depth_m: float) -> List[Tuple[float, float]]:
@@ -284,28 +419,302 @@ def create_grid(
     return x, y, z
 
 
-def build_route_load_map(
+def column_tile_ids(
+    nx: int,
+    ny: int,
+    tile_cells: int,
+    cell_map: np.ndarray | None = None,
+    offset: Tuple[int, int] = (0, 0),
+) -> np.ndarray:
+    """Tile XY de cada coluna da grade regular (ny, nx) ou, com ``cell_map``, da grade adaptativa.
+
+    Os tiles começam ``offset`` = (células em x, células em y) depois da primeira célula.
+    """
+    if tile_cells < 1:
+        raise ValueError("--tile-cells deve ser >= 1.")
+    ox, oy = offset
+    tile_x = (np.arange(nx) - ox) // tile_cells
+    tile_y = (np.arange(ny) - oy) // tile_cells
+    tile_x -= tile_x[0]
+    tile_y -= tile_y[0]
+    fine_tiles = tile_y[:, None] * (int(tile_x[-1]) + 1) + tile_x[None, :]
+    if cell_map is None:
+        return fine_tiles.reshape(-1)
+    tiles = np.empty(int(cell_map.max()) + 1, dtype=fine_tiles.dtype)
+    tiles[cell_map.reshape(-1)] = fine_tiles.reshape(-1)
+    return tiles
+
+
+def cell_ranges_near_points(
     x: np.ndarray,
     y: np.ndarray,
+    points_xy: np.ndarray,
+    half_x_m: float,
+    half_y_m: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Intervalos inclusivos (ix0, ix1, iy0, iy1) de células na faixa retangular de cada ponto."""
+    nx, ny = x.size, y.size
+    ix0 = np.clip(np.searchsorted(x, points_xy[:, 0] - half_x_m, side="left"), 0, nx - 1)
+    ix1 = np.clip(np.searchsorted(x, points_xy[:, 0] + half_x_m, side="right") - 1, 0, nx - 1)
+    iy0 = np.clip(np.searchsorted(y, points_xy[:, 1] - half_y_m, side="left"), 0, ny - 1)
+    iy1 = np.clip(np.searchsorted(y, points_xy[:, 1] + half_y_m, side="right") - 1, 0, ny - 1)
+    return ix0, np.maximum(ix1, ix0), iy0, np.maximum(iy1, iy0)
+
+
+def count_rectangles(
+    shape: Tuple[int, int],
+    ix0: np.ndarray,
+    ix1: np.ndarray,
+    iy0: np.ndarray,
+    iy1: np.ndarray,
+) -> np.ndarray:
+    """Quantos retângulos inclusivos cobrem cada célula (ny, nx), via tabela de diferenças 2D."""
+    ny, nx = shape
+    marks = np.zeros((ny + 1, nx + 1), dtype=np.int64)
+    np.add.at(marks, (iy0, ix0), 1)
+    np.add.at(marks, (iy0, ix1 + 1), -1)
+    np.add.at(marks, (iy1 + 1, ix0), -1)
+    np.add.at(marks, (iy1 + 1, ix1 + 1), 1)
+    return np.cumsum(np.cumsum(marks, axis=0), axis=1)[:ny, :nx]
+
+
+def mark_cells_near_points(
+    x: np.ndarray,
+    y: np.ndarray,
+    points_xy: np.ndarray,
+    half_x_m: float,
+    half_y_m: float,
+) -> np.ndarray:
+    """Máscara (ny, nx) das células cujo centro está na faixa retangular de algum ponto."""
+    if points_xy.shape[0] == 0:
+        return np.zeros((y.size, x.size), dtype=bool)
+    ranges = cell_ranges_near_points(x, y, points_xy, half_x_m, half_y_m)
+    return count_rectangles((y.size, x.size), *ranges) > 0
+
+
+def refined_block_mask(
+    x: np.ndarray,
+    y: np.ndarray,
+    points_xy: np.ndarray,
+    buffer_m: float,
+    factor: int,
+) -> np.ndarray:
+    """Blocos ``factor`` x ``factor`` com alguma célula na faixa de refinamento dos pontos.
+
+    Equivale a ``mark_cells_near_points`` seguido de ``any`` por bloco, mas trabalha
+    direto na resolução dos blocos.
+    """
+    shape = (-(-y.size // factor), -(-x.size // factor))
+    if points_xy.shape[0] == 0:
+        return np.zeros(shape, dtype=bool)
+    ix0, ix1, iy0, iy1 = cell_ranges_near_points(x, y, points_xy, buffer_m, buffer_m)
+    return count_rectangles(shape, ix0 // factor, ix1 // factor, iy0 // factor, iy1 // factor) > 0
+
+
+def create_adaptive_grid(
+    centerline_xy: np.ndarray,
+    left_track_xy: np.ndarray,
+    right_track_xy: np.ndarray,
+    domain: Domain3DParams,
+) -> Tuple[AdaptiveGrid, np.ndarray]:
+    """Refina apenas os blocos a até ``refine_buffer_m`` das trilhas de roda."""
+    x, y, z = create_grid(centerline_xy, domain)
+    return adaptive_grid_on_lattice(x, y, np.vstack([left_track_xy, right_track_xy]), domain), z
+
+
+def adaptive_grid_on_lattice(
+    x: np.ndarray,
+    y: np.ndarray,
+    wheel_points_xy: np.ndarray,
+    domain: Domain3DParams,
+) -> AdaptiveGrid:
+    """Grade adaptativa sobre um reticulado fino já definido (``x``, ``y``)."""
+    if domain.coarse_factor < 1:
+        raise ValueError("--coarse-factor deve ser >= 1.")
+
+    factor = int(domain.coarse_factor)
+    nx, ny = x.size, y.size
+    nbx = -(-nx // factor)
+    nby = -(-ny // factor)
+
+    buffer_m = max(domain.refine_buffer_m, 0.0)
+    refined_blocks = refined_block_mask(x, y, wheel_points_xy, buffer_m, factor)
+
+    block_of_col = np.arange(nx) // factor
+    block_of_row = np.arange(ny) // factor
+    refined_fine = refined_blocks[block_of_row[:, None], block_of_col[None, :]]
+
+    fine_rows, fine_cols = np.nonzero(refined_fine)
+    n_fine = fine_rows.size
+    coarse_rows, coarse_cols = np.nonzero(~refined_blocks)
+
+    col_start = coarse_cols * factor
+    col_stop = np.minimum(col_start + factor, nx) - 1
+    row_start = coarse_rows * factor
+    row_stop = np.minimum(row_start + factor, ny) - 1
+
+    cell_map = np.empty((ny, nx), dtype=np.int32)
+    cell_map[fine_rows, fine_cols] = np.arange(n_fine, dtype=np.int32)
+    block_ids = np.full((nby, nbx), -1, dtype=np.int32)
+    block_ids[coarse_rows, coarse_cols] = n_fine + np.arange(coarse_rows.size, dtype=np.int32)
+    coarse_fine = ~refined_fine
+    cell_map[coarse_fine] = block_ids[block_of_row[:, None], block_of_col[None, :]][coarse_fine]
+
+    return AdaptiveGrid(
+        x_fine=x,
+        y_fine=y,
+        cell_x=np.concatenate([x[fine_cols], 0.5 * (x[col_start] + x[col_stop])]),
+        cell_y=np.concatenate([y[fine_rows], 0.5 * (y[row_start] + y[row_stop])]),
+        cell_dx=np.concatenate(
+            [np.full(n_fine, domain.dx_m), (col_stop - col_start + 1) * domain.dx_m]
+        ),
+        cell_dy=np.concatenate(
+            [np.full(n_fine, domain.dy_m), (row_stop - row_start + 1) * domain.dy_m]
+        ),
+        level=np.concatenate(
+            [np.ones(n_fine, dtype=np.uint8), np.zeros(coarse_rows.size, dtype=np.uint8)]
+        ),
+        cell_map=cell_map,
+    )
+
+
+def matching_labels(
+    old_labels: np.ndarray, new_labels: np.ndarray, old_sizes: np.ndarray, n_new: int
+) -> np.ndarray:
+    """Rótulo anterior equivalente a cada rótulo atual; -1 se nenhum.
+
+    ``old_labels`` e ``new_labels`` rotulam os mesmos itens (-1 no anterior para itens que
+    não existiam ou mudaram); dois rótulos são equivalentes quando agrupam exatamente os
+    mesmos itens. ``old_sizes`` é o total de itens de cada rótulo anterior.
+    """
+    source = np.full(n_new, -1, dtype=np.int64)
+    n_old = old_sizes.size
+    known = old_labels >= 0
+    if n_old == 0 or not np.any(known):
+        return source
+    new_flat = new_labels.astype(np.int64)
+    pairs, counts = np.unique(new_flat[known] * n_old + old_labels[known], return_counts=True)
+    pair_new, pair_old = np.divmod(pairs, n_old)
+    same = (counts == np.bincount(new_flat, minlength=n_new)[pair_new]) & (counts == old_sizes[pair_old])
+    source[pair_new[same]] = pair_old[same]
+    return source
+
+
+def matching_columns(
+    old_map: np.ndarray,
+    new_map: np.ndarray,
+    n_old: int,
+    n_new: int,
+    offset: Tuple[int, int] = (0, 0),
+) -> np.ndarray | None:
+    """Coluna anterior equivalente a cada coluna atual; -1 onde o bloco foi refinado, engrossado ou é novo.
+
+    Duas colunas são equivalentes quando cobrem exatamente as mesmas células finas. O
+    reticulado anterior começa ``offset`` = (células em x, células em y) depois do atual;
+    ``None`` se não couber nele.
+    """
+    ox, oy = offset
+    ny_old, nx_old = old_map.shape
+    if ox < 0 or oy < 0 or oy + ny_old > new_map.shape[0] or ox + nx_old > new_map.shape[1]:
+        return None
+    embedded = np.full(new_map.shape, -1, dtype=np.int64)
+    embedded[oy : oy + ny_old, ox : ox + nx_old] = old_map
+    old_sizes = np.bincount(old_map.reshape(-1), minlength=n_old)
+    return matching_labels(embedded.reshape(-1), new_map.reshape(-1), old_sizes, n_new)
+
+
+def footprint_sigmas_m(machine: MachineParams) -> Tuple[float, float]:
+    """Desvios-padrão (longitudinal, transversal) da pegada gaussiana de uma roda."""
+    return max(0.10, machine.contact_length_m / 2.2), max(0.08, machine.tire_width_m / 2.2)
+
+
+def route_load_at_points(
+    xx: np.ndarray,
+    yy: np.ndarray,
     left_track_xy: np.ndarray,
     right_track_xy: np.ndarray,
     machine: MachineParams,
 ) -> np.ndarray:
-    """Gera mapa 2D de intensidade relativa de carregamento da rota."""
-    sx = max(0.10, machine.contact_length_m / 2.2)
-    sy = max(0.08, machine.tire_width_m / 2.2)
+    """Soma (não normalizada) das pegadas gaussianas das rodas nos pontos (xx, yy)."""
+    sx, sy = footprint_sigmas_m(machine)
 
-    yy, xx = np.meshgrid(y, x, indexing="ij")
-    load_map = np.zeros_like(yy, dtype=float)
+    load = np.zeros_like(yy, dtype=float)
     all_wheel_points = np.vstack([left_track_xy, right_track_xy])
 
     for px, py in all_wheel_points:
         gx = np.exp(-0.5 * ((xx - px) / sx) ** 2)
         gy = np.exp(-0.5 * ((yy - py) / sy) ** 2)
-        load_map += gx * gy
+        load += gx * gy
+    return load
 
-    load_map /= max(float(np.max(load_map)), 1e-12)
-    return load_map
+
+def points_in_box(points_xy: np.ndarray, x_min: float, x_max: float, y_min: float, y_max: float) -> np.ndarray:
+    keep = (
+        (points_xy[:, 0] >= x_min)
+        & (points_xy[:, 0] <= x_max)
+        & (points_xy[:, 1] >= y_min)
+        & (points_xy[:, 1] <= y_max)
+    )
+    return points_xy[keep]
+
+
+def route_load_in_reach(
+    xx: np.ndarray,
+    yy: np.ndarray,
+    left_track_xy: np.ndarray,
+    right_track_xy: np.ndarray,
+    machine: MachineParams,
+) -> np.ndarray:
+    """:func:`route_load_at_points` só com as rodas a até ``FOOTPRINT_HALO_SIGMAS`` dos pontos."""
+    sx, sy = footprint_sigmas_m(machine)
+    halo_x, halo_y = FOOTPRINT_HALO_SIGMAS * sx, FOOTPRINT_HALO_SIGMAS * sy
+    box = (
+        float(np.min(xx)) - halo_x,
+        float(np.max(xx)) + halo_x,
+        float(np.min(yy)) - halo_y,
+        float(np.max(yy)) + halo_y,
+    )
+    return route_load_at_points(
+        xx, yy, points_in_box(left_track_xy, *box), points_in_box(right_track_xy, *box), machine
+    )
+
+
+def route_load_map_by_tiles(
+    x: np.ndarray,
+    y: np.ndarray,
+    left_track_xy: np.ndarray,
+    right_track_xy: np.ndarray,
+    machine: MachineParams,
+    tile_cells: int,
+) -> np.ndarray:
+    """Soma das pegadas na grade regular calculada tile a tile (temporários do tamanho do tile)."""
+    load = np.empty((y.size, x.size))
+    for y0 in range(0, y.size, tile_cells):
+        for x0 in range(0, x.size, tile_cells):
+            yy, xx = np.meshgrid(y[y0 : y0 + tile_cells], x[x0 : x0 + tile_cells], indexing="ij")
+            load[y0 : y0 + tile_cells, x0 : x0 + tile_cells] = route_load_in_reach(
+                xx, yy, left_track_xy, right_track_xy, machine
+            )
+    return load
+
+
+def route_load_by_tiles(
+    col_x: np.ndarray,
+    col_y: np.ndarray,
+    col_tiles: np.ndarray,
+    left_track_xy: np.ndarray,
+    right_track_xy: np.ndarray,
+    machine: MachineParams,
+) -> np.ndarray:
+    """Soma das pegadas em colunas arbitrárias (grade adaptativa), agrupadas por tile."""
+    load = np.empty(col_x.size)
+    order = np.argsort(col_tiles, kind="stable")
+    _, tile_starts = np.unique(col_tiles[order], return_index=True)
+    tile_bounds = np.append(tile_starts, order.size)
+    for t in range(tile_starts.size):
+        cols = order[tile_bounds[t] : tile_bounds[t + 1]]
+        load[cols] = route_load_in_reach(col_x[cols], col_y[cols], left_track_xy, right_track_xy, machine)
+    return load
 
 
 def sample_compaction_points(
@@ -316,22 +725,34 @@ def sample_compaction_points(
     threshold: float,
     max_points: int,
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-    zz3, yy3, xx3 = np.meshgrid(z, y, x, indexing="ij")
-    mask = compaction >= threshold
-    if not np.any(mask):
-        mask = compaction >= min(0.35, float(np.max(compaction)))
-
-    x_pts = xx3[mask]
-    y_pts = yy3[mask]
-    z_pts = zz3[mask]
-    c_pts = compaction[mask]
-
-    if x_pts.size > max_points:
-        step = int(np.ceil(x_pts.size / max_points))
-        x_pts = x_pts[::step]
-        y_pts = y_pts[::step]
-        z_pts = z_pts[::step]
-        c_pts = c_pts[::step]
+    """Pontos (x, y, z, c) acima do limiar, decimados para no máximo ``max_points``.
+
+    Percorre o volume camada a camada para não materializar coordenadas 3D completas;
+    com a grade adaptativa (``compaction`` 2D) x e y são os centros de cada coluna.
+    """
+    layers = compaction.reshape(compaction.shape[0], -1)
+    if not any(np.any(layer >= threshold) for layer in layers):
+        threshold = min(0.35, float(np.max(compaction)))
+
+    counts = [int(np.count_nonzero(layer >= threshold)) for layer in layers]
+    total = sum(counts)
+    step = int(np.ceil(total / max_points)) if total > max_points else 1
+
+    parts: List[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = []
+    offset = 0
+    for k, layer in enumerate(layers):
+        idx = np.flatnonzero(layer >= threshold)
+        # Mesma decimação de um fatiamento [::step] sobre o volume achatado.
+        idx = idx[(offset + np.arange(idx.size)) % step == 0]
+        offset += counts[k]
+        if compaction.ndim == 2:
+            x_k, y_k = x[idx], y[idx]
+        else:
+            iy, ix = np.divmod(idx, x.size)
+            x_k, y_k = x[ix], y[iy]
+        parts.append((x_k, y_k, np.full(idx.size, z[k]), layer[idx]))
+
+    x_pts, y_pts, z_pts, c_pts = (np.concatenate(values) for values in zip(*parts))
     return x_pts, y_pts, z_pts, c_pts
 
 
@@ -447,76 +868,822 @@ def write_interactive_volume_html(
     out_file.write_text(html_content, encoding="utf-8")
 
 
-def simulate_3d(
+def geometry_cache_key(
+    route: Route3DParams,
+    domain: Domain3DParams,
+    traffic: Traffic3DParams,
+    machine: MachineParams,
+) -> str:
+    """Hash dos parâmetros que determinam a geometria (inclui o conteúdo do CSV de rota)."""
+    route_params = asdict(route)
+    route_params["csv_path"] = str(route.csv_path) if route.csv_path else ""
+    if route.mode == "csv" and route.csv_path is not None and Path(route.csv_path).exists():
+        route_params["csv_sha256"] = hashlib.sha256(Path(route.csv_path).read_bytes()).hexdigest()
+
+    payload = {
+        "route": route_params,
+        "domain": asdict(domain),
+        "track_gauge_m": traffic.track_gauge_m,
+        "step_along_route_m": traffic.step_along_route_m,
+        "contact_length_m": machine.contact_length_m,
+        "tire_width_m": machine.tire_width_m,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:20]
+
+
+def physics_cache_key(
     soil: Soil3DParams,
     machine: MachineParams,
+    traffic: Traffic3DParams,
+    wheel_load_kg: float | None,
+) -> str:
+    """Hash dos parâmetros da etapa física; estados com a mesma chave podem ser reaproveitados."""
+    payload = {
+        "soil": asdict(soil),
+        "machine": asdict(machine),
+        "passes": traffic.passes,
+        "wheel_load_kg": wheel_load_kg,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:20]
+
+
+def save_geometry(geometry: Geometry3D, out_file: Path) -> None:
+    arrays: Dict[str, np.ndarray] = {
+        "centerline_xy": geometry.centerline_xy,
+        "left_track_xy": geometry.left_track_xy,
+        "right_track_xy": geometry.right_track_xy,
+        "x": geometry.x,
+        "y": geometry.y,
+        "z": geometry.z,
+        "load_map": geometry.load_map,
+    }
+    if geometry.grid is not None:
+        arrays.update({f"grid_{name}": value for name, value in asdict(geometry.grid).items()})
+
+    meta = {
+        "key": geometry.key,
+        "depth_m": geometry.depth_m,
+        "footprint_m": list(geometry.footprint_m),
+        "load_scale": geometry.load_scale,
+        "lattice_offset": list(geometry.lattice_offset),
+    }
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(out_file, meta=np.array(json.dumps(meta)), **arrays)
+
+
+def load_geometry(in_file: Path) -> Geometry3D:
+    with np.load(in_file) as data:
+        meta = json.loads(str(data["meta"]))
+        offset = meta.get("lattice_offset", (0, 0))
+        grid = None
+        if "grid_cell_map" in data.files:
+            grid = AdaptiveGrid(
+                **{name[len("grid_") :]: data[name] for name in data.files if name.startswith("grid_")}
+            )
+        return Geometry3D(
+            key=str(meta["key"]),
+            depth_m=float(meta["depth_m"]),
+            footprint_m=(float(meta["footprint_m"][0]), float(meta["footprint_m"][1])),
+            load_scale=float(meta["load_scale"]),
+            centerline_xy=data["centerline_xy"],
+            left_track_xy=data["left_track_xy"],
+            right_track_xy=data["right_track_xy"],
+            x=data["x"],
+            y=data["y"],
+            z=data["z"],
+            load_map=data["load_map"],
+            grid=grid,
+            lattice_offset=(int(offset[0]), int(offset[1])),
+        )
+
+
+def save_simulation_state(state: SimulationState3D, out_file: Path) -> None:
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(
+        out_file,
+        meta=np.array(
+            json.dumps(
+                {
+                    "physics_key": state.physics_key,
+                    "tile_cells": state.tile_cells,
+                    "load_scale": state.load_scale,
+                    "origin_xy": list(state.origin_xy) if state.origin_xy is not None else None,
+                }
+            )
+        ),
+        compaction_columns=state.compaction_columns,
+        tile_ids=state.tile_ids,
+        tile_stats=state.tile_stats,
+        **({"cell_map": state.cell_map} if state.cell_map is not None else {}),
+        **({"column_tiles": state.column_tiles} if state.column_tiles is not None else {}),
+    )
+
+
+def load_simulation_state(in_file: Path) -> SimulationState3D:
+    with np.load(in_file) as data:
+        meta = json.loads(str(data["meta"]))
+        return SimulationState3D(
+            physics_key=str(meta["physics_key"]),
+            tile_cells=int(meta["tile_cells"]),
+            load_scale=float(meta["load_scale"]),
+            compaction_columns=data["compaction_columns"],
+            tile_ids=data["tile_ids"],
+            tile_stats=data["tile_stats"],
+            cell_map=data["cell_map"] if "cell_map" in data.files else None,
+            origin_xy=tuple(meta["origin_xy"]) if meta.get("origin_xy") is not None else None,
+            column_tiles=data["column_tiles"] if "column_tiles" in data.files else None,
+        )
+
+
+def prepare_geometry(
+    route: Route3DParams,
     domain: Domain3DParams,
     traffic: Traffic3DParams,
+    machine: MachineParams,
+    cache_dir: Path | None = None,
+    tile_cells: int | None = None,
+) -> Geometry3D:
+    """Monta rota, trilhas, grade e mapa de carga; com ``cache_dir`` reaproveita execuções anteriores.
+
+    Com ``tile_cells`` o mapa de carga é calculado por tiles (ver :func:`route_load_by_tiles`),
+    o que limita a memória temporária em grades grandes.
+    """
+    key = geometry_cache_key(route, domain, traffic, machine)
+    cache_file = Path(cache_dir) / f"geometria_3d_{key}.npz" if cache_dir is not None else None
+    if cache_file is not None and cache_file.exists():
+        return load_geometry(cache_file)
+
+    centerline_xy = build_route_centerline(route, domain, traffic)
+    left_track_xy, right_track_xy = build_wheel_tracks(centerline_xy, traffic.track_gauge_m)
+
+    grid: AdaptiveGrid | None = None
+    if domain.grid_mode == "regular":
+        x, y, z = create_grid(centerline_xy, domain)
+        if tile_cells is None:
+            yy, xx = np.meshgrid(y, x, indexing="ij")
+            load_map = route_load_at_points(xx, yy, left_track_xy, right_track_xy, machine)
+        else:
+            load_map = route_load_map_by_tiles(x, y, left_track_xy, right_track_xy, machine, tile_cells)
+    elif domain.grid_mode == "adaptive":
+        grid, z = create_adaptive_grid(centerline_xy, left_track_xy, right_track_xy, domain)
+        x, y = grid.x_fine, grid.y_fine
+        if tile_cells is None:
+            load_map = route_load_at_points(grid.cell_x, grid.cell_y, left_track_xy, right_track_xy, machine)
+        else:
+            load_map = route_load_by_tiles(
+                grid.cell_x,
+                grid.cell_y,
+                column_tile_ids(x.size, y.size, tile_cells, grid.cell_map),
+                left_track_xy,
+                right_track_xy,
+                machine,
+            )
+    else:
+        raise ValueError(f"Modo de grade inválido: {domain.grid_mode}")
+
+    load_scale = max(float(np.max(load_map)), 1e-12)
+    load_map /= load_scale
+
+    geometry = Geometry3D(
+        key=key,
+        depth_m=domain.depth_m,
+        footprint_m=(machine.contact_length_m, machine.tire_width_m),
+        load_scale=load_scale,
+        centerline_xy=centerline_xy,
+        left_track_xy=left_track_xy,
+        right_track_xy=right_track_xy,
+        x=x,
+        y=y,
+        z=z,
+        load_map=load_map,
+        grid=grid,
+    )
+    if cache_file is not None:
+        save_geometry(geometry, cache_file)
+    return geometry
+
+
+def changed_station_span(
+    old_xy: np.ndarray,
+    new_xy: np.ndarray,
+    tol_m: float = 1e-6,
+) -> Tuple[int, int, int]:
+    """Trecho alterado entre duas polilinhas reamostradas.
+
+    Retorna ``(inicio, fim_antigo, fim_novo)``: estações ``[inicio:fim_antigo]`` da rota
+    antiga foram substituídas por ``[inicio:fim_novo]`` da nova; prefixo e sufixo coincidem.
+    Se a edição muda o comprimento da rota, a reamostragem desloca as estações seguintes
+    e o sufixo comum tende a ser vazio.
+    """
+    n_common = min(old_xy.shape[0], new_xy.shape[0])
+    same_head = np.all(np.abs(old_xy[:n_common] - new_xy[:n_common]) <= tol_m, axis=1)
+    prefix = n_common if bool(np.all(same_head)) else int(np.argmin(same_head))
+
+    same_tail = np.all(np.abs(old_xy[::-1][:n_common] - new_xy[::-1][:n_common]) <= tol_m, axis=1)
+    suffix = n_common if bool(np.all(same_tail)) else int(np.argmin(same_tail))
+    suffix = min(suffix, n_common - prefix)
+    return prefix, old_xy.shape[0] - suffix, new_xy.shape[0] - suffix
+
+
+def padded_lattice(
+    previous: Geometry3D, centerline_xy: np.ndarray, domain: Domain3DParams
+) -> Tuple[np.ndarray, np.ndarray, Tuple[int, int]] | None:
+    """Reticulado anterior estendido por células inteiras até cobrir a faixa da rota editada.
+
+    Retorna ``(x, y, (células acrescentadas antes da origem em x, em y))`` ou ``None`` se o
+    passo mudou. A tolerância de meia célula é a mesma com que :func:`create_grid` cobre a
+    faixa; na grade adaptativa o acréscimo antes da origem é múltiplo de ``coarse_factor``
+    para os blocos anteriores continuarem alinhados.
+    """
+    if previous.x.size < 2 or previous.y.size < 2:
+        return None
+    half_width = 0.5 * domain.domain_width_m
+    align = max(int(domain.coarse_factor), 1) if domain.grid_mode == "adaptive" else 1
+    axes = []
+    added = []
+    for axis, along, step in (
+        (previous.x, centerline_xy[:, 0], domain.dx_m),
+        (previous.y, centerline_xy[:, 1], domain.dy_m),
+    ):
+        if not np.isclose(axis[1] - axis[0], step):
+            return None
+        step = float(axis[1] - axis[0])
+        n_before = max(0, int(np.ceil((axis[0] - np.min(along) + half_width) / step - 0.5 - 1e-9)))
+        n_before = -(-n_before // align) * align
+        n_after = max(0, int(np.ceil((np.max(along) + half_width - axis[-1]) / step - 0.5 - 1e-9)))
+        before = axis[0] - step * np.arange(n_before, 0, -1)
+        after = axis[-1] + step * np.arange(1, n_after + 1)
+        axes.append(np.concatenate([before, axis, after]))
+        added.append(n_before)
+    return axes[0], axes[1], (added[0], added[1])
+
+
+def update_geometry(
+    previous: Geometry3D,
     route: Route3DParams,
-    wheel_load_kg: float | None = None,
-) -> Dict[str, object]:
+    domain: Domain3DParams,
+    traffic: Traffic3DParams,
+    machine: MachineParams,
+) -> Tuple[Geometry3D, np.ndarray | None]:
+    """Atualiza a geometria de uma rota editada recalculando a carga só perto do trecho alterado.
+
+    O domínio anterior é mantido, e só estendido por células inteiras se a rota editada
+    sair dele; a caixa da rota não é recalculada. Na grade adaptativa o refinamento é
+    refeito sobre esse domínio e só os blocos refinados ou engrossados viram colunas novas.
+    Retorna a nova geometria e a máscara das colunas recalculadas (trecho alterado mais o
+    halo da pegada, e colunas novas). Se mudam passo, profundidade, modo de grade ou
+    pegada, tudo é recalculado e a máscara é ``None``.
+    """
     centerline_xy = build_route_centerline(route, domain, traffic)
     left_track_xy, right_track_xy = build_wheel_tracks(centerline_xy, traffic.track_gauge_m)
-    x, y, z = create_grid(centerline_xy, domain)
+    _, _, z = create_grid(centerline_xy, domain)
+
+    lattice = padded_lattice(previous, centerline_xy, domain)
+    same_domain = (
+        lattice is not None
+        and np.array_equal(z, previous.z)
+        and (domain.grid_mode == "adaptive") == (previous.grid is not None)
+        and np.allclose(previous.footprint_m, (machine.contact_length_m, machine.tire_width_m))
+    )
+    if not same_domain:
+        return prepare_geometry(route, domain, traffic, machine), None
+
+    x, y, added = lattice  # type: ignore[misc]
+    grid: AdaptiveGrid | None = None
+    if domain.grid_mode == "adaptive":
+        grid = adaptive_grid_on_lattice(x, y, np.vstack([left_track_xy, right_track_xy]), domain)
+
+    old_tracks = np.hstack([previous.left_track_xy, previous.right_track_xy])
+    new_tracks = np.hstack([left_track_xy, right_track_xy])
+    start, old_stop, new_stop = changed_station_span(old_tracks, new_tracks)
+    changed_xy = np.vstack(
+        [
+            previous.left_track_xy[start:old_stop],
+            previous.right_track_xy[start:old_stop],
+            left_track_xy[start:new_stop],
+            right_track_xy[start:new_stop],
+        ]
+    )
 
-    load_n = wheel_load_n(machine, wheel_load_kg)
-    pressure_pa = contact_pressure_pa(machine, load_n)
+    geometry = Geometry3D(
+        key=geometry_cache_key(route, domain, traffic, machine),
+        depth_m=domain.depth_m,
+        footprint_m=previous.footprint_m,
+        load_scale=1.0,
+        centerline_xy=centerline_xy,
+        left_track_xy=left_track_xy,
+        right_track_xy=right_track_xy,
+        x=x,
+        y=y,
+        z=z,
+        load_map=np.empty(0),
+        grid=grid,
+        lattice_offset=(previous.lattice_offset[0] + added[0], previous.lattice_offset[1] + added[1]),
+    )
+    source: np.ndarray = matching_columns(  # type: ignore[assignment]
+        previous.column_map(), geometry.column_map(), previous.n_columns, geometry.n_columns, added
+    )
+    old_raw = previous.load_map.reshape(-1) * previous.load_scale
+    sx, sy = footprint_sigmas_m(machine)
+    halo_x, halo_y = FOOTPRINT_HALO_SIGMAS * sx, FOOTPRINT_HALO_SIGMAS * sy
+    dirty = geometry.columns_near_points(changed_xy, halo_x, halo_y) | (source < 0)
+
+    load_raw = np.where(source >= 0, old_raw[np.maximum(source, 0)], 0.0)
+    if np.any(dirty):
+        dirty_idx = np.nonzero(dirty)[0]
+        col_x, col_y = geometry.column_centers()
+        # Só pontos de roda ao alcance das colunas recalculadas contribuem.
+        load_raw[dirty_idx] = route_load_in_reach(
+            col_x[dirty_idx], col_y[dirty_idx], left_track_xy, right_track_xy, machine
+        )
 
-    load_map = build_route_load_map(x, y, left_track_xy, right_track_xy, machine)
-    wheels_per_track = max(machine.wheels / 2.0, 1.0)
-    load_map_effective = load_map * wheels_per_track
+    geometry.load_scale = max(float(np.max(load_raw)), 1e-12)
+    geometry.load_map = load_raw / geometry.load_scale
+    if grid is None:
+        geometry.load_map = geometry.load_map.reshape(y.size, x.size)
+    return geometry, dirty
+
+
+def previous_column_source(state: SimulationState3D, geometry: Geometry3D) -> np.ndarray | None:
+    """Coluna do estado anterior equivalente a cada coluna atual (-1 se nova); ``None`` se incompatível."""
+    if state.cell_map is None or state.origin_xy is None or state.column_tiles is None:
+        return None
+    if geometry.x.size < 2 or geometry.y.size < 2:
+        return None
+    steps = np.array([geometry.x[1] - geometry.x[0], geometry.y[1] - geometry.y[0]])
+    shift = (np.asarray(state.origin_xy) - np.array([geometry.x[0], geometry.y[0]])) / steps
+    offset = np.rint(shift)
+    if not np.allclose(shift, offset, atol=1e-6):
+        return None
+    return matching_columns(
+        state.cell_map,
+        geometry.column_map(),
+        state.compaction_columns.shape[1],
+        geometry.n_columns,
+        (int(offset[0]), int(offset[1])),
+    )
 
-    sigma_crit_pa, sigma_profile_df = sigma_crit_profile_pa(z, soil, domain.depth_m)
-    depth_kernel = np.exp(-z / max(soil.depth_stress_decay_m, 1e-6))
-    sigma_field_pa = pressure_pa * depth_kernel[:, None, None] * load_map_effective[None, :, :]
 
-    compaction = (0.08 * np.exp(-z / 1.3))[:, None, None] * np.ones_like(sigma_field_pa)
+def run_column_passes(
+    load_columns: np.ndarray,
+    weights: np.ndarray,
+    z: np.ndarray,
+    sigma_crit_pa: np.ndarray,
+    pressure_pa: float,
+    wheels_per_track: float,
+    soil: Soil3DParams,
+    passes: int,
+    band_masks: List[np.ndarray],
+    history: str = "passes",
+    dtype: np.dtype | type = np.float64,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Acumula compactação passada a passada em um conjunto de colunas independentes.
+
+    Retorna a compactação final (nz, n_colunas) e o máximo e as somas ponderadas de
+    cada faixa de profundidade, que se combinam entre tiles: uma linha por passada
+    com ``history="passes"`` ou só a da última passada com ``history="final"``.
+    """
+    if history not in ("passes", "final"):
+        raise ValueError(f"Modo de histórico inválido: {history}")
+
+    z_t = z.astype(dtype)
+    depth_kernel = np.exp(-z_t / max(soil.depth_stress_decay_m, 1e-6))
+    sigma_field_pa = pressure_pa * depth_kernel[:, None] * (load_columns.astype(dtype) * wheels_per_track)[None, :]
+    compaction = (0.08 * np.exp(-z_t / 1.3))[:, None] * np.ones_like(sigma_field_pa)
 
     moisture_offset = soil.moisture - soil.reference_moisture
     moisture_factor = float(np.clip(1.0 + 2.0 * max(0.0, moisture_offset), 0.75, 2.0))
 
-    summary_rows = []
-    for i in range(1, traffic.passes + 1):
-        stress_ratio = np.clip(sigma_field_pa / np.maximum(sigma_crit_pa[:, None, None], 1e-6), 0.0, 6.0)
-        delta_c = (
-            soil.compaction_alpha
-            * moisture_factor
-            * np.power(stress_ratio, soil.stress_exponent)
-            * (1.0 - compaction / soil.max_compaction_index)
+    # A razão de tensões não muda entre passadas: só o termo de saturação é iterado.
+    stress_ratio = np.clip(sigma_field_pa / np.maximum(sigma_crit_pa.astype(dtype)[:, None], 1e-6), 0.0, 6.0)
+    drive = soil.compaction_alpha * moisture_factor * np.power(stress_ratio, soil.stress_exponent)
+    del sigma_field_pa, stress_ratio
+
+    stats = np.empty((passes if history == "passes" else 1, 1 + len(band_masks)))
+    for i in range(passes):
+        compaction = np.clip(
+            compaction + drive * (1.0 - compaction / soil.max_compaction_index),
+            0.0,
+            soil.max_compaction_index,
         )
-        compaction = np.clip(compaction + delta_c, 0.0, soil.max_compaction_index)
+        if history == "final" and i < passes - 1:
+            continue
+        row = i if history == "passes" else 0
+        stats[row, 0] = np.max(compaction)
+        for b, mask in enumerate(band_masks):
+            stats[row, 1 + b] = np.sum(compaction[mask] * weights)
+    return compaction, stats
 
-        summary_rows.append(
-            {
-                "pass": i,
-                "max_compaction_index": float(np.max(compaction)),
-                "mean_compaction_0_30m": mean_in_depth_band(
-                    z, compaction, z_min=0.0, z_max=0.30, include_min=True
-                ),
-                "mean_compaction_30_100m": mean_in_depth_band(
-                    z, compaction, z_min=0.30, z_max=1.0, include_min=False
-                ),
-            }
+
+def simulate_3d_physics(
+    geometry: Geometry3D,
+    soil: Soil3DParams,
+    machine: MachineParams,
+    traffic: Traffic3DParams,
+    wheel_load_kg: float | None = None,
+    tile_cells: int = 32,
+    previous_state: SimulationState3D | None = None,
+    dirty_columns: np.ndarray | None = None,
+    dtype: str = "float64",
+    history: str = "passes",
+) -> Dict[str, object]:
+    """Etapa física sobre uma geometria pronta: tensões e acúmulo de compactação por passada.
+
+    As colunas são processadas por tiles XY. Com ``previous_state`` e ``dirty_columns``
+    (vindos de :func:`update_geometry`), só os tiles que contêm colunas alteradas são
+    recalculados; os demais reaproveitam o estado anterior. Na grade adaptativa as
+    colunas anteriores são localizadas pelo ``cell_map`` do estado, então blocos
+    refinados ou engrossados e células acrescentadas ao domínio só sujam os próprios
+    tiles; um tile limpo reaproveita suas estatísticas se tiver as mesmas colunas de antes.
+
+    ``dtype`` define a precisão do volume de compactação (``float64`` ou ``float32``) e
+    ``history="final"`` guarda só as estatísticas da última passada no resumo.
+    """
+    if not np.allclose(geometry.footprint_m, (machine.contact_length_m, machine.tire_width_m)):
+        raise ValueError(
+            "Geometria preparada com outra pegada de pneu "
+            f"(contato x largura = {geometry.footprint_m}); refaça prepare_geometry()."
         )
 
-    summary_df = pd.DataFrame(summary_rows)
+    if dtype not in ("float64", "float32"):
+        raise ValueError(f"Precisão inválida: {dtype}")
+    z = geometry.z
+    grid = geometry.grid
+    load_columns = geometry.load_map.reshape(-1)
+    weights = geometry.column_weights()
+
+    load_n = wheel_load_n(machine, wheel_load_kg)
+    pressure_pa = contact_pressure_pa(machine, load_n)
+    wheels_per_track = max(machine.wheels / 2.0, 1.0)
+    sigma_crit_pa, sigma_profile_df = sigma_crit_profile_pa(z, soil, geometry.depth_m)
+    band_masks = [
+        depth_band_mask(z, z_min, z_max, include_min) for _, z_min, z_max, include_min in SUMMARY_DEPTH_BANDS
+    ]
+
+    column_tiles = geometry.column_tiles(tile_cells)
+    order = np.argsort(column_tiles, kind="stable")
+    tile_ids, tile_starts = np.unique(column_tiles[order], return_index=True)
+    tile_bounds = np.append(tile_starts, order.size)
+
+    physics_key = physics_cache_key(soil, machine, traffic, wheel_load_kg)
+    stats_rows = traffic.passes if history == "passes" else 1
+    source = None
+    if previous_state is not None and dirty_columns is not None:
+        source = previous_column_source(previous_state, geometry)
+    reuse = (
+        previous_state is not None
+        and dirty_columns is not None
+        and source is not None
+        and previous_state.physics_key == physics_key
+        and previous_state.tile_cells == tile_cells
+        and previous_state.compaction_columns.shape[0] == z.size
+        and previous_state.compaction_columns.dtype == np.dtype(dtype)
+        and previous_state.tile_stats.shape[1] == stats_rows
+        and bool(np.isclose(previous_state.load_scale, geometry.load_scale, rtol=1e-9, atol=0.0))
+    )
+    if reuse:
+        previous: SimulationState3D = previous_state  # type: ignore[assignment]
+        column_source: np.ndarray = source  # type: ignore[assignment]
+        kept = column_source >= 0
+        compaction_columns = np.zeros((z.size, load_columns.size), dtype=dtype)
+        compaction_columns[:, kept] = previous.compaction_columns[:, column_source[kept]]
+        # Tile anterior de cada coluna limpa; um tile só é reaproveitado com as mesmas colunas.
+        old_tile_of_column = np.searchsorted(previous.tile_ids, previous.column_tiles)
+        clean = kept & ~dirty_columns
+        tile_source = matching_labels(
+            np.where(clean, old_tile_of_column[np.where(clean, column_source, 0)], -1),
+            np.searchsorted(tile_ids, column_tiles),
+            np.bincount(old_tile_of_column, minlength=previous.tile_ids.size),
+            tile_ids.size,
+        )
+        dirty_tiles = tile_source < 0
+        tile_stats = np.empty((tile_ids.size, stats_rows, 1 + len(band_masks)))
+        tile_stats[~dirty_tiles] = previous.tile_stats[tile_source[~dirty_tiles]]
+    else:
+        dirty_tiles = np.ones(tile_ids.size, dtype=bool)
+        compaction_columns = np.empty((z.size, load_columns.size), dtype=dtype)
+        tile_stats = np.empty((tile_ids.size, stats_rows, 1 + len(band_masks)))
+
+    for t in np.nonzero(dirty_tiles)[0]:
+        cols = order[tile_bounds[t] : tile_bounds[t + 1]]
+        compaction_columns[:, cols], tile_stats[t] = run_column_passes(
+            load_columns[cols],
+            weights[cols],
+            z,
+            sigma_crit_pa,
+            pressure_pa,
+            wheels_per_track,
+            soil,
+            traffic.passes,
+            band_masks,
+            history=history,
+            dtype=compaction_columns.dtype,
+        )
+
+    weights_total = float(np.sum(weights))
+    summary = {
+        "pass": np.arange(traffic.passes - stats_rows + 1, traffic.passes + 1),
+        "max_compaction_index": np.max(tile_stats[:, :, 0], axis=0),
+    }
+    for b, (name, _, _, _) in enumerate(SUMMARY_DEPTH_BANDS):
+        band_cells = int(np.count_nonzero(band_masks[b])) * weights_total
+        summary[name] = np.sum(tile_stats[:, :, 1 + b], axis=0) / band_cells
+    summary_df = pd.DataFrame(summary)
+
+    state = SimulationState3D(
+        physics_key=physics_key,
+        tile_cells=tile_cells,
+        load_scale=geometry.load_scale,
+        compaction_columns=compaction_columns,
+        tile_ids=tile_ids,
+        tile_stats=tile_stats,
+        cell_map=geometry.column_map(),
+        origin_xy=(float(geometry.x[0]), float(geometry.y[0])),
+        column_tiles=column_tiles,
+    )
     return {
-        "x": x,
-        "y": y,
+        "x": geometry.x,
+        "y": geometry.y,
         "z": z,
-        "compaction": compaction,
-        "load_map": load_map,
+        "compaction": compaction_columns.reshape((z.size,) + geometry.load_map.shape),
+        "load_map": geometry.load_map,
         "summary_df": summary_df,
         "load_n": load_n,
         "pressure_pa": pressure_pa,
         "sigma_crit_pa": sigma_crit_pa,
         "sigma_profile_df": sigma_profile_df,
-        "centerline_xy": centerline_xy,
-        "left_track_xy": left_track_xy,
-        "right_track_xy": right_track_xy,
+        "centerline_xy": geometry.centerline_xy,
+        "left_track_xy": geometry.left_track_xy,
+        "right_track_xy": geometry.right_track_xy,
+        "grid": grid,
+        "state": state,
+        "recomputed_tiles": int(np.count_nonzero(dirty_tiles)),
+        "total_tiles": int(tile_ids.size),
     }
 
 
+def simulate_3d(
+    soil: Soil3DParams,
+    machine: MachineParams,
+    domain: Domain3DParams,
+    traffic: Traffic3DParams,
+    route: Route3DParams,
+    wheel_load_kg: float | None = None,
+    geometry_cache_dir: Path | None = None,
+    memory_budget_bytes: int | None = None,
+) -> Dict[str, object]:
+    """Geometria + física; com ``memory_budget_bytes`` a configuração vem de :func:`plan_resources`."""
+    if memory_budget_bytes is None:
+        geometry = prepare_geometry(route, domain, traffic, machine, cache_dir=geometry_cache_dir)
+        return simulate_3d_physics(geometry, soil, machine, traffic, wheel_load_kg=wheel_load_kg)
+
+    plan = plan_resources(route, domain, traffic, machine, memory_budget_bytes)
+    geometry = prepare_geometry(
+        route, domain, traffic, machine, cache_dir=geometry_cache_dir, tile_cells=plan.tile_cells
+    )
+    return simulate_3d_physics(
+        geometry,
+        soil,
+        machine,
+        traffic,
+        wheel_load_kg=wheel_load_kg,
+        tile_cells=plan.tile_cells,
+        dtype=plan.dtype,
+        history=plan.history,
+    )
+
+
+@dataclass
+class ResourcePlan:
+    """Estimativa de pico de memória e de tempo para uma configuração da simulação 3D."""
+
+    dtype: str
+    history: str
+    tile_cells: int
+    load_tiled: bool
+    n_columns: int
+    n_columns_regular: int
+    nz: int
+    n_wheel_points: int
+    peak_bytes: int
+    runtime_s: float
+    breakdown: Dict[str, int]
+
+
+def parse_memory_size(text: str) -> int:
+    """Converte '512M', '4G', '1.5GiB' ou um número de bytes em bytes."""
+    units = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+    value = text.strip().upper().removesuffix("B").removesuffix("I")
+    suffix = value[-1:] if value[-1:] in units else ""
+    try:
+        number = float(value[: len(value) - len(suffix)])
+    except ValueError as exc:
+        raise ValueError(f"Tamanho de memória inválido: '{text}'. Use, por exemplo, 512M ou 4G.") from exc
+    if number <= 0:
+        raise ValueError(f"Tamanho de memória deve ser positivo: '{text}'.")
+    return int(number * units[suffix])
+
+
+def format_bytes(n_bytes: float) -> str:
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(n_bytes) < 1024.0:
+            return f"{n_bytes:.1f} {unit}"
+        n_bytes /= 1024.0
+    return f"{n_bytes:.1f} TiB"
+
+
+def estimate_resources(
+    route: Route3DParams,
+    domain: Domain3DParams,
+    traffic: Traffic3DParams,
+    machine: MachineParams,
+    dtype: str = "float64",
+    history: str = "passes",
+    tile_cells: int = 32,
+    load_tiled: bool = False,
+) -> ResourcePlan:
+    """Estima pico de memória e tempo sem alocar a grade nem o volume.
+
+    Só a rota e os eixos 1D da grade são montados; a contagem de colunas da grade
+    adaptativa e o alcance das rodas por tile são obtidos na resolução dos blocos/tiles.
+    """
+    if tile_cells < 1:
+        raise ValueError("--tile-cells deve ser >= 1.")
+    itemsize = np.dtype(dtype).itemsize
+    centerline_xy = build_route_centerline(route, domain, traffic)
+    left_track_xy, right_track_xy = build_wheel_tracks(centerline_xy, traffic.track_gauge_m)
+    wheel_points = np.vstack([left_track_xy, right_track_xy])
+    x, y, z = create_grid(centerline_xy, domain)
+    nx, ny, nz = x.size, y.size, z.size
+    n_regular = nx * ny
+
+    n_fine = n_regular
+    n_columns = n_regular
+    if domain.grid_mode == "adaptive":
+        factor = max(int(domain.coarse_factor), 1)
+        refined = refined_block_mask(x, y, wheel_points, max(domain.refine_buffer_m, 0.0), factor)
+        block_w = np.minimum(factor, nx - factor * np.arange(refined.shape[1]))
+        block_h = np.minimum(factor, ny - factor * np.arange(refined.shape[0]))
+        n_fine = int(np.sum(refined * block_h[:, None] * block_w[None, :]))
+        n_columns = n_fine + int(np.count_nonzero(~refined))
+    elif domain.grid_mode != "regular":
+        raise ValueError(f"Modo de grade inválido: {domain.grid_mode}")
+    map_cells = n_regular if domain.grid_mode == "regular" else n_columns
+
+    n_tiles_x, n_tiles_y = -(-nx // tile_cells), -(-ny // tile_cells)
+    tile_w = np.minimum(tile_cells, nx - tile_cells * np.arange(n_tiles_x))
+    tile_h = np.minimum(tile_cells, ny - tile_cells * np.arange(n_tiles_y))
+    tile_fine_cells = tile_h[:, None] * tile_w[None, :]
+    n_tiles = int(n_tiles_x * n_tiles_y)
+    tile_columns = min(tile_cells * tile_cells, n_columns)
+    stats_rows = traffic.passes if history == "passes" else 1
+
+    breakdown: Dict[str, int] = {}
+    if domain.grid_mode == "adaptive":
+        # cell_map, máscaras e índices de montagem na resolução fina + vetores por célula.
+        breakdown["grade"] = 10 * n_regular + 16 * n_fine + 33 * n_columns
+    else:
+        breakdown["grade"] = 0
+    if load_tiled:
+        breakdown["mapa_carga"] = 8 * map_cells + 6 * 8 * tile_cells * tile_cells
+        if domain.grid_mode == "adaptive":
+            breakdown["mapa_carga"] += 24 * n_columns  # tile por coluna e ordenação
+    elif domain.grid_mode == "regular":
+        breakdown["mapa_carga"] = 7 * 8 * n_regular  # meshgrid, soma e temporários por roda
+    else:
+        breakdown["mapa_carga"] = 5 * 8 * n_columns
+    breakdown["colunas"] = 32 * n_columns  # pesos, tile por coluna e ordenação
+    breakdown["compactacao"] = itemsize * nz * n_columns
+    breakdown["tiles_fisica"] = 7 * itemsize * nz * tile_columns
+    breakdown["historico"] = 8 * n_tiles * stats_rows * (1 + len(SUMMARY_DEPTH_BANDS))
+    breakdown["saidas"] = 3 * 8 * n_regular + 9 * n_columns
+    if domain.grid_mode == "adaptive":
+        breakdown["saidas"] += 64 * n_columns  # tabela grade_adaptativa_celulas.csv
+
+    # As fases não coexistem: geometria, física e saídas (mapa de carga persiste).
+    persistent = 8 * map_cells
+    if domain.grid_mode == "adaptive":
+        persistent += 4 * n_regular + 33 * n_columns  # cell_map e vetores por célula
+    geometry_phase = breakdown["grade"] + breakdown["mapa_carga"]
+    physics_phase = (
+        persistent
+        + breakdown["colunas"]
+        + breakdown["compactacao"]
+        + breakdown["tiles_fisica"]
+        + breakdown["historico"]
+    )
+    output_phase = persistent + breakdown["compactacao"] + breakdown["saidas"]
+    peak_bytes = max(geometry_phase, physics_phase, output_phase)
+
+    columns_per_fine = n_columns / max(n_regular, 1)
+    if load_tiled and wheel_points.shape[0] > 0:
+        sx, sy = footprint_sigmas_m(machine)
+        ix0, ix1, iy0, iy1 = cell_ranges_near_points(
+            x, y, wheel_points, FOOTPRINT_HALO_SIGMAS * sx, FOOTPRINT_HALO_SIGMAS * sy
+        )
+        reach = count_rectangles(
+            (n_tiles_y, n_tiles_x), ix0 // tile_cells, ix1 // tile_cells, iy0 // tile_cells, iy1 // tile_cells
+        )
+        load_evals = float(np.sum(reach * tile_fine_cells)) * columns_per_fine
+        load_s = load_evals * LOAD_NS_PER_POINT_COLUMN * 1e-9 + n_tiles * TILE_OVERHEAD_S
+    else:
+        load_s = wheel_points.shape[0] * map_cells * LOAD_NS_PER_POINT_COLUMN * 1e-9
+    physics_s = traffic.passes * (
+        nz * n_columns * PHYSICS_NS_PER_VOXEL_PASS * 1e-9 * itemsize / 8.0 + n_tiles * TILE_OVERHEAD_S
+    )
+
+    return ResourcePlan(
+        dtype=dtype,
+        history=history,
+        tile_cells=tile_cells,
+        load_tiled=load_tiled,
+        n_columns=int(n_columns),
+        n_columns_regular=int(n_regular),
+        nz=int(nz),
+        n_wheel_points=int(wheel_points.shape[0]),
+        peak_bytes=int(peak_bytes),
+        runtime_s=float(load_s + physics_s),
+        breakdown={name: int(value) for name, value in breakdown.items()},
+    )
+
+
+def format_resource_plan(plan: ResourcePlan, memory_budget_bytes: int | None = None) -> str:
+    lines = [
+        f"Colunas: {plan.n_columns} (regular: {plan.n_columns_regular}) x {plan.nz} camadas, "
+        f"{plan.n_wheel_points} pontos de roda",
+        f"Configuração: dtype={plan.dtype}, historico={plan.history}, tile={plan.tile_cells} células, "
+        f"mapa de carga {'por tiles' if plan.load_tiled else 'vetorizado'}",
+        f"Pico estimado de memória: {format_bytes(plan.peak_bytes)}"
+        + (f" (orçamento: {format_bytes(memory_budget_bytes)})" if memory_budget_bytes is not None else ""),
+        f"Tempo estimado: {plan.runtime_s:.1f} s",
+    ]
+    lines.extend(f"  {name}: {format_bytes(value)}" for name, value in plan.breakdown.items())
+    return "\n".join(lines)
+
+
+def plan_resources(
+    route: Route3DParams,
+    domain: Domain3DParams,
+    traffic: Traffic3DParams,
+    machine: MachineParams,
+    memory_budget_bytes: int,
+    tile_candidates: Tuple[int, ...] = PLAN_TILE_CELLS,
+) -> ResourcePlan:
+    """Escolhe dtype, modo de histórico e tile que cabem em ``memory_budget_bytes``.
+
+    Prefere float64 e histórico por passada; dentro disso, o maior tile que cabe.
+    O mapa de carga é sempre calculado por tiles. Sem configuração viável, levanta
+    ``ValueError`` com o relatório da configuração mais econômica.
+    """
+    plan: ResourcePlan | None = None
+    for dtype in ("float64", "float32"):
+        for history in ("passes", "final"):
+            for tile_cells in tile_candidates:
+                plan = estimate_resources(
+                    route,
+                    domain,
+                    traffic,
+                    machine,
+                    dtype=dtype,
+                    history=history,
+                    tile_cells=tile_cells,
+                    load_tiled=True,
+                )
+                if plan.peak_bytes <= memory_budget_bytes:
+                    return plan
+    assert plan is not None
+    raise ValueError(
+        "Nenhuma configuração cabe no orçamento de memória. Reduza o domínio, aumente dx/dy/dz "
+        "ou use --grid-mode adaptive.\nConfiguração mais econômica:\n"
+        + format_resource_plan(plan, memory_budget_bytes)
+    )
+
+
+def adaptive_cells_table(sim_out: Dict[str, object]) -> pd.DataFrame:
+    """Tabela por célula da grade adaptativa (nível, extensão e compactação final)."""
+    grid: AdaptiveGrid = sim_out["grid"]  # type: ignore[assignment]
+    z = sim_out["z"]  # type: ignore[assignment]
+    compaction = sim_out["compaction"]  # type: ignore[assignment]
+    load_map = sim_out["load_map"]  # type: ignore[assignment]
+
+    top_mask = z <= 0.30
+    if not np.any(top_mask):
+        top_mask = np.arange(z.size) == 0
+    return pd.DataFrame(
+        {
+            "cell_id": np.arange(grid.n_cells),
+            "level": grid.level,
+            "x_m": grid.cell_x,
+            "y_m": grid.cell_y,
+            "dx_m": grid.cell_dx,
+            "dy_m": grid.cell_dy,
+            "load_relative": load_map,
+            "max_compaction_index": np.max(compaction, axis=0),
+            "mean_compaction_0_30m": np.mean(compaction[top_mask], axis=0),
+        }
+    )
+
+
 def plot_outputs_3d(
     out_dir: Path,
     sim_out: Dict[str, object],
@@ -537,15 +1704,21 @@ def plot_outputs_3d(
     right_track_xy = sim_out["right_track_xy"]  # type: ignore[assignment]
     pressure_pa = float(sim_out["pressure_pa"])  # type: ignore[arg-type]
     load_n = float(sim_out["load_n"])  # type: ignore[arg-type]
+    grid: AdaptiveGrid | None = sim_out.get("grid")  # type: ignore[assignment]
 
     wheel_load_kg = load_n / GRAVITY
+    grid_label = f"{domain.dx_m:.2f}x{domain.dy_m:.2f}x{domain.dz_m:.2f} m"
+    if grid is not None:
+        grid_label += f" adaptativa ({grid.n_cells} colunas)"
     header = (
-        f"Passadas={traffic.passes} | Coluna={domain.depth_m:.1f} m | Grid={domain.dx_m:.2f}x{domain.dy_m:.2f}x{domain.dz_m:.2f} m\n"
+        f"Passadas={traffic.passes} | Coluna={domain.depth_m:.1f} m | Grid={grid_label}\n"
         f"Massa={machine.mass_kg:.0f} kg | Rodas={machine.wheels} | Carga/roda={wheel_load_kg:.0f} kg | "
         f"Pressao contato={pressure_pa / 1000.0:.1f} kPa | Umidade={soil.moisture:.2f} | Perfil={soil.soil_profile}"
     )
 
     # 1) Mapa 2D da carga relativa na superfície.
+    if grid is not None:
+        load_map = grid.to_regular(load_map)
     fig, ax = plt.subplots(figsize=(10.2, 4.6), dpi=130)
     im = ax.imshow(
         load_map,
@@ -571,7 +1744,10 @@ def plot_outputs_3d(
     # 2) Seção y-z no x mediano da rota.
     x_mid = float(np.median(centerline_xy[:, 0]))
     ix_mid = int(np.argmin(np.abs(x - x_mid)))
-    yz_slice = compaction[:, :, ix_mid]
+    if grid is not None:
+        yz_slice = compaction[:, grid.cell_map[:, ix_mid]]
+    else:
+        yz_slice = compaction[:, :, ix_mid]
     yy, zz = np.meshgrid(y, z)
     fig, ax = plt.subplots(figsize=(8.8, 5.2), dpi=130)
     contour = ax.contourf(yy, zz, yz_slice, levels=18, cmap="inferno", vmin=0.0, vmax=0.95)
@@ -587,6 +1763,8 @@ def plot_outputs_3d(
     plt.close(fig)
 
     # 3) Volume 3D estático.
+    if grid is not None:
+        x, y = grid.cell_x, grid.cell_y
     x_pts, y_pts, z_pts, c_pts = sample_compaction_points(
         x, y, z, compaction, threshold=volume_threshold, max_points=22_000
     )
@@ -647,6 +1825,9 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--dy-m", type=float, default=0.25)
     parser.add_argument("--dz-m", type=float, default=0.20)
     parser.add_argument("--step-along-route-m", type=float, default=0.5)
+    parser.add_argument("--grid-mode", choices=["regular", "adaptive"], default="regular")
+    parser.add_argument("--refine-buffer-m", type=float, default=1.0)
+    parser.add_argument("--coarse-factor", type=int, default=4)
 
     parser.add_argument("--route-mode", choices=["straight", "sine", "csv"], default="straight")
     parser.add_argument("--route-csv", type=Path, default=None)
@@ -675,6 +1856,47 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--volume-threshold", type=float, default=0.45)
     parser.add_argument("--no-interactive-html", action="store_true")
     parser.add_argument("--wheel-load-kg", type=float, default=None)
+    parser.add_argument(
+        "--geometry-cache-dir",
+        type=Path,
+        default=None,
+        help="Diretório para reaproveitar rota/grade/mapa de carga entre execuções (.npz).",
+    )
+    parser.add_argument(
+        "--tile-cells",
+        type=int,
+        default=32,
+        help="Lado do tile XY (em células finas) usado na etapa física e no recálculo incremental.",
+    )
+    parser.add_argument(
+        "--save-state",
+        action="store_true",
+        help=f"Grava {GEOMETRY_FILE} e {STATE_FILE} no diretório de saída para recálculo incremental.",
+    )
+    parser.add_argument(
+        "--incremental-from",
+        type=Path,
+        default=None,
+        help="Diretório de uma execução anterior (--save-state); recalcula só os tiles afetados pela edição da rota.",
+    )
+    parser.add_argument("--dtype", choices=["float64", "float32"], default="float64")
+    parser.add_argument(
+        "--history",
+        choices=["passes", "final"],
+        default="passes",
+        help="'passes' registra a evolução por passada; 'final' só a última passada.",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=str,
+        default=None,
+        help="Orçamento de memória (ex.: 512M, 4G); escolhe dtype, --history e --tile-cells automaticamente.",
+    )
+    parser.add_argument(
+        "--plan-only",
+        action="store_true",
+        help="Só imprime a estimativa de memória e tempo, sem simular.",
+    )
     return parser.parse_args()
 
 
@@ -696,6 +1918,9 @@ def main() -> None:
         dx_m=args.dx_m,
         dy_m=args.dy_m,
         dz_m=args.dz_m,
+        grid_mode=args.grid_mode,
+        refine_buffer_m=args.refine_buffer_m,
+        coarse_factor=args.coarse_factor,
     )
     traffic = Traffic3DParams(
         passes=args.passes,
@@ -724,14 +1949,72 @@ def main() -> None:
         sigma_crit_layers=args.sigma_crit_layers,
     )
 
-    sim_out = simulate_3d(
-        soil=soil,
-        machine=machine,
-        domain=domain,
-        traffic=traffic,
-        route=route,
+    # A estimativa só roda quando é usada: com orçamento de memória ou --plan-only.
+    memory_budget: int | None = None
+    plan: ResourcePlan | None = None
+    try:
+        if args.memory_budget is not None:
+            memory_budget = parse_memory_size(args.memory_budget)
+            plan = plan_resources(route, domain, traffic, machine, memory_budget)
+        elif args.plan_only:
+            plan = estimate_resources(
+                route,
+                domain,
+                traffic,
+                machine,
+                dtype=args.dtype,
+                history=args.history,
+                tile_cells=args.tile_cells,
+            )
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+    if args.plan_only:
+        print(format_resource_plan(plan, memory_budget))  # type: ignore[arg-type]
+        return
+    if plan is not None:
+        print(
+            f"Estimativa: pico {format_bytes(plan.peak_bytes)}, ~{plan.runtime_s:.1f} s "
+            f"(dtype={plan.dtype}, historico={plan.history}, tile={plan.tile_cells})"
+        )
+        tile_cells, dtype, history = plan.tile_cells, plan.dtype, plan.history
+        load_tile_cells = plan.tile_cells if plan.load_tiled else None
+    else:
+        if args.tile_cells < 1:
+            raise SystemExit("--tile-cells deve ser >= 1.")
+        tile_cells, dtype, history = args.tile_cells, args.dtype, args.history
+        load_tile_cells = None
+
+    previous_state: SimulationState3D | None = None
+    dirty_columns: np.ndarray | None = None
+    if args.incremental_from is not None:
+        previous_geometry = load_geometry(args.incremental_from / GEOMETRY_FILE)
+        previous_state = load_simulation_state(args.incremental_from / STATE_FILE)
+        geometry, dirty_columns = update_geometry(previous_geometry, route, domain, traffic, machine)
+    else:
+        geometry = prepare_geometry(
+            route,
+            domain,
+            traffic,
+            machine,
+            cache_dir=args.geometry_cache_dir,
+            tile_cells=load_tile_cells,
+        )
+
+    sim_out = simulate_3d_physics(
+        geometry,
+        soil,
+        machine,
+        traffic,
         wheel_load_kg=args.wheel_load_kg,
+        tile_cells=tile_cells,
+        previous_state=previous_state,
+        dirty_columns=dirty_columns,
+        dtype=dtype,
+        history=history,
     )
+    if args.save_state or args.incremental_from is not None:
+        save_geometry(geometry, out_dir / GEOMETRY_FILE)
+        save_simulation_state(sim_out["state"], out_dir / STATE_FILE)  # type: ignore[arg-type]
 
     summary_df: pd.DataFrame = sim_out["summary_df"]  # type: ignore[assignment]
     sigma_profile_df: pd.DataFrame = sim_out["sigma_profile_df"]  # type: ignore[assignment]
@@ -740,6 +2023,8 @@ def main() -> None:
     right_track_xy = sim_out["right_track_xy"]  # type: ignore[assignment]
     pressure_kpa = float(sim_out["pressure_pa"]) / 1000.0  # type: ignore[arg-type]
     load_n = float(sim_out["load_n"])  # type: ignore[arg-type]
+    grid: AdaptiveGrid | None = sim_out["grid"]  # type: ignore[assignment]
+    grid_columns = grid.n_cells if grid is not None else int(np.size(sim_out["load_map"]))  # type: ignore[arg-type]
 
     summary_df.to_csv(out_dir / "evolucao_compactacao_passadas.csv", index=False)
     sigma_profile_df.to_csv(out_dir / "perfil_sigma_crit.csv", index=False)
@@ -752,6 +2037,8 @@ def main() -> None:
     pd.DataFrame({"x_m": right_track_xy[:, 0], "y_m": right_track_xy[:, 1]}).to_csv(
         out_dir / "rota_trilha_direita.csv", index=False
     )
+    if grid is not None:
+        adaptive_cells_table(sim_out).to_csv(out_dir / "grade_adaptativa_celulas.csv", index=False)
 
     pd.DataFrame(
         [
@@ -774,6 +2061,11 @@ def main() -> None:
                 "route_csv": str(route.csv_path) if route.csv_path else "",
                 "route_sine_amplitude_m": route.sine_amplitude_m,
                 "route_sine_wavelength_m": route.sine_wavelength_m,
+                "grid_mode": domain.grid_mode,
+                "grid_columns": grid_columns,
+                "dtype": dtype,
+                "history": history,
+                "tile_cells": tile_cells,
             }
         ]
     ).to_csv(out_dir / "parametros_simulacao_3d.csv", index=False)
@@ -800,6 +2092,13 @@ def main() -> None:
     print(f"Pressao de contato: {pressure_kpa:.1f} kPa")
     print(f"Perfil de solo: {soil.soil_profile}")
     print(f"Modo de rota: {route.mode}")
+    if args.incremental_from is not None:
+        print(f"Tiles recalculados: {sim_out['recomputed_tiles']}/{sim_out['total_tiles']}")
+    if grid is not None:
+        print(
+            f"Grade adaptativa: {grid.n_cells} colunas "
+            f"(regular equivalente: {grid.n_cells_regular}, {grid.n_cells_regular / grid.n_cells:.1f}x menos)"
+        )
     print(f"Arquivos gerados em: {out_dir}")
 
 
@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""Serviço local de enriquecimento com os rasters abertos em memória.
+
+Fluxo:
+- abrir uma única vez os rasters de uso/cobertura, séries e rasters contínuos
+  (mesmos argumentos de enriquecer_uso_cobertura.py);
+- escutar em tcp://host:porta ou unix:///caminho, uma requisição JSON por linha;
+- juntar as requisições que chegam dentro de uma janela curta (micro-lote) e
+  amostrar todos os seus pontos numa única consulta vetorizada;
+- devolver a cada requisição, em JSON lines, as colunas dos seus pontos.
+
+Requisição: {"id": 1, "x": [...], "y": [...], "crs": "EPSG:4326", "time": [...]}
+(``crs`` e ``time`` são opcionais; ``time`` escolhe a época das séries).
+Resposta: {"id": 1, "n": 2, "latency_ms": 1.4, "columns": {"mb_class_id_mode": [...]}}
+ou {"id": 1, "error": "..."}; valores ausentes saem como null.
+
+Observação:
+- Pegadas das rodas e transições dependem de fixes consecutivos da mesma rota e
+  ficam no modo em lote; o serviço responde só as colunas por ponto.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from enriquecer_uso_cobertura import (
+    ContinuousSpec,
+    RasterSpec,
+    RouteSamplingCache,
+    StackSpec,
+    add_raster_arguments,
+    load_legend,
+    open_stack,
+    raster_specs_from_args,
+    sample_open_continuous,
+    sample_open_raster,
+    sample_open_stack,
+    transform_points,
+)
+
+try:
+    import rasterio
+    from rasterio.crs import CRS
+    from rasterio.errors import CRSError
+except ImportError:  # pragma: no cover
+    rasterio = None
+
+# Maior linha de requisição aceita (lotes de algumas centenas de milhares de pontos).
+MAX_REQUEST_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class ServiceParams:
+    listen: str = "tcp://127.0.0.1:8765"  # tcp://host:porta | unix:///caminho
+    route_crs: str = "EPSG:4326"
+    window_radius_m: float = 0.0
+    batch_window_ms: float = 2.0
+    max_batch_points: int = 200_000
+
+
+@dataclass
+class PointQuery:
+    """Uma requisição à espera da resposta do micro-lote em que entrar."""
+
+    request_id: object
+    x: np.ndarray
+    y: np.ndarray
+    crs: str
+    time_values: np.ndarray | None
+    received: float
+    future: asyncio.Future
+
+
+def time_years(values: list) -> np.ndarray:
+    """Tempos de uma requisição como números (anos ou o valor numérico enviado).
+
+    Cada requisição é convertida à parte para que números e datas de clientes
+    diferentes não se misturem na mesma série ao formar o micro-lote.
+    """
+    series = pd.Series(values)
+    if pd.api.types.is_numeric_dtype(series):
+        return series.to_numpy(dtype=float)
+    return pd.to_datetime(series, errors="coerce").dt.year.to_numpy(dtype=float)
+
+
+def check_coordinates(x: np.ndarray, y: np.ndarray, crs: str) -> None:
+    """Garante que os pontos de uma requisição são finitos e reprojetáveis no ``crs``.
+
+    Assim um ponto inválido é recusado na própria requisição em vez de derrubar a
+    consulta do micro-lote inteiro.
+    """
+    if not (np.isfinite(x).all() and np.isfinite(y).all()):
+        raise ValueError("'x' e 'y' devem ser números finitos.")
+    try:
+        point_crs = CRS.from_user_input(crs)
+    except CRSError as exc:
+        raise ValueError(f"CRS inválido: {crs}") from exc
+    if point_crs.is_geographic:
+        if (np.abs(x) > 360.0).any() or (np.abs(y) > 90.0).any():
+            raise ValueError("Coordenadas geográficas fora do intervalo (|x| <= 360, |y| <= 90).")
+        return
+    try:
+        lon, lat = transform_points(x, y, crs, "EPSG:4326")
+    except Exception as exc:  # noqa: BLE001 - erro do PROJ vira erro da requisição
+        raise ValueError(f"Pontos não reprojetáveis a partir de {crs}: {exc}") from exc
+    if not (np.isfinite(lon).all() and np.isfinite(lat).all()):
+        raise ValueError(f"Pontos fora do domínio de {crs}.")
+
+
+def parse_query(payload: dict, default_crs: str, future: asyncio.Future) -> PointQuery:
+    """Valida uma requisição já decodificada; erros viram ``ValueError``."""
+    try:
+        x = np.asarray(payload["x"], dtype=float).reshape(-1)
+        y = np.asarray(payload["y"], dtype=float).reshape(-1)
+    except KeyError as exc:
+        raise ValueError(f"Campo obrigatório ausente: {exc.args[0]}") from exc
+    except (TypeError, ValueError) as exc:
+        raise ValueError("'x' e 'y' devem ser números ou listas de números.") from exc
+    if x.size != y.size:
+        raise ValueError(f"'x' e 'y' com tamanhos diferentes ({x.size} e {y.size}).")
+    time_values = None
+    if payload.get("time") is not None:
+        raw_time = payload["time"] if isinstance(payload["time"], list) else [payload["time"]]
+        time_values = time_years(raw_time)
+        if time_values.size != x.size:
+            raise ValueError(f"'time' com {time_values.size} valores para {x.size} pontos.")
+    crs = str(payload.get("crs") or default_crs)
+    check_coordinates(x, y, crs)
+    return PointQuery(
+        request_id=payload.get("id"),
+        x=x,
+        y=y,
+        crs=crs,
+        time_values=time_values,
+        received=time.perf_counter(),
+        future=future,
+    )
+
+
+class ResidentEnricher:
+    """Rasters, séries e legendas abertos uma vez e reutilizados em todas as consultas.
+
+    Não é seguro para threads: o serviço chama :meth:`enrich` sempre da mesma thread.
+    """
+
+    def __init__(
+        self,
+        raster_specs: List[RasterSpec],
+        stack_specs: List[StackSpec],
+        continuous_specs: List[ContinuousSpec],
+        window_radius_m: float,
+    ) -> None:
+        for spec in [*raster_specs, *continuous_specs]:
+            if not spec.raster_path.exists():
+                raise FileNotFoundError(f"Raster não encontrado: {spec.raster_path}")
+        self.window_radius_m = window_radius_m
+        self._files = ExitStack()
+        try:
+            self.rasters = [
+                (
+                    spec,
+                    self._files.enter_context(rasterio.open(spec.raster_path)),
+                    load_legend(spec.legend_csv),
+                )
+                for spec in raster_specs
+            ]
+            self.stacks = [
+                (spec, open_stack(spec, self._files), load_legend(spec.legend_csv)) for spec in stack_specs
+            ]
+            self.continuous = [
+                (spec, self._files.enter_context(rasterio.open(spec.raster_path)))
+                for spec in continuous_specs
+            ]
+        except BaseException:
+            self._files.close()
+            raise
+
+    def enrich(
+        self, x: np.ndarray, y: np.ndarray, crs: str, time_values: np.ndarray | None = None
+    ) -> pd.DataFrame:
+        """Colunas amostradas para todos os pontos de um micro-lote (mesmo CRS).
+
+        Os tipos das colunas de classe são fixos (``stable_dtypes``), então a resposta de
+        uma requisição não depende das outras que entraram no mesmo lote.
+        """
+        cache = RouteSamplingCache(x, y, crs)
+        times = pd.Series(time_values) if time_values is not None else None
+        sampled = [
+            sample_open_raster(cache, dataset, spec, legend, self.window_radius_m, stable_dtypes=True)
+            for spec, dataset, legend in self.rasters
+        ]
+        sampled += [
+            sample_open_stack(cache, stack, spec, legend, self.window_radius_m, times, stable_dtypes=True)
+            for spec, stack, legend in self.stacks
+        ]
+        sampled += [
+            sample_open_continuous(cache, dataset, spec, self.window_radius_m)
+            for spec, dataset in self.continuous
+        ]
+        return pd.concat(sampled, axis=1)
+
+    def close(self) -> None:
+        self._files.close()
+
+
+def frame_to_columns(frame: pd.DataFrame) -> Dict[str, list]:
+    """Colunas como listas JSON: NaN/NA/infinito viram ``None`` e escalares NumPy viram Python."""
+    columns: Dict[str, list] = {}
+    for name, series in frame.items():
+        values = series.astype(object).where(series.notna(), None).tolist()
+        values = [value.item() if isinstance(value, np.generic) else value for value in values]
+        columns[name] = [
+            None if isinstance(value, float) and not math.isfinite(value) else value for value in values
+        ]
+    return columns
+
+
+class MicroBatcher:
+    """Agrupa requisições concorrentes e as responde com uma consulta por CRS.
+
+    A primeira requisição da fila abre uma janela de ``batch_window_ms``; o que chegar
+    até o fim da janela (ou até ``max_batch_points``) entra no mesmo lote. A amostragem
+    roda numa thread dedicada para não bloquear o laço de eventos.
+    """
+
+    def __init__(self, enricher: ResidentEnricher, batch_window_ms: float, max_batch_points: int) -> None:
+        if batch_window_ms < 0:
+            raise ValueError("--batch-window-ms deve ser >= 0.")
+        if max_batch_points < 1:
+            raise ValueError("--max-batch-points deve ser >= 1.")
+        self.enricher = enricher
+        self.batch_window_s = batch_window_ms / 1000.0
+        self.max_batch_points = max_batch_points
+        self.queue: asyncio.Queue[PointQuery] = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="enriquecimento")
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            points = batch[0].x.size
+            deadline = loop.time() + self.batch_window_s
+            while points < self.max_batch_points:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    query = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(query)
+                points += query.x.size
+            while points < self.max_batch_points and not self.queue.empty():
+                query = self.queue.get_nowait()
+                batch.append(query)
+                points += query.x.size
+
+            by_crs: Dict[str, List[PointQuery]] = {}
+            for query in batch:
+                by_crs.setdefault(query.crs, []).append(query)
+            for crs, queries in by_crs.items():
+                await self._answer(loop, crs, queries)
+
+    async def _answer(self, loop: asyncio.AbstractEventLoop, crs: str, queries: List[PointQuery]) -> None:
+        x = np.concatenate([query.x for query in queries])
+        y = np.concatenate([query.y for query in queries])
+        time_values = None
+        if any(query.time_values is not None for query in queries):
+            time_values = np.concatenate(
+                [
+                    query.time_values if query.time_values is not None else np.full(query.x.size, np.nan)
+                    for query in queries
+                ]
+            )
+        try:
+            frame = await loop.run_in_executor(self._executor, self.enricher.enrich, x, y, crs, time_values)
+        except Exception as exc:  # noqa: BLE001 - o erro volta só para a requisição culpada
+            if len(queries) == 1:
+                if not queries[0].future.done():
+                    queries[0].future.set_exception(exc)
+                return
+            # Refaz uma a uma para que apenas a requisição problemática receba o erro.
+            for query in queries:
+                await self._answer(loop, crs, [query])
+            return
+        offsets = np.cumsum([0] + [query.x.size for query in queries])
+        for query, start, stop in zip(queries, offsets[:-1], offsets[1:]):
+            if not query.future.done():
+                query.future.set_result(frame.iloc[start:stop])
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+async def answer_line(line: bytes, params: ServiceParams, batcher: MicroBatcher) -> dict:
+    try:
+        payload = json.loads(line.decode("utf-8"))
+    except UnicodeDecodeError:
+        return {"id": None, "error": "Requisição não é UTF-8 válido."}
+    except json.JSONDecodeError as exc:
+        return {"id": None, "error": f"JSON inválido: {exc.msg}"}
+    if not isinstance(payload, dict):
+        return {"id": None, "error": "A requisição deve ser um objeto JSON."}
+    request_id = payload.get("id")
+    future = asyncio.get_running_loop().create_future()
+    try:
+        query = parse_query(payload, params.route_crs, future)
+        if query.x.size == 0:
+            return {"id": request_id, "n": 0, "latency_ms": 0.0, "columns": {}}
+        await batcher.queue.put(query)
+        frame = await future
+    except Exception as exc:  # noqa: BLE001 - a conexão continua aberta após um erro
+        return {"id": request_id, "error": str(exc)}
+    latency_ms = (time.perf_counter() - query.received) * 1000.0
+    return {
+        "id": request_id,
+        "n": int(query.x.size),
+        "latency_ms": round(latency_ms, 3),
+        "columns": frame_to_columns(frame),
+    }
+
+
+async def handle_client(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, params: ServiceParams, batcher: MicroBatcher
+) -> None:
+    """Atende uma conexão; requisições seguidas podem ser respondidas fora de ordem (ver ``id``).
+
+    Uma linha inválida recebe o próprio erro e a conexão continua; as respostas em
+    andamento são sempre entregues antes de a conexão ser fechada.
+    """
+    pending: set[asyncio.Task] = set()
+
+    async def respond(line: bytes) -> None:
+        response = await answer_line(line, params, batcher)
+        writer.write((json.dumps(response, allow_nan=False) + "\n").encode("utf-8"))
+        await writer.drain()
+
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except (ValueError, asyncio.LimitOverrunError):
+                # Linha maior que MAX_REQUEST_BYTES: o fluxo perde o sincronismo e a conexão é encerrada.
+                message = {"id": None, "error": f"Requisição maior que {MAX_REQUEST_BYTES} bytes."}
+                writer.write((json.dumps(message) + "\n").encode("utf-8"))
+                break
+            if not line:
+                break
+            if not line.strip():
+                continue
+            task = asyncio.create_task(respond(line))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        writer.close()
+
+
+async def serve(params: ServiceParams, enricher: ResidentEnricher) -> None:
+    batcher = MicroBatcher(enricher, params.batch_window_ms, params.max_batch_points)
+    batcher_task = asyncio.create_task(batcher.run())
+
+    async def on_connect(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await handle_client(reader, writer, params, batcher)
+
+    if params.listen.startswith("unix://"):
+        path = Path(params.listen[len("unix://") :])
+        if path.exists() and stat.S_ISSOCK(path.stat().st_mode):
+            path.unlink()
+        server = await asyncio.start_unix_server(on_connect, path=str(path), limit=MAX_REQUEST_BYTES)
+    elif params.listen.startswith("tcp://"):
+        host, _, port = params.listen[len("tcp://") :].rpartition(":")
+        server = await asyncio.start_server(
+            on_connect, host=host or "127.0.0.1", port=int(port), limit=MAX_REQUEST_BYTES
+        )
+    else:
+        raise ValueError(f"--listen deve ser tcp://host:porta ou unix:///caminho: {params.listen}")
+
+    print(f"Serviço de enriquecimento em {params.listen}", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        batcher_task.cancel()
+        batcher.close()
+        if params.listen.startswith("unix://"):
+            Path(params.listen[len("unix://") :]).unlink(missing_ok=True)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Serviço local que mantém os rasters abertos e responde pontos em micro-lotes."
+    )
+    parser.add_argument(
+        "--listen",
+        default="tcp://127.0.0.1:8765",
+        help="Endereço do serviço: tcp://host:porta ou unix:///caminho.",
+    )
+    parser.add_argument(
+        "--route-crs",
+        default="EPSG:4326",
+        help="CRS dos pontos quando a requisição não informa 'crs'.",
+    )
+    add_raster_arguments(parser)
+    parser.add_argument(
+        "--batch-window-ms",
+        type=float,
+        default=2.0,
+        help="Janela para juntar requisições concorrentes num mesmo lote (ms).",
+    )
+    parser.add_argument(
+        "--max-batch-points",
+        type=int,
+        default=200_000,
+        help="Pontos por lote a partir dos quais o lote é processado sem esperar a janela.",
+    )
+    parser.add_argument(
+        "--gdal-cache-mb",
+        type=int,
+        default=None,
+        help="Cache de blocos do GDAL (MB), mantido entre as consultas.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if rasterio is None:
+        raise SystemExit("Dependência ausente: instale 'rasterio' para rodar este script.")
+    if args.window_radius_m < 0:
+        raise SystemExit("--window-radius-m deve ser >= 0.")
+    if not math.isfinite(args.batch_window_ms) or args.batch_window_ms < 0:
+        raise SystemExit("--batch-window-ms deve ser >= 0.")
+    if args.max_batch_points < 1:
+        raise SystemExit("--max-batch-points deve ser >= 1.")
+
+    raster_specs, stack_specs, continuous_specs = raster_specs_from_args(args)
+    params = ServiceParams(
+        listen=args.listen,
+        route_crs=args.route_crs,
+        window_radius_m=args.window_radius_m,
+        batch_window_ms=args.batch_window_ms,
+        max_batch_points=args.max_batch_points,
+    )
+
+    env_options = {"GDAL_CACHEMAX": args.gdal_cache_mb} if args.gdal_cache_mb is not None else {}
+    with rasterio.Env(**env_options):
+        enricher = ResidentEnricher(raster_specs, stack_specs, continuous_specs, args.window_radius_m)
+        try:
+            asyncio.run(serve(params, enricher))
+        except KeyboardInterrupt:
+            print("Serviço encerrado.", flush=True)
+        finally:
+            enricher.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+"""Ingestão de telemetria RTK em tempo real para o protótipo 3D de compactação.
+
+Fluxo:
+- ler fixes (x, y) linha a linha da entrada padrão, de um arquivo em crescimento
+  ou de um socket local (tcp://host:porta, unix:///caminho);
+- reamostrar o trecho desde o último fix com o mesmo passo do modo em lote;
+- somar a pegada das rodas só nas colunas ao alcance das novas estações e
+  recalcular a compactação apenas nessas colunas;
+- publicar, em JSON lines, as células cujo risco ou compactação mudou.
+
+Observação:
+- Durante a operação o máximo global do mapa de carga é desconhecido; a carga é
+  normalizada pelo pico de uma trilha reta de referência, então trechos
+  sobrepostos podem passar de 1 (no lote, tudo é dividido pelo máximo da rota).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import socket
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, TextIO, Tuple
+
+import numpy as np
+import pandas as pd
+
+from prototipo_ponto_unico import MachineParams, contact_pressure_pa, wheel_load_n
+from prototipo_trajeto_3d import (
+    FOOTPRINT_HALO_SIGMAS,
+    SOIL_LAYER_PROFILES_KPA,
+    Domain3DParams,
+    Soil3DParams,
+    Traffic3DParams,
+    depth_band_mask,
+    footprint_sigmas_m,
+    route_load_at_points,
+    run_column_passes,
+    sigma_crit_profile_pa,
+)
+
+# Mesmos limiares de assessLayerRisk() no runtime do protótipo navegável.
+RISK_SAFE_MAX_RATIO = 0.5
+RISK_WARNING_MAX_RATIO = 1.1
+# Saltos maiores que isto entre fixos são falha de GPS: a trilha recomeça no novo fix
+# sem estações no trecho (mesmo limite das pegadas em enriquecer_uso_cobertura.py).
+DEFAULT_MAX_STEP_M = 100.0
+
+
+@dataclass
+class StreamParams:
+    source: str = "-"  # - | arquivo | tcp://host:porta | unix:///caminho
+    follow: bool = False
+    poll_interval_s: float = 0.2
+    x_col: str = "x_m"
+    y_col: str = "y_m"
+    tile_cells: int = 32
+    min_delta: float = 1e-3
+    latency_budget_ms: float = 50.0
+    max_step_m: float = DEFAULT_MAX_STEP_M
+
+
+def risk_class(stress_ratio: float) -> str:
+    if stress_ratio < RISK_SAFE_MAX_RATIO:
+        return "safe"
+    if stress_ratio <= RISK_WARNING_MAX_RATIO:
+        return "warning"
+    return "critical"
+
+
+def reference_load_scale(machine: MachineParams, step_m: float) -> float:
+    """Pico da soma de pegadas sob uma trilha reta amostrada a cada ``step_m``."""
+    sx, _ = footprint_sigmas_m(machine)
+    n_side = int(np.ceil(FOOTPRINT_HALO_SIGMAS * sx / max(step_m, 1e-9))) + 1
+    k = np.arange(-n_side, n_side + 1)
+    return float(np.sum(np.exp(-0.5 * (k * step_m / sx) ** 2)))
+
+
+class StreamingCompactionGrid:
+    """Grade esparsa em tiles, alocados sob demanda, atualizada fix a fix.
+
+    As células ficam num reticulado global (centro em ``ix * dx``, ``iy * dy``), de
+    modo que a extensão da rota não precisa ser conhecida de antemão.
+    """
+
+    def __init__(
+        self,
+        soil: Soil3DParams,
+        machine: MachineParams,
+        domain: Domain3DParams,
+        traffic: Traffic3DParams,
+        wheel_load_kg: float | None = None,
+        tile_cells: int = 32,
+        min_delta: float = 1e-3,
+        max_step_m: float = DEFAULT_MAX_STEP_M,
+    ) -> None:
+        if tile_cells < 1:
+            raise ValueError("--tile-cells deve ser >= 1.")
+        if max_step_m <= 0:
+            raise ValueError("--max-step-m deve ser > 0.")
+        self.soil = soil
+        self.machine = machine
+        self.traffic = traffic
+        self.dx = domain.dx_m
+        self.dy = domain.dy_m
+        self.tile_cells = tile_cells
+        self.min_delta = min_delta
+        self.max_step_m = max_step_m
+
+        self.z = np.arange(domain.dz_m / 2.0, domain.depth_m + 0.5 * domain.dz_m, domain.dz_m)
+        self.sigma_crit_pa, _ = sigma_crit_profile_pa(self.z, soil, domain.depth_m)
+        self.pressure_pa = contact_pressure_pa(machine, wheel_load_n(machine, wheel_load_kg))
+        self.wheels_per_track = max(machine.wheels / 2.0, 1.0)
+        self.load_scale = reference_load_scale(machine, traffic.step_along_route_m)
+        self.top_mask = depth_band_mask(self.z, 0.0, 0.30, include_min=True)
+
+        sx, sy = footprint_sigmas_m(machine)
+        self.halo_x = FOOTPRINT_HALO_SIGMAS * sx
+        self.halo_y = FOOTPRINT_HALO_SIGMAS * sy
+
+        # Razão de tensões máxima na coluna por unidade de carga normalizada.
+        depth_kernel = np.exp(-self.z / max(soil.depth_stress_decay_m, 1e-6))
+        self.stress_ratio_per_load = float(
+            np.max(self.pressure_pa * self.wheels_per_track * depth_kernel / np.maximum(self.sigma_crit_pa, 1e-6))
+        )
+        self.initial_compaction = 0.08 * np.exp(-self.z / 1.3)
+
+        self.tiles: Dict[Tuple[int, int], Dict[str, np.ndarray]] = {}
+        self._last_xy: np.ndarray | None = None
+        self._carry_m = traffic.step_along_route_m
+        self.stations = 0
+        self.gaps = 0
+
+    def _tile(self, tx: int, ty: int) -> Dict[str, np.ndarray]:
+        tile = self.tiles.get((tx, ty))
+        if tile is None:
+            n = self.tile_cells
+            tile = {
+                "load": np.zeros((n, n)),
+                "compaction": np.repeat(self.initial_compaction[:, None, None], n, axis=1).repeat(n, axis=2),
+            }
+            self.tiles[(tx, ty)] = tile
+        return tile
+
+    def _tile_slices(
+        self, ix0: int, iy0: int, nx: int, ny: int
+    ) -> Iterator[Tuple[Dict[str, np.ndarray], tuple, tuple]]:
+        """Percorre os tiles que cobrem a janela global, com fatias (tile, janela) correspondentes."""
+        n = self.tile_cells
+        for ty in range(iy0 // n, (iy0 + ny - 1) // n + 1):
+            r0, r1 = max(iy0, ty * n), min(iy0 + ny, (ty + 1) * n)
+            for tx in range(ix0 // n, (ix0 + nx - 1) // n + 1):
+                c0, c1 = max(ix0, tx * n), min(ix0 + nx, (tx + 1) * n)
+                tile_sl = (slice(r0 - ty * n, r1 - ty * n), slice(c0 - tx * n, c1 - tx * n))
+                window_sl = (slice(r0 - iy0, r1 - iy0), slice(c0 - ix0, c1 - ix0))
+                yield self._tile(tx, ty), tile_sl, window_sl
+
+    def _new_stations(self, xy: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Estações a cada ``step_along_route_m`` desde o último fix e o versor da direção.
+
+        Um salto maior que ``max_step_m`` (falha de GPS) não gera estações: a trilha
+        recomeça no novo fix, como no primeiro fix da operação.
+        """
+        step = self.traffic.step_along_route_m
+        if self._last_xy is None:
+            self._last_xy = xy
+            return np.empty((0, 2)), np.zeros(2)
+
+        seg = xy - self._last_xy
+        length = float(np.hypot(seg[0], seg[1]))
+        if length <= 1e-9:
+            return np.empty((0, 2)), np.zeros(2)
+        if length > self.max_step_m:
+            self.gaps += 1
+            self._last_xy = xy
+            self._carry_m = step
+            return np.empty((0, 2)), np.zeros(2)
+
+        direction = seg / length
+        s = np.arange(step - self._carry_m, length + 1e-9, step)
+        stations = self._last_xy + s[:, None] * direction[None, :]
+        self._carry_m = length - float(s[-1]) if s.size else self._carry_m + length
+        self._last_xy = xy
+        return stations, direction
+
+    def ingest_fix(self, x: float, y: float) -> List[dict]:
+        """Incorpora um fix e devolve as células cujo risco ou compactação 0-30 cm mudou."""
+        stations, direction = self._new_stations(np.array([x, y], dtype=float))
+        if stations.shape[0] == 0:
+            return []
+        self.stations += stations.shape[0]
+
+        offset = 0.5 * self.traffic.track_gauge_m
+        normal = np.array([-direction[1], direction[0]])
+        left = stations + offset * normal
+        right = stations - offset * normal
+        wheels = np.vstack([left, right])
+
+        ix0 = int(np.ceil((wheels[:, 0].min() - self.halo_x) / self.dx))
+        ix1 = int(np.floor((wheels[:, 0].max() + self.halo_x) / self.dx))
+        iy0 = int(np.ceil((wheels[:, 1].min() - self.halo_y) / self.dy))
+        iy1 = int(np.floor((wheels[:, 1].max() + self.halo_y) / self.dy))
+        nx, ny = ix1 - ix0 + 1, iy1 - iy0 + 1
+        if nx <= 0 or ny <= 0:
+            # Pegada menor que a célula e entre centros do reticulado: nada a atualizar.
+            return []
+
+        yy, xx = np.meshgrid((iy0 + np.arange(ny)) * self.dy, (ix0 + np.arange(nx)) * self.dx, indexing="ij")
+        added = route_load_at_points(xx, yy, left, right, self.machine)
+
+        load = np.empty((ny, nx))
+        old_compaction = np.empty((self.z.size, ny, nx))
+        for tile, tile_sl, window_sl in self._tile_slices(ix0, iy0, nx, ny):
+            tile["load"][tile_sl] += added[window_sl]
+            load[window_sl] = tile["load"][tile_sl]
+            old_compaction[(slice(None),) + window_sl] = tile["compaction"][(slice(None),) + tile_sl]
+
+        load_columns = load.reshape(-1) / self.load_scale
+        compaction, _ = run_column_passes(
+            load_columns,
+            np.ones(load_columns.size),
+            self.z,
+            self.sigma_crit_pa,
+            self.pressure_pa,
+            self.wheels_per_track,
+            self.soil,
+            self.traffic.passes,
+            [self.top_mask],
+        )
+        compaction = compaction.reshape(self.z.size, ny, nx)
+        for tile, tile_sl, window_sl in self._tile_slices(ix0, iy0, nx, ny):
+            tile["compaction"][(slice(None),) + tile_sl] = compaction[(slice(None),) + window_sl]
+
+        top_new = compaction[self.top_mask].mean(axis=0)
+        top_old = old_compaction[self.top_mask].mean(axis=0)
+        ratio_new = (load / self.load_scale) * self.stress_ratio_per_load
+        ratio_old = ((load - added) / self.load_scale) * self.stress_ratio_per_load
+
+        updates: List[dict] = []
+        for row, col in zip(*np.nonzero(np.abs(top_new - top_old) > 0.0), strict=True):
+            new_class = risk_class(float(ratio_new[row, col]))
+            changed_class = new_class != risk_class(float(ratio_old[row, col]))
+            if not changed_class and abs(float(top_new[row, col] - top_old[row, col])) < self.min_delta:
+                continue
+            updates.append(
+                {
+                    "x_m": round(float(xx[row, col]), 3),
+                    "y_m": round(float(yy[row, col]), 3),
+                    "compaction_0_30m": round(float(top_new[row, col]), 4),
+                    "stress_ratio": round(float(ratio_new[row, col]), 3),
+                    "risk_class": new_class,
+                }
+            )
+        return updates
+
+    def snapshot(self) -> pd.DataFrame:
+        """Estado atual de todas as células já alocadas."""
+        n = self.tile_cells
+        frames = []
+        for (tx, ty), tile in sorted(self.tiles.items()):
+            touched = tile["load"] > 0.0
+            rows, cols = np.nonzero(touched)
+            load = tile["load"][touched] / self.load_scale
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "x_m": (tx * n + cols) * self.dx,
+                        "y_m": (ty * n + rows) * self.dy,
+                        "load_relative": load,
+                        "compaction_0_30m": tile["compaction"][self.top_mask][:, rows, cols].mean(axis=0),
+                        "max_compaction_index": tile["compaction"][:, rows, cols].max(axis=0),
+                        "stress_ratio": load * self.stress_ratio_per_load,
+                    }
+                )
+            )
+        if not frames:
+            return pd.DataFrame(
+                columns=["x_m", "y_m", "load_relative", "compaction_0_30m", "max_compaction_index", "stress_ratio"]
+            )
+        table = pd.concat(frames, ignore_index=True)
+        table["risk_class"] = [risk_class(float(r)) for r in table["stress_ratio"]]
+        return table
+
+
+def iter_source_lines(source: str, follow: bool = False, poll_interval_s: float = 0.2) -> Iterator[str]:
+    """Linhas da entrada padrão, de um socket local ou de um arquivo (opcionalmente seguido)."""
+    if source == "-":
+        yield from iter(sys.stdin.readline, "")
+        return
+
+    if source.startswith("tcp://") or source.startswith("unix://"):
+        if source.startswith("tcp://"):
+            host, _, port = source[len("tcp://") :].rpartition(":")
+            sock = socket.create_connection((host or "127.0.0.1", int(port)))
+        else:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(source[len("unix://") :])
+        with sock, sock.makefile("r", encoding="utf-8") as stream:
+            yield from iter(stream.readline, "")
+        return
+
+    path = Path(source)
+    if not path.exists():
+        raise FileNotFoundError(f"Fonte de telemetria não encontrada: {path}")
+    with path.open(encoding="utf-8") as stream:
+        pending = ""
+        while True:
+            chunk = stream.readline()
+            if chunk:
+                pending += chunk
+                # Em modo follow, uma linha ainda sem quebra pode estar sendo escrita.
+                if pending.endswith("\n") or not follow:
+                    yield pending
+                    pending = ""
+                continue
+            if not follow:
+                if pending:
+                    yield pending
+                return
+            time.sleep(poll_interval_s)
+
+
+def iter_fixes(lines: Iterator[str], x_col: str, y_col: str) -> Iterator[Tuple[float, float]]:
+    """Converte linhas CSV em fixes (x, y); cabeçalho opcional, senão usa as duas primeiras colunas."""
+    x_idx, y_idx = 0, 1
+    header_seen = False
+    for raw in lines:
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        fields = [field.strip() for field in line.split(",")]
+
+        if not header_seen:
+            header_seen = True
+            try:
+                float(fields[0])
+            except ValueError:
+                x_name = x_col if x_col in fields else ("x" if "x" in fields else None)
+                y_name = y_col if y_col in fields else ("y" if "y" in fields else None)
+                if x_name is None or y_name is None:
+                    raise ValueError(
+                        f"Colunas de fix não encontradas no cabeçalho. Esperado: ({x_col},{y_col}) ou (x,y)."
+                    )
+                x_idx, y_idx = fields.index(x_name), fields.index(y_name)
+                continue
+
+        try:
+            yield float(fields[x_idx]), float(fields[y_idx])
+        except (IndexError, ValueError):
+            print(f"Fix ignorado (linha inválida): {line}", file=sys.stderr)
+
+
+def run_stream(
+    grid: StreamingCompactionGrid,
+    stream: StreamParams,
+    out: TextIO = sys.stdout,
+) -> Dict[str, float]:
+    """Processa os fixes da fonte e publica uma linha JSON por fix; retorna estatísticas de latência."""
+    latencies: List[float] = []
+    lines = iter_source_lines(stream.source, follow=stream.follow, poll_interval_s=stream.poll_interval_s)
+    try:
+        for fix_idx, (x, y) in enumerate(iter_fixes(lines, stream.x_col, stream.y_col), start=1):
+            t0 = time.perf_counter()
+            updates = grid.ingest_fix(x, y)
+            latency_ms = (time.perf_counter() - t0) * 1000.0
+            latencies.append(latency_ms)
+            if latency_ms > stream.latency_budget_ms:
+                print(
+                    f"Aviso: fix {fix_idx} levou {latency_ms:.1f} ms (orçamento {stream.latency_budget_ms:.0f} ms).",
+                    file=sys.stderr,
+                )
+
+            out.write(
+                json.dumps(
+                    {
+                        "fix": fix_idx,
+                        "x_m": x,
+                        "y_m": y,
+                        "latency_ms": round(latency_ms, 2),
+                        "cells": updates,
+                    },
+                    separators=(",", ":"),
+                )
+                + "\n"
+            )
+            out.flush()
+    except KeyboardInterrupt:
+        # Encerramento pelo operador (Ctrl+C) em modo follow/socket.
+        pass
+
+    if not latencies:
+        return {"fixes": 0, "latency_mean_ms": 0.0, "latency_max_ms": 0.0}
+    return {
+        "fixes": len(latencies),
+        "latency_mean_ms": float(np.mean(latencies)),
+        "latency_max_ms": float(np.max(latencies)),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Atualiza a compactação 3D fix a fix a partir de telemetria RTK (JSON lines na saída)."
+    )
+    parser.add_argument(
+        "--source",
+        default="-",
+        help="Fonte dos fixes: '-' (stdin), arquivo CSV, tcp://host:porta ou unix:///caminho.",
+    )
+    parser.add_argument("--follow", action="store_true", help="Segue o arquivo enquanto ele cresce (tail -f).")
+    parser.add_argument("--poll-interval-s", type=float, default=0.2)
+    parser.add_argument("--x-col", default="x_m")
+    parser.add_argument("--y-col", default="y_m")
+    parser.add_argument("--tile-cells", type=int, default=32)
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=1e-3,
+        help="Variação mínima da compactação 0-30 cm para publicar uma célula sem mudança de risco.",
+    )
+    parser.add_argument("--latency-budget-ms", type=float, default=50.0)
+    parser.add_argument(
+        "--max-step-m",
+        type=float,
+        default=DEFAULT_MAX_STEP_M,
+        help="Saltos maiores que isto entre fixos são tratados como falha de GPS (sem estações).",
+    )
+    parser.add_argument("--snapshot-csv", type=Path, default=None, help="CSV com o estado final das células.")
+
+    parser.add_argument("--passes", type=int, default=30)
+    parser.add_argument("--mass-kg", type=float, default=28_000.0)
+    parser.add_argument("--wheels", type=int, default=8)
+    parser.add_argument("--tire-width-m", type=float, default=0.65)
+    parser.add_argument("--contact-length-m", type=float, default=0.45)
+    parser.add_argument("--track-gauge-m", type=float, default=2.2)
+    parser.add_argument("--wheel-load-kg", type=float, default=None)
+
+    parser.add_argument("--depth-m", type=float, default=5.0)
+    parser.add_argument("--dx-m", type=float, default=1.0)
+    parser.add_argument("--dy-m", type=float, default=0.25)
+    parser.add_argument("--dz-m", type=float, default=0.20)
+    parser.add_argument("--step-along-route-m", type=float, default=0.5)
+
+    parser.add_argument("--moisture", type=float, default=0.28)
+    parser.add_argument("--reference-moisture", type=float, default=0.23)
+    parser.add_argument("--compaction-alpha", type=float, default=0.035)
+    parser.add_argument("--stress-exponent", type=float, default=1.2)
+    parser.add_argument("--max-compaction-index", type=float, default=0.95)
+    parser.add_argument("--depth-stress-decay-m", type=float, default=1.05)
+    parser.add_argument(
+        "--soil-profile",
+        choices=["linear", "custom"] + sorted(SOIL_LAYER_PROFILES_KPA.keys()),
+        default="sandy_loam",
+    )
+    parser.add_argument("--sigma-crit-surface-kpa", type=float, default=110.0)
+    parser.add_argument("--sigma-crit-gradient-kpa-m", type=float, default=35.0)
+    parser.add_argument("--sigma-crit-layers", type=str, default="")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    machine = MachineParams(
+        mass_kg=args.mass_kg,
+        wheels=args.wheels,
+        tire_width_m=args.tire_width_m,
+        contact_length_m=args.contact_length_m,
+    )
+    domain = Domain3DParams(depth_m=args.depth_m, dx_m=args.dx_m, dy_m=args.dy_m, dz_m=args.dz_m)
+    traffic = Traffic3DParams(
+        passes=args.passes,
+        track_gauge_m=args.track_gauge_m,
+        step_along_route_m=args.step_along_route_m,
+    )
+    soil = Soil3DParams(
+        moisture=args.moisture,
+        reference_moisture=args.reference_moisture,
+        compaction_alpha=args.compaction_alpha,
+        stress_exponent=args.stress_exponent,
+        max_compaction_index=args.max_compaction_index,
+        depth_stress_decay_m=args.depth_stress_decay_m,
+        sigma_crit_surface_kpa=args.sigma_crit_surface_kpa,
+        sigma_crit_gradient_kpa_m=args.sigma_crit_gradient_kpa_m,
+        soil_profile=args.soil_profile,
+        sigma_crit_layers=args.sigma_crit_layers,
+    )
+    stream = StreamParams(
+        source=args.source,
+        follow=args.follow,
+        poll_interval_s=args.poll_interval_s,
+        x_col=args.x_col,
+        y_col=args.y_col,
+        tile_cells=args.tile_cells,
+        min_delta=args.min_delta,
+        latency_budget_ms=args.latency_budget_ms,
+        max_step_m=args.max_step_m,
+    )
+
+    grid = StreamingCompactionGrid(
+        soil,
+        machine,
+        domain,
+        traffic,
+        wheel_load_kg=args.wheel_load_kg,
+        tile_cells=stream.tile_cells,
+        min_delta=stream.min_delta,
+        max_step_m=stream.max_step_m,
+    )
+    stats = run_stream(grid, stream)
+
+    if args.snapshot_csv is not None:
+        args.snapshot_csv.parent.mkdir(parents=True, exist_ok=True)
+        grid.snapshot().to_csv(args.snapshot_csv, index=False)
+
+    print(
+        f"Telemetria encerrada: fixes={stats['fixes']}, estações={grid.stations}, saltos={grid.gaps}, "
+        f"latência média={stats['latency_mean_ms']:.2f} ms, máxima={stats['latency_max_ms']:.2f} ms",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()